@@ -1,30 +1,80 @@
 # -*- coding: utf-8 -*-
+import time
+
+_IMPORT_STARTED = time.perf_counter() # Startup report: module import time
+
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import functools
+from concurrent.futures import TimeoutError as FuturesTimeout
+import logging
 import shutil
+import uuid
 
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
-from typing import Optional
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 
 from talentscope.io.salary import append_salary_to_csv
-from talentscope.core.parser import CVParser
-from talentscope.io.extractors import extract_resume_text
-from talentscope.skills.skills_loader import load_yaml
-from talentscope.io.minio_client import minio_client
-from talentscope.db.mongo_client import mongo_client
-from talentscope.config import SwaggerConfig, MinioConfig
-from talentscope.db.database import init_db, SessionLocal
-from talentscope.db.models import Job, Candidate
+from talentscope.executors import executors
+from talentscope.health import StartupReport
+from talentscope.ingest import IngestLimitError, ingest_cvs, read_salary_file
+from talentscope.match_queue import MatchCancelled, MatchQueueFull, match_queue
+from talentscope.match_cache import MatchCacheKey, PoolVersion, file_version, match_cache
+from talentscope.pipeline.filters import CandidateFilter
+from talentscope.pipeline.pipeline import ndjson_line
+from talentscope.pipeline.tasks import ScanProgress, parse_cv_file, parse_job_file, run_scan
+from talentscope.io.extractors import extract_file_content_cached, file_sha256
+from talentscope.core.skill_index import load_skill_index
+from talentscope.core.scoring import PreparedJob, prepare_job
+from talentscope.io.minio_client import object_uploader
+from talentscope.db.mongo_client import match_log_writer
+from talentscope.config import SwaggerConfig, MinioConfig, MatchQueueConfig, CacheConfig, StartupConfig, IndexConfig, PoolSourceConfig
+from talentscope.db.file_index import get_file_index
+from talentscope.db.retrieval import retrieve_candidates
 import json
 
-# Init DB Tables on Import (or use startup event)
-init_db()
+logger = logging.getLogger("talentscope.api")
+
+# Postgres, MongoDB and MinIO are connected on first use (SQLAlchemy models are imported
+# inside the DB helpers); the lifespan hook only probes them, see talentscope.health.
+startup_report: Optional[StartupReport] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    probe_task = None
+    if StartupConfig.PROBES == "wait":
+        await startup_report.probe()
+    elif StartupConfig.PROBES != "off":
+        async def _probe_and_log():
+            await startup_report.probe()
+            startup_report.log("startup_probes")
+        probe_task = asyncio.create_task(_probe_and_log())
+
+    startup_report.mark_ready()
+    startup_report.log()
+    try:
+        yield
+    finally:
+        if probe_task is not None and not probe_task.done():
+            probe_task.cancel()
+        match_queue.shutdown()
+        # Pending match logs are written before the process exits
+        await executors.run_io(match_log_writer.shutdown)
+        # Queued object-store uploads finish before exit
+        await executors.run_io(object_uploader.shutdown)
+        executors.shutdown(wait=False)
+
 
 app = FastAPI(
     title=SwaggerConfig.TITLE,
     description=SwaggerConfig.DESCRIPTION,
-    version=SwaggerConfig.VERSION
+    version=SwaggerConfig.VERSION,
+    lifespan=lifespan,
 )
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -32,13 +82,134 @@ DATA_DIR = BASE_DIR / "data"
 JOBS_DIR = BASE_DIR / "jobs"
 CV_DIR = DATA_DIR / "cv_pool"
 SALARIES_CSV = DATA_DIR / "salaries.csv"
+SKILLS_YAML = BASE_DIR / "skills" / "skills.yaml"
 JSON_RESULTS_DIR = CV_DIR / "json_results"
 JSON_JOBS_RESULTS_DIR = JOBS_DIR / "json_results"
+PREPARED_JOBS_DIR = JOBS_DIR / "prepared"
 
 JOBS_DIR.mkdir(parents=True, exist_ok=True)
 CV_DIR.mkdir(parents=True, exist_ok=True, mode=0o755)
 JSON_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 JSON_JOBS_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+PREPARED_JOBS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Pool scanned by /jobs/match: CV_DIR, or the CVs bucket when CV_POOL_SOURCE=s3://cvs
+# (uploads still land in CV_DIR and are copied to the bucket in the background)
+CV_POOL = PoolSourceConfig.URI or str(CV_DIR)
+
+# Versions the CV pool for the match-result cache
+pool_version = PoolVersion(str(CV_DIR))
+# The pool version only sees CV_DIR and this process: an object-store pool also changes
+# through other replicas' uploads, so its match results are not cached
+MATCH_CACHE_ENABLED = CacheConfig.MATCH_ENABLED and CV_POOL == str(CV_DIR)
+# Low threshold to get more candidates initially
+MATCH_MIN_FIT_SCORE = 10.0
+
+# job_filename -> (content sha256, PreparedJob) (in-process), backed by PREPARED_JOBS_DIR on disk
+_prepared_jobs = {}
+
+
+def get_prepared_job(job_path: Path) -> PreparedJob:
+    """
+    Returns the job-side match state for a job file, building it only once per
+    job content and skills.yaml version. Reused by every /jobs/match call for the same job.
+    A job file edited in place (same name) is prepared again.
+    """
+    index = load_skill_index(str(SKILLS_YAML))
+    sha = file_sha256(str(job_path))
+    cached = _prepared_jobs.get(job_path.name)
+    if cached is not None and cached[0] == sha and cached[1].index_key == index.key:
+        return cached[1]
+
+    prepared = None
+    cache_file = PREPARED_JOBS_DIR / (job_path.name + ".json")
+    if cache_file.exists():
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if data.get("content_sha256") == sha:
+                prepared = PreparedJob.from_dict(data, index)
+        except Exception:
+            prepared = None # Stale (other skills.yaml) or corrupt, rebuild below
+
+    if prepared is None:
+        from talentscope.core.normalize import norm
+        prepared = prepare_job(norm(extract_file_content_cached(str(job_path), content_sha256=sha)), index, job_file=job_path.name)
+        try:
+            data = {**prepared.to_dict(), "content_sha256": sha}
+            cache_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"Prepared job cache write failed ({job_path.name}): {e}")
+
+    _prepared_jobs[job_path.name] = (sha, prepared)
+    return prepared
+
+
+def _save_upload(src, destination_path: Path) -> None:
+    with destination_path.open("wb") as buffer:
+        shutil.copyfileobj(src, buffer)
+
+
+def _write_json(json_path: Path, data: dict) -> None:
+    with json_path.open("w", encoding="utf-8") as jf:
+        json.dump(data, jf, indent=2, ensure_ascii=False)
+    get_file_index().add(json_path)
+
+
+def _list_page(directory: Path, suffix: Optional[str], response: Response, limit: Optional[int], cursor: Optional[str], sort: str, order: str) -> list:
+    if limit is None:
+        limit = IndexConfig.LIST_DEFAULT_LIMIT or None
+    try:
+        items, next_cursor = get_file_index().page(directory, suffix, limit=limit, cursor=cursor, sort=sort, order=order)
+    except ValueError as e: # InvalidCursor included
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
+def _save_job_record(safe_filename: str, parsed_data: dict) -> None:
+    from talentscope.db.bulk import bulk_upsert
+    from talentscope.db.models import Job
+
+    # Flattening logic
+    sen = parsed_data.get("seniority", {})
+    elig = parsed_data.get("eligibility", {})
+    work = elig.get("work_model", {})
+    edu = parsed_data.get("education", {})
+
+    job_values = {
+        "file_name": safe_filename,
+        "title": parsed_data.get("job_title"),
+        "job_family": parsed_data.get("job_family"),
+        "job_track": parsed_data.get("job_track"),
+        "seniority_level": sen.get("target_level"),
+        "min_xp": sen.get("min_years_experience"),
+        "education_level": edu.get("degree_level_min"),
+        "military_required": elig.get("military_service", {}).get("required", False),
+        "work_model": work.get("type"),
+        "full_json": parsed_data,
+    }
+    try:
+        # Re-uploading the same file name refreshes the row (ON CONFLICT (file_name) DO UPDATE)
+        status = bulk_upsert(Job, [job_values])[safe_filename]
+        if status.startswith("error"):
+            logger.error(f"DB Insert Error (Job {safe_filename}): {status}")
+    except Exception as e:
+        # Connection error: log but don't fail the request
+        logger.error(f"DB Insert Error (Job {safe_filename}): {e}")
+
+
+def _save_candidate_record(filename: str, parsed_data: dict, est_exp: int, salary_expectation: Optional[str]) -> None:
+    from talentscope.db.candidates import candidate_values, upsert_candidates
+
+    try:
+        skills_key = load_skill_index(str(SKILLS_YAML)).key
+        row = candidate_values(filename, parsed_data, est_exp, salary_expectation, skills_key)
+        status = upsert_candidates([row])[filename]
+        if status.startswith("error"):
+            logger.error(f"DB Insert Error (Candidate {filename}): {status}")
+    except Exception as e:
+        logger.error(f"DB Insert Error (Candidate {filename}): {e}")
 
 
 @app.post("/jobs/upload", summary="Upload a job description file")
@@ -70,60 +241,27 @@ async def upload_job_description(file: UploadFile = File(...)):
     destination_path = JOBS_DIR / safe_filename
 
     try:
-        with destination_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await executors.run_io(_save_upload, file.file, destination_path)
+        await executors.run_io(get_file_index().add, destination_path)
         
-        # MinIO Upload
-        minio_client.upload_file(MinioConfig.BUCKET_JOBS, str(destination_path), safe_filename)
+        # MinIO Upload (background, retried; the request does not wait for it)
+        object_uploader.submit(MinioConfig.BUCKET_JOBS, str(destination_path), safe_filename)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File save error: {str(e)}")
 
-    # Parse JD
-    from talentscope.io.extractors import extract_file_content
-    from talentscope.core.job_parser import JobParser as JobParserImpl # Alias to avoid confusion if any
-    
+    # Parse JD (process pool, keeps the event loop free)
     try:
-        raw_text = extract_file_content(str(destination_path))
-        parser = JobParserImpl(raw_text, filename=safe_filename)
-        parsed_data = parser.parse()
+        parsed_data = await executors.run_cpu(parse_job_file, str(destination_path), safe_filename)
         
         # Save JSON
         json_filename = Path(safe_filename).stem + ".json"
         json_path = JSON_JOBS_RESULTS_DIR / json_filename
         
-        with json_path.open("w", encoding="utf-8") as jf:
-            json.dump(parsed_data, jf, indent=2, ensure_ascii=False)
+        await executors.run_io(_write_json, json_path, parsed_data)
             
         # DB Save (Job)
-        try:
-            db = SessionLocal()
-            # Flattening logic
-            sen = parsed_data.get("seniority", {})
-            elig = parsed_data.get("eligibility", {})
-            work = elig.get("work_model", {})
-            edu = parsed_data.get("education", {})
-            
-            job_obj = Job(
-                file_name=safe_filename,
-                title=parsed_data.get("job_title"),
-                job_family=parsed_data.get("job_family"),
-                job_track=parsed_data.get("job_track"),
-                seniority_level=sen.get("target_level"),
-                min_xp=sen.get("min_years_experience"),
-                education_level=edu.get("degree_level_min"),
-                military_required=elig.get("military_service", {}).get("required", False),
-                work_model=work.get("type"),
-                full_json=parsed_data
-            )
-            db.add(job_obj)
-            db.commit()
-            db.refresh(job_obj)
-            db.close()
-        except Exception as e:
-            # Check if duplicate error (unique filename) or connection error
-            # Log but don't fail the request completely?
-            print(f"DB Insert Error (Job): {e}")
+        await executors.run_io(_save_job_record, safe_filename, parsed_data)
 
         return {
             "status": "success",
@@ -168,152 +306,145 @@ async def upload_cv(
         
     # 1. Save CV file
     destination_path = CV_DIR / filename
+    pool_before = pool_version.current()
+    is_new_file = not destination_path.exists()
     
     try:
-        with destination_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await executors.run_io(_save_upload, file.file, destination_path)
             
-        # MinIO Upload
-        minio_client.upload_file(MinioConfig.BUCKET_CVS, str(destination_path), filename)
+        # MinIO Upload (background, retried; the request does not wait for it)
+        upload = object_uploader.submit(MinioConfig.BUCKET_CVS, str(destination_path), filename)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File save error: {str(e)}")
         
-    # 2. Handle Salary
-    if salary_expectation:
-        try:
-            append_salary_to_csv(SALARIES_CSV, filename, salary_expectation)
-        except Exception as e:
-             raise HTTPException(status_code=500, detail=f"Salary save error: {str(e)}")
-
-    # 3. Parse and Extract Data
     try:
-        raw_text = extract_resume_text(str(destination_path))
-        
-        # Base Parsing
-        parser = CVParser(raw_text)
-        parsed_data = parser.parse()
-        
-        # Skill Extraction
-        skills_path = Path("talentscope/skills/skills.yaml")
-        if skills_path.exists():
-            cfg = load_yaml(str(skills_path))
-            from talentscope.core.normalize import norm
-            norm_text = norm(raw_text)
-            
-            from talentscope.core.matcher import compile_patterns, score_text
-            found_skills = set()
-            
-            domains = cfg.get("domains") or {}
-            for dk, dv in domains.items():
-                items = dv.get("items") or []
-                if not items: continue
-                
-                pat = compile_patterns(items)
-                matched_scores, _ = score_text(norm_text, items, pat) # score_text returns (score, matched_list)
-                if matched_scores > 0: # Check if any skills matched
-                    for term in items:
-                        # This check is a bit simplistic, ideally use the matched_list from score_text
-                        # For now, adhering to the provided snippet's logic
-                        if term.lower() in norm_text:
-                            found_skills.add(term)
-                            
-            parsed_data["skills"] = list(found_skills)
-            
-        # Experience Estimation
-        from talentscope.core.experience import estimate_experience_years
-        est_exp = estimate_experience_years(raw_text)
-        parsed_data["estimated_experience"] = est_exp
+        # 2. Handle Salary
+        if salary_expectation:
+            try:
+                await executors.run_io(append_salary_to_csv, SALARIES_CSV, filename, salary_expectation)
+            except Exception as e:
+                 raise HTTPException(status_code=500, detail=f"Salary save error: {str(e)}")
+
+        # 3. Parse and Extract Data
+        try:
+            # Extraction, CVParser, skill scan and experience estimate in one go (process pool);
+            # stored in the feature store so later matches over this CV skip them.
+            parsed_data = await executors.run_cpu(parse_cv_file, str(destination_path), str(SKILLS_YAML))
+            est_exp = parsed_data.get("estimated_experience", 0)
         
-        # Inject Salary
-        parsed_data["salary"] = salary_expectation
+            # Inject Salary
+            parsed_data["salary"] = salary_expectation
 
         
-        # Save JSON Result
-        json_filename = path_obj.stem + ".json"
-        json_path = JSON_RESULTS_DIR / json_filename
+            # Save JSON Result
+            json_filename = path_obj.stem + ".json"
+            json_path = JSON_RESULTS_DIR / json_filename
         
-        with json_path.open("w", encoding="utf-8") as jf:
-            json.dump(parsed_data, jf, indent=2, ensure_ascii=False)
-            
-        # DB Save (Candidate)
-        try:
-            db = SessionLocal()
-            # Flattening Logic
-            p_data = parsed_data # Use parsed_data directly
-            
-            contact = p_data.get("contact", {})
-            edu_list = p_data.get("education", [])
-            last_school = edu_list[0].get("school") if edu_list else None
-            last_degree = edu_list[0].get("degree") if edu_list else None
+            await executors.run_io(_write_json, json_path, parsed_data)
             
-            exp_list = p_data.get("experience", [])
-            curr_title = exp_list[0].get("title") if exp_list else None
-            curr_company = exp_list[0].get("company") if exp_list else None
-            
-            # Skills Array
-            skill_list = parsed_data.get("skills", [])
-            
-            cand_obj = Candidate(
-                file_name=filename,
-                name=contact.get("name"),
-                email=contact.get("email"),
-                phone=contact.get("phone"),
-                location=None, # Parser might not extract location yet
-                school=last_school,
-                degree=last_degree,
-                current_title=curr_title,
-                current_company=curr_company,
-                total_experience_years=est_exp,
-                salary_expectation=salary_expectation,
-                skills=skill_list,
-                full_json=parsed_data
-            )
-            db.add(cand_obj)
-            db.commit()
-            db.close()
+            # DB Save (Candidate)
+            await executors.run_io(_save_candidate_record, filename, parsed_data, est_exp, salary_expectation)
+
+            return {
+                "status": "success",
+                "message": "CV uploaded and processed successfully",
+                "results_saved_to": str(json_path),
+                "data": parsed_data
+            }
+
         except Exception as e:
-            print(f"DB Insert Error (Candidate): {e}")
+             # Even if parsing fails, upload was successful
+             # But usually we want to know parsing failed
+             return {
+                 "status": "partial_success",
+                 "message": f"CV uploaded but parsing failed: {str(e)}",
+                 "filename": filename
+             }
+    finally:
+        # The pool changed: drop (or carry over) cached match results. An object-store pool
+        # only has the CV once the background upload is done, its version moves then.
+        if CV_POOL == str(CV_DIR):
+            await executors.run_io(_refresh_match_cache, pool_before, destination_path, is_new_file)
+        else:
+            upload.add_done_callback(lambda _: pool_version.bump())
+
+
+@app.post("/cv/upload/bulk", summary="Upload many CVs (files and/or ZIP archives) in one request")
+async def upload_cv_bulk(
+    files: List[UploadFile] = File(..., description="CV files (.pdf, .docx) and/or .zip archives of them"),
+    salaries: Optional[UploadFile] = File(None, description="Optional CSV: filename,salary_tl (or salary_min_tl,salary_max_tl)"),
+):
+    """
+    Bulk version of /cv/upload for onboarding many CVs at once.
+    - ZIP archives are expanded (directories inside are flattened, other file types skipped).
+    - Files are parsed in parallel on the CPU executor, MinIO uploads run concurrently,
+      salaries are appended to 'salaries.csv' in one write and candidates are inserted
+      into Postgres in one batch.
+    - Returns a summary with a status per file (success, partial_success, failed, skipped).
+    """
+    if not files:
+        raise HTTPException(status_code=400, detail="No files uploaded")
 
-        return {
-            "status": "success",
-            "message": "CV uploaded and processed successfully",
-            "results_saved_to": str(json_path),
-            "data": parsed_data
-        }
+    salary_inputs = {}
+    if salaries is not None and salaries.filename:
+        try:
+            salary_inputs = read_salary_file(await salaries.read())
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Salary CSV read error: {str(e)}")
 
-    except Exception as e:
-         # Even if parsing fails, upload was successful
-         # But usually we want to know parsing failed
-         return {
-             "status": "partial_success",
-             "message": f"CV uploaded but parsing failed: {str(e)}",
-             "filename": filename
-         }
+    pool_before = pool_version.current()
+    result = None
+    try:
+        result = await executors.run_io(
+            ingest_cvs,
+            [(f.filename or "", f.file) for f in files],
+            cv_dir=str(CV_DIR),
+            skills_yaml=str(SKILLS_YAML),
+            salaries_csv=str(SALARIES_CSV),
+            salary_inputs=salary_inputs,
+            json_dir=str(JSON_RESULTS_DIR),
+            store_db=True,
+            bucket=MinioConfig.BUCKET_CVS,
+            cpu_pool=executors.cpu_pool,
+            workers=executors.cpu_workers,
+        )
+    except IngestLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    finally:
+        # Refresh even after a partial batch: files may already be in the pool
+        # (ingest_cvs returns once its object-store uploads are done)
+        changes = [(Path(it.path), it.is_new) for it in result["items"] if it.stored] if result else None
+        if changes is None:
+            await executors.run_io(match_cache.clear)
+            pool_version.bump()
+        else:
+            await executors.run_io(_refresh_match_cache_many, pool_before, changes)
+
+    summary = result["summary"]
+    counts = summary["counts"]
+    return {
+        "status": "success" if counts.get("success", 0) == summary["total_files"] else "partial_success",
+        "message": f"{counts.get('success', 0)} of {summary['total_files']} files processed successfully",
+        **summary,
+    }
 
 
 @app.get("/jobs", summary="List all uploaded job descriptions")
-async def list_jobs():
+async def list_jobs(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=IndexConfig.LIST_MAX_LIMIT, description="Page size (default: LIST_DEFAULT_LIMIT, 0 = every file)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    sort: str = Query("created_at", description="created_at or filename"),
+    order: str = Query("desc", description="asc or desc"),
+):
     """
     Lists all job description files available in the 'jobs' directory.
+    Sorted by `sort` / `order`. Every file is returned unless `limit` (or LIST_DEFAULT_LIMIT) is set;
+    when more items exist the response carries an `X-Next-Cursor` header, pass it back as `cursor`
+    for the next page.
     """
-    if not JOBS_DIR.exists():
-        return []
-
-    files = []
-    for f in JOBS_DIR.iterdir():
-        if f.is_file() and f.name != ".gitkeep":
-            stat = f.stat()
-            files.append({
-                "filename": f.name,
-                "size_bytes": stat.st_size,
-                "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "path": str(f)
-            })
-    
-    # Sort by creation time descending (newest first)
-    files.sort(key=lambda x: x["created_at"], reverse=True)
-    return files
+    return await executors.run_io(_list_page, JOBS_DIR, None, response, limit, cursor, sort, order)
 
 
 from pydantic import BaseModel
@@ -325,77 +456,151 @@ class JobMatchRequest(BaseModel):
     max_experience: Optional[int] = None
     min_salary: Optional[float] = None
     max_salary: Optional[float] = None
-    
-@app.post("/jobs/match", summary="Find best candidates for a job with filters")
-async def match_candidates(req: JobMatchRequest):
+    # True: queue the run and return a run_id right away (poll GET /jobs/match/{run_id})
+    run_async: bool = False
+    # True: include per-stage scan timings ("profile") in the response; bypasses the result cache
+    profile: bool = False
+    # True: NDJSON stream (application/x-ndjson): job header, progress, one line per candidate, summary
+    stream: bool = False
+
+
+def _match_filters(req: JobMatchRequest) -> tuple:
+    return (req.min_experience, req.max_experience, req.min_salary, req.max_salary)
+
+
+def _candidate_filter(req: JobMatchRequest) -> CandidateFilter:
+    return CandidateFilter(
+        min_experience=req.min_experience,
+        max_experience=req.max_experience,
+        min_salary=req.min_salary,
+        max_salary=req.max_salary,
+    )
+
+
+def _match_run_key(req: JobMatchRequest) -> str:
+    # Identical requests share one queued/running run.
+    return json.dumps([req.job_filename, *_match_filters(req), req.profile])
+
+
+def _match_cache_lookup(req: JobMatchRequest, job_path: Path):
     """
-    Finds the best matching CVs for a specific job description.
-    Supports filtering by experience years and salary expectations.
-    
-    If no candidates match the strict filters, it returns the best candidates based on Job Fit Score (Fallback).
+    Returns (key, cached response or None). The key pins the job content, the pool version
+    (read before scanning, so a concurrent upload makes the entry stale), skills.yaml, the filters
+    and the salaries CSV (mtime + size, it may be edited outside the API).
     """
-    job_path = JOBS_DIR / req.job_filename
-    if not job_path.exists():
-        raise HTTPException(status_code=404, detail="Job file not found")
-        
-    skills_path = Path("talentscope/skills/skills.yaml") # Default location
-    
-    # Run the pipeline
-    from talentscope.pipeline.pipeline import scan_pool
-    
+    if not MATCH_CACHE_ENABLED or req.profile:
+        return None, None
+    key = MatchCacheKey(
+        job_sha256=file_sha256(str(job_path)),
+        pool_version=pool_version.current(),
+        taxonomy_key=load_skill_index(str(SKILLS_YAML)).key,
+        filters=_match_filters(req),
+        salaries_version=file_version(str(SALARIES_CSV)),
+    )
+    return key, match_cache.get(key)
+
+
+def _match_cache_store(key, job_path: Path, result: dict) -> None:
+    if key is not None:
+        match_cache.put(key, result, meta={"job_path": str(job_path), "taxonomy_key": key.taxonomy_key})
+
+
+def _refresh_match_cache(pool_before: str, cv_path: Path, is_new_file: bool) -> None:
+    _refresh_match_cache_many(pool_before, [(cv_path, is_new_file)])
+
+
+def _refresh_match_cache_many(pool_before: str, changes: list) -> None:
+    """
+    After CV uploads, changes = [(cv_path, is_new_file), ...]: moves the cached matches
+    the new CVs cannot change to the new pool version and drops the rest. A new CV leaves
+    a job's result untouched when it falls below the fit threshold and does not share a
+    candidate_id stem with another CV.
+    """
+    from talentscope.io.pool_source import open_pool_source
+    from talentscope.pipeline.pipeline import _safe_stem, qualifies_for_job
+
+    new_version = pool_version.bump()
+    if not MATCH_CACHE_ENABLED or not changes:
+        return
+
     try:
-        # Scan all candidates first
-        scan_result = scan_pool(
-            cv_dir=str(CV_DIR),
-            skills_yaml=str(skills_path),
-            job_file=str(job_path),
-            salaries_csv=str(SALARIES_CSV),
-            min_fit_score=10.0, # Low threshold to get more candidates initially
-            top_n=1000 
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Engine error: {str(e)}")
-        
-    all_candidates = scan_result.get("results", {}).get("salary_known_topN", []) + \
-                     scan_result.get("results", {}).get("salary_unknown_topN", [])
-                     
-    filtered = []
-    
-    # Apply Filters
-    for cand in all_candidates:
-        valid = True
-        
-        # Experience Filter
-        exp = cand.get("estimated_experience", 0)
-        if req.min_experience is not None and exp < req.min_experience:
-            valid = False
-        if req.max_experience is not None and exp > req.max_experience:
-            valid = False
-            
-        # Salary Filter
-        # If candidate has no salary info, skip if strict salary filter is applied?
-        # Or treat unknown as valid? Let's say valid if not strict, but here user asks for specific range.
-        # Logic: If user sets limits, unknown salary is usually excluded or included?
-        # Let's exclude unknown if filters are set.
-        sal_mid = cand.get("salary_mid_tl")
-        
-        if (req.min_salary is not None or req.max_salary is not None):
-            if sal_mid is None:
-                valid = False
-            else:
-                if req.min_salary is not None and sal_mid < req.min_salary:
-                    valid = False
-                if req.max_salary is not None and sal_mid > req.max_salary:
-                    valid = False
-                    
-        if valid:
-            filtered.append(cand)
-            
-    is_fallback = False
-    if not filtered:
-        # Fallback: Return top candidates without filters
-        filtered = all_candidates
-        is_fallback = True
+        # The new CVs may not be in an object-store pool yet (uploads run in the background)
+        pool_names = {Path(f).name for f in open_pool_source(CV_POOL).list_files()}
+        pool_names.update(p.name for p, _ in changes)
+        stem_counts = {}
+        for name in pool_names:
+            stem = _safe_stem(name)
+            stem_counts[stem] = stem_counts.get(stem, 0) + 1
+        stem_clash = any(stem_counts.get(_safe_stem(p.name), 0) > 1 for p, _ in changes)
+        all_new = all(is_new for _, is_new in changes)
+        index = load_skill_index(str(SKILLS_YAML))
+
+        def unaffected(meta: dict) -> bool:
+            if not all_new or stem_clash or meta.get("taxonomy_key") != index.key:
+                return False
+            prepared = get_prepared_job(Path(meta["job_path"]))
+            return not any(
+                qualifies_for_job(str(p), index, prepared, MATCH_MIN_FIT_SCORE) for p, _ in changes
+            )
+
+        match_cache.repool(pool_before, new_version, unaffected)
+    except Exception:
+        match_cache.clear()
+        logger.exception("Match cache refresh error")
+
+
+def _scan_job(job_path: Path, run, filters: Optional[CandidateFilter] = None, profile: bool = False) -> dict:
+    """
+    Queued variant of the scan in _match_sync: run_scan goes to the CPU executor (spawn
+    process pool, off the API process) and the queue thread mirrors the worker's progress
+    on the MatchRun. Cancelling the run stops the worker at its next progress report.
+    """
+    prepared_job = get_prepared_job(job_path)
+    filters = filters if filters is not None else CandidateFilter()
+    state = executors.shared_dict(scanned=0, total=0, cancel=False)
+    future = executors.submit_cpu(
+        run_scan,
+        cv_dir=CV_POOL,
+        skills_yaml=str(SKILLS_YAML),
+        job_file=str(job_path),
+        salaries_csv=str(SALARIES_CSV),
+        min_fit_score=MATCH_MIN_FIT_SCORE,
+        top_n=1000,
+        prepared_job_data=prepared_job.to_dict(),
+        workers=MatchQueueConfig.SCAN_WORKERS,
+        filters=filters.to_dict(),
+        profile=profile,
+        retrieval=retrieve_candidates(prepared_job, filters, MATCH_MIN_FIT_SCORE),
+        progress=ScanProgress(state),
+    )
+    while True:
+        try:
+            result = future.result(timeout=0.2)
+        except FuturesTimeout:
+            pass
+        else:
+            # Final counts (the run may finish between two polls)
+            run.scanned, run.total = state.get("scanned", 0), state.get("total", 0)
+            return result
+        try:
+            run.progress(state.get("scanned", 0), state.get("total", 0))
+        except MatchCancelled:
+            # The worker raises MatchCancelled at its next report, future.result() re-raises it
+            state["cancel"] = True
+
+
+def _select_candidates(req: JobMatchRequest, scan_result: dict) -> dict:
+    """
+    Applies the HR diversity selection to a (filtered) scan_pool result.
+    Returns the /jobs/match response body.
+    """
+    results = scan_result.get("results", {})
+    all_candidates = results.get("salary_known_topN", []) + results.get("salary_unknown_topN", [])
+
+    # Experience / salary filters are applied inside scan_pool, before HR scoring.
+    # If no candidates match them, it returns the unfiltered best candidates (Fallback).
+    filtered = all_candidates
+    is_fallback = bool(results.get("fallback")) or not all_candidates
         
     # Sort Logic:
     # 1. HR Score (Desc)
@@ -463,60 +668,254 @@ async def match_candidates(req: JobMatchRequest):
         final_selection.sort(key=sort_key)
 
     top_10 = final_selection
-    
-    # MongoDB Insert (Top 10 Matches)
+
+    response = {
+        "status": "success",
+        "fallback_triggered": is_fallback,
+        "match_count": len(filtered),
+        "hr_diversity_applied": len(filtered) > 10,
+        "candidates": top_10
+    }
+    if "profile" in scan_result:
+        response["profile"] = scan_result["profile"]
+    return response
+
+
+def _store_matches(job_filename: str, result: dict, run_id: Optional[str] = None) -> None:
+    # MongoDB match log (Top 10 Matches): compact documents (ids + scores + run reference),
+    # queued for the background writer so the request never waits for MongoDB.
+    # The full candidate details stay in the match response / result cache.
     try:
+        run_id = run_id or uuid.uuid4().hex
+        now = datetime.now()
         match_docs = []
-        for idx, cand in enumerate(top_10):
-            match_doc = {
-                "job_id": req.job_filename,
-                "candidate_id": cand.get("candidate_id") or cand.get("file_name"), # Fallback if key differs
+        for idx, cand in enumerate(result["candidates"]):
+            match_docs.append({
+                "job_id": job_filename,
+                "run_id": run_id,
+                "candidate_id": cand.get("candidate_id") or cand.get("candidate_file"), # Fallback if key differs
+                "candidate_file": cand.get("candidate_file"),
                 "rank": idx + 1,
                 "match_score": cand.get("job_fit_score"),
+                "job_match_percent": cand.get("job_match_percent"),
                 "hr_score": cand.get("hr_score"),
                 "estimated_experience": cand.get("estimated_experience"),
-                "salary_expectation": cand.get("salary"),
-                "timestamp": datetime.now(),
-                "details": cand # Include full candidate match details
-            }
-            match_docs.append(match_doc)
-            
-        mongo_client.insert_match_results(match_docs)
+                "salary_mid_tl": cand.get("salary_mid_tl"),
+                "fallback": result.get("fallback_triggered", False),
+                "timestamp": now,
+            })
+
+        match_log_writer.submit(match_docs)
     except Exception as e:
         # Just log locally, don't interrupt response
         print(f"Mongo Match Insert Error: {e}")
 
+
+async def _match_sync(req: JobMatchRequest, job_path: Path) -> dict:
+    # Same job content, pool version, taxonomy and filters: served from the result cache
+    cache_key, cached = await executors.run_io(_match_cache_lookup, req, job_path)
+    if cached is not None:
+        return cached
+
+    # Run the pipeline (process pool; other requests keep being served meanwhile)
+    try:
+        scan_result = await _run_request_scan(req, job_path)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Engine error: {str(e)}")
+
+    result = _select_candidates(req, scan_result)
+    _store_matches(req.job_filename, result)
+    _match_cache_store(cache_key, job_path, result)
+    return result
+
+
+async def _run_request_scan(req: JobMatchRequest, job_path: Path, progress: Optional[ScanProgress] = None) -> dict:
+    # Scan all candidates first
+    prepared_job = await executors.run_io(get_prepared_job, job_path)
+    filters = _candidate_filter(req)
+    # Candidates sharing a job skill (Postgres, GIN index); None = score the whole pool
+    retrieval = await executors.run_io(retrieve_candidates, prepared_job, filters, MATCH_MIN_FIT_SCORE)
+    return await executors.run_cpu(
+        run_scan,
+        cv_dir=CV_POOL,
+        skills_yaml=str(SKILLS_YAML),
+        job_file=str(job_path),
+        salaries_csv=str(SALARIES_CSV),
+        min_fit_score=MATCH_MIN_FIT_SCORE,
+        top_n=1000,
+        prepared_job_data=prepared_job.to_dict(),
+        filters=filters.to_dict(),
+        profile=req.profile,
+        retrieval=retrieval,
+        progress=progress,
+    )
+
+
+async def _match_stream(req: JobMatchRequest, job_path: Path):
+    """
+    NDJSON lines of a /jobs/match response. The job header goes out before the scan
+    starts and "progress" lines (scanned / total CVs) while it runs. The shortlist is
+    picked from the whole ranked pool (HR diversity selection), so the candidate lines
+    follow once the scan is done, in display order, then a summary line
+    (status, fallback_triggered, match_count, hr_diversity_applied, profile).
+    A client that disconnects stops the scan. Errors after the header are reported as
+    a {"type": "error"} line.
+    """
+    scan = None
+    state = None
+    try:
+        prepared_job = await executors.run_io(get_prepared_job, job_path)
+        header = {
+            "job_filename": req.job_filename,
+            "domains_detected": [{"domain": d, "label": prepared_job.label(d)} for d in prepared_job.domains],
+            "minimum_threshold_job_fit_score": MATCH_MIN_FIT_SCORE,
+        }
+        filters = _candidate_filter(req)
+        if filters.active:
+            header["filters"] = filters.to_dict()
+        yield ndjson_line({"type": "job", **header})
+
+        cache_key, result = await executors.run_io(_match_cache_lookup, req, job_path)
+        if result is None:
+            state = executors.shared_dict(scanned=0, total=0, cancel=False)
+            scan = asyncio.ensure_future(_run_request_scan(req, job_path, ScanProgress(state, interval=0.5)))
+            reported = None
+            while True:
+                done, _ = await asyncio.wait({scan}, timeout=0.5)
+                if done:
+                    break
+                counts = (state.get("scanned", 0), state.get("total", 0))
+                if counts != reported and counts[1]:
+                    reported = counts
+                    yield ndjson_line({"type": "progress", "scanned_cvs": counts[0], "total_cvs": counts[1]})
+            result = _select_candidates(req, scan.result())
+            _store_matches(req.job_filename, result)
+            _match_cache_store(cache_key, job_path, result)
+    except HTTPException as e:
+        yield ndjson_line({"type": "error", "detail": e.detail})
+        return
+    except Exception as e:
+        yield ndjson_line({"type": "error", "detail": f"Engine error: {str(e)}"})
+        return
+    finally:
+        if scan is not None and not scan.done():
+            # Client went away: the worker stops at its next progress report
+            state["cancel"] = True
+            scan.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    candidates = result["candidates"]
+    for cand in candidates:
+        yield ndjson_line({"type": "candidate", **cand})
+    summary = {k: v for k, v in result.items() if k != "candidates"}
+    yield ndjson_line({"type": "summary", **summary, "candidate_count": len(candidates)})
+
+
+def _run_match_job(req: JobMatchRequest, run) -> dict:
+    job_path = JOBS_DIR / req.job_filename
+    cache_key, cached = _match_cache_lookup(req, job_path)
+    if cached is not None:
+        return cached
+    scan_result = _scan_job(job_path, run, filters=_candidate_filter(req), profile=req.profile)
+    response = _select_candidates(req, scan_result)
+    _store_matches(req.job_filename, response, run.run_id)
+    _match_cache_store(cache_key, job_path, response)
+    return response
+
+
+@app.post("/jobs/match", summary="Find best candidates for a job with filters")
+async def match_candidates(req: JobMatchRequest, response: Response):
+    """
+    Finds the best matching CVs for a specific job description.
+    Supports filtering by experience years and salary expectations.
+    
+    If no candidates match the strict filters, it returns the best candidates based on Job Fit Score (Fallback).
+
+    With run_async=true the match is queued and a run_id is returned immediately (HTTP 202);
+    progress and the final shortlist are served by GET /jobs/match/{run_id}.
+
+    With stream=true the response is NDJSON: a job header line right away, progress lines
+    while the pool is scanned, then one line per candidate once the scan is done, then a
+    summary line.
+    """
+    job_path = JOBS_DIR / req.job_filename
+    if not job_path.exists():
+        raise HTTPException(status_code=404, detail="Job file not found")
+
+    if req.run_async and req.stream:
+        raise HTTPException(status_code=400, detail="run_async and stream cannot be combined")
+
+    if req.run_async:
+        try:
+            run = match_queue.submit(_match_run_key(req), functools.partial(_run_match_job, req))
+        except MatchQueueFull as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        response.status_code = 202
+        return run.to_dict()
+        
+    if req.stream:
+        return StreamingResponse(_match_stream(req, job_path), media_type="application/x-ndjson")
+
+    return await _match_sync(req, job_path)
+
+
+@app.get("/jobs/match/{run_id}", summary="Progress and result of a queued match run")
+async def get_match_run(run_id: str):
+    run = match_queue.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Match run not found")
+    return run.to_dict()
+
+
+@app.delete("/jobs/match/{run_id}", summary="Cancel a queued or running match run")
+async def cancel_match_run(run_id: str):
+    run = match_queue.cancel(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Match run not found")
+    return run.to_dict()
+
+
+@app.get("/cache/stats", summary="Match-result cache counters")
+async def cache_stats():
     return {
-        "status": "success",
-        "fallback_triggered": is_fallback,
-        "match_count": len(filtered),
-        "hr_diversity_applied": len(filtered) > 10,
-        "candidates": top_10
+        "enabled": MATCH_CACHE_ENABLED,
+        "pool_version": pool_version.current(),
+        "match_results": match_cache.stats(),
+    }
+
+
+@app.get("/health", summary="Service reachability and startup-time report")
+async def health(probe: bool = False):
+    """
+    Returns the startup report (import / ready times, last probe results).
+    With probe=true, Postgres, MongoDB and MinIO are probed again now.
+    The API itself is up whenever this answers; "degraded" means a backing service is not reachable.
+    """
+    services = await startup_report.probe() if probe else startup_report.probes
+    degraded = any(not r.get("ok") for r in services.values())
+    return {
+        "status": "degraded" if degraded else "ok",
+        "services": services,
+        "startup": startup_report.to_dict(),
+        "match_log": match_log_writer.stats(),
+        "object_uploads": object_uploader.stats(),
     }
 
 
 @app.get("/cv/results", summary="List all parsed CV JSON results")
-async def list_cv_results():
+async def list_cv_results(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=IndexConfig.LIST_MAX_LIMIT, description="Page size (default: LIST_DEFAULT_LIMIT, 0 = every file)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    sort: str = Query("created_at", description="created_at or filename"),
+    order: str = Query("desc", description="asc or desc"),
+):
     """
     Lists all parsed CV data (JSON files) available in 'cv_pool/json_results'.
+    Sorted by `sort` / `order`. Every file is returned unless `limit` (or LIST_DEFAULT_LIMIT) is set;
+    when more items exist the response carries an `X-Next-Cursor` header, pass it back as `cursor`
+    for the next page.
     """
-    if not JSON_RESULTS_DIR.exists():
-        return []
-
-    files = []
-    for f in JSON_RESULTS_DIR.iterdir():
-        if f.is_file() and f.suffix.lower() == ".json":
-            stat = f.stat()
-            files.append({
-                "filename": f.name,
-                "size_bytes": stat.st_size,
-                "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "path": str(f)
-            })
-    
-    # Sort by creation time descending
-    files.sort(key=lambda x: x["created_at"], reverse=True)
-    return files
+    return await executors.run_io(_list_page, JSON_RESULTS_DIR, ".json", response, limit, cursor, sort, order)
 
 
 @app.get("/cv/results/{filename}", summary="Get parsed data for a specific CV")
@@ -543,27 +942,20 @@ async def get_cv_result(filename: str):
 
 
 @app.get("/jobs/results", summary="List all parsed Job JSON results")
-async def list_job_results():
+async def list_job_results(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=IndexConfig.LIST_MAX_LIMIT, description="Page size (default: LIST_DEFAULT_LIMIT, 0 = every file)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    sort: str = Query("created_at", description="created_at or filename"),
+    order: str = Query("desc", description="asc or desc"),
+):
     """
     Lists all parsed Job Description data (JSON files) available in 'jobs/json_results'.
+    Sorted by `sort` / `order`. Every file is returned unless `limit` (or LIST_DEFAULT_LIMIT) is set;
+    when more items exist the response carries an `X-Next-Cursor` header, pass it back as `cursor`
+    for the next page.
     """
-    if not JSON_JOBS_RESULTS_DIR.exists():
-        return []
-
-    files = []
-    for f in JSON_JOBS_RESULTS_DIR.iterdir():
-        if f.is_file() and f.suffix.lower() == ".json":
-            stat = f.stat()
-            files.append({
-                "filename": f.name,
-                "size_bytes": stat.st_size,
-                "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "path": str(f)
-            })
-    
-    # Sort by creation time descending
-    files.sort(key=lambda x: x["created_at"], reverse=True)
-    return files
+    return await executors.run_io(_list_page, JSON_JOBS_RESULTS_DIR, ".json", response, limit, cursor, sort, order)
 
 
 @app.get("/jobs/results/{filename}", summary="Get parsed data for a specific Job Description")
@@ -589,7 +981,4 @@ async def get_job_result(filename: str):
         raise HTTPException(status_code=500, detail=f"Error reading JSON file: {str(e)}")
 
 
-
-
-
-
+startup_report = StartupReport(_IMPORT_STARTED, time.perf_counter())
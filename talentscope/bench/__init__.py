@@ -0,0 +1,13 @@
+from talentscope.bench.runner import compare_reports, run_benchmarks, run_e2e, run_micro
+from talentscope.bench.synth import PoolManifest, SyntheticGenerator, generate_pool, sample_texts
+
+__all__ = [
+    "PoolManifest",
+    "SyntheticGenerator",
+    "compare_reports",
+    "generate_pool",
+    "run_benchmarks",
+    "run_e2e",
+    "run_micro",
+    "sample_texts",
+]
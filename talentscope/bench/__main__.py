@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from talentscope.bench.runner import compare_reports, run_benchmarks
+from talentscope.bench.synth import generate_pool
+
+
+def _int_list(value: str):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    p = argparse.ArgumentParser(
+        prog="python -m talentscope.bench",
+        description="TalentScope benchmarks: per-function micro benchmarks and end-to-end scan_pool runs on synthetic pools.",
+    )
+    p.add_argument("--skills", default="talentscope/skills/skills.yaml", help="skills.yaml path (vocabulary for the synthetic texts)")
+    p.add_argument("--work-dir", default="bench_work", help="Where synthetic pools and benchmark caches are kept")
+    p.add_argument("--sizes", type=_int_list, default=[1000], help="Comma-separated pool sizes, e.g. 1000,10000,100000")
+    p.add_argument("--workers", type=_int_list, default=[1], help="Comma-separated worker counts for scan_pool, e.g. 1,4")
+    p.add_argument("--seed", type=int, default=0, help="Generator seed (same seed = same pool)")
+    p.add_argument("--repeat", type=int, default=3, help="Rounds per micro benchmark")
+    p.add_argument("--micro-cvs", type=int, default=300, help="Number of in-memory CV texts for micro benchmarks")
+    p.add_argument("--no-micro", action="store_true", help="Skip micro benchmarks")
+    p.add_argument("--no-e2e", action="store_true", help="Skip end-to-end scan_pool runs")
+    p.add_argument("--profile", action="store_true", help="Include scan_pool stage profiles in the e2e results")
+    p.add_argument("--out", default=None, help="Write the JSON report here (default: stdout only)")
+    p.add_argument("--compare", default=None, help="Baseline report JSON to compare against")
+    p.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown ratio before a metric counts as a regression")
+    p.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 when --compare finds regressions")
+    p.add_argument("--generate-only", action="store_true", help="Only generate the pools for --sizes and exit")
+
+    args = p.parse_args()
+
+    if args.generate_only:
+        for size in args.sizes:
+            m = generate_pool(str(Path(args.work_dir) / f"pool_{size}_s{args.seed}"), size, args.skills, seed=args.seed)
+            print(json.dumps({"size": m.size, "cv_dir": m.cv_dir, "jobs": m.jobs, "salaries_csv": m.salaries_csv}))
+        return
+
+    report = run_benchmarks(
+        skills_yaml=args.skills,
+        work_dir=args.work_dir,
+        sizes=[] if args.no_e2e else args.sizes,
+        workers=args.workers,
+        micro=not args.no_micro,
+        micro_cvs=args.micro_cvs,
+        repeat=args.repeat,
+        seed=args.seed,
+        profile=args.profile,
+    )
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["comparison"] = compare_reports(baseline, report, threshold=args.threshold)
+
+    js = json.dumps(report, indent=2, ensure_ascii=False)
+    print(js)
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(js, encoding="utf-8")
+
+    if args.fail_on_regression and report.get("comparison", {}).get("regressions"):
+        print("Regressions: " + ", ".join(report["comparison"]["regressions"]), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from talentscope.bench.synth import GENERATOR_VERSION, generate_pool, pdf_bytes, sample_texts, write_docx
+from talentscope.profiling import percentile
+
+REPORT_SCHEMA = 1
+
+
+def _time_calls(fn: Callable[[Any], Any], inputs: Sequence[Any], repeat: int = 1) -> Dict[str, Any]:
+    """Times fn(x) for every x (repeat rounds); per-call stats in microseconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        for x in inputs:
+            t0 = time.perf_counter()
+            fn(x)
+            samples.append(time.perf_counter() - t0)
+    samples.sort()
+    total = sum(samples)
+    return {
+        "calls": len(samples),
+        "total_s": round(total, 6),
+        "mean_us": round(total / len(samples) * 1e6, 3) if samples else 0.0,
+        "p50_us": round(percentile(samples, 50) * 1e6, 3),
+        "p95_us": round(percentile(samples, 95) * 1e6, 3),
+        "max_us": round(samples[-1] * 1e6, 3) if samples else 0.0,
+        "ops_per_s": round(len(samples) / total, 2) if total > 0 else None,
+    }
+
+
+def run_micro(skills_yaml: str, n_cvs: int = 300, n_jobs: int = 5, repeat: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """Per-function benchmarks on in-memory synthetic texts."""
+    from talentscope.core.hr_scorer import HRScorer
+    from talentscope.core.matcher import compile_patterns, score_text
+    from talentscope.core.normalize import norm
+    from talentscope.core.parser import CVParser
+    from talentscope.core.experience import estimate_experience_years
+    from talentscope.core.scoring import compute_job_match, prepare_job
+    from talentscope.core.skill_index import load_skill_index
+    from talentscope.io.extractors import extract_file_content
+
+    texts = sample_texts(skills_yaml, n_cvs, n_jobs, seed=seed)
+    cvs, jobs = texts["cvs"], texts["jobs"]
+    index = load_skill_index(skills_yaml)
+    cvs_norm = [norm(t) for t in cvs]
+    jobs_norm = [norm(t) for t in jobs]
+
+    # score_text is the regex reference matcher: one call per domain and CV
+    compiled = [(dom.items, compile_patterns(list(dom.items))) for dom in index.domains.values()]
+
+    def _score_text_all_domains(text_norm: str) -> None:
+        for items, comp in compiled:
+            score_text(text_norm, list(items), comp)
+
+    pairs = [(jobs_norm[k % len(jobs_norm)], cvs_norm[k]) for k in range(len(cvs_norm))]
+    prepared = [prepare_job(j, index) for j in jobs_norm]
+    parsed = [CVParser(t).parse() for t in cvs]
+
+    hr_inputs = []
+    for k, raw in enumerate(cvs):
+        jm = prepared[k % len(prepared)].match(index.scan(cvs_norm[k]))
+        hr_inputs.append({
+            "raw_text": raw,
+            "parsed_data": parsed[k],
+            "estimated_experience": estimate_experience_years(raw),
+            "top_matched_terms": [(t, w) for (t, w, _) in jm.get("matched_terms", [])],
+            "salary": None,
+        })
+    job_data = {"title": "software engineer", "min_experience": 2, "max_experience": 6, "min_salary": None, "max_salary": None}
+    scorer = HRScorer(job_data)
+
+    results = {
+        "norm": _time_calls(norm, cvs, repeat),
+        "score_text": _time_calls(_score_text_all_domains, cvs_norm, repeat),
+        "skill_index.scan": _time_calls(index.scan, cvs_norm, repeat),
+        "compute_job_match": _time_calls(lambda p: compute_job_match(p[0], p[1], index), pairs, repeat),
+        "prepared_job.match": _time_calls(
+            lambda k: prepared[k % len(prepared)].match(index.scan(cvs_norm[k])), list(range(len(cvs_norm))), repeat
+        ),
+        "estimate_experience_years": _time_calls(estimate_experience_years, cvs, repeat),
+        "CVParser.parse": _time_calls(lambda t: CVParser(t).parse(), cvs, repeat),
+        "HRScorer.score": _time_calls(scorer.score, hr_inputs, repeat),
+    }
+
+    # Extraction on a small file sample of both formats
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="ts_bench_") as tmp:
+        sample = cvs[: min(50, len(cvs))]
+        pdfs, docxs = [], []
+        for k, text in enumerate(sample):
+            pdf_path = Path(tmp) / f"cv_{k}.pdf"
+            pdf_path.write_bytes(pdf_bytes(text.split("\n")))
+            pdfs.append(str(pdf_path))
+            docx_path = Path(tmp) / f"cv_{k}.docx"
+            write_docx(docx_path, text.split("\n"))
+            docxs.append(str(docx_path))
+        results["extract.pdf"] = _time_calls(extract_file_content, pdfs, 1)
+        results["extract.docx"] = _time_calls(extract_file_content, docxs, 1)
+
+    return {"params": {"n_cvs": n_cvs, "n_jobs": n_jobs, "repeat": repeat, "seed": seed}, "results": results}
+
+
+# Runs in a fresh interpreter so every e2e measurement starts with its own, empty caches.
+_E2E_CHILD = """
+import json, sys, time
+from talentscope.pipeline import scan_pool
+args = json.loads(sys.argv[1])
+runs = []
+for label in args["runs"]:
+    t0 = time.perf_counter()
+    out = scan_pool(
+        cv_dir=args["cv_dir"], skills_yaml=args["skills_yaml"], job_file=args["job_file"],
+        salaries_csv=args["salaries_csv"], min_fit_score=args["min_fit_score"], top_n=args["top_n"],
+        workers=args["workers"], profile=args["profile"],
+    )
+    wall = time.perf_counter() - t0
+    runs.append({"label": label, "wall_s": wall, "pool": out["pool"], "profile": out.get("profile")})
+print(json.dumps(runs))
+"""
+
+
+def run_e2e(
+    manifest,
+    skills_yaml: str,
+    cache_dir: str,
+    workers: int = 1,
+    min_fit_score: float = 10.0,
+    top_n: int = 10,
+    profile: bool = False,
+) -> Dict[str, Any]:
+    """
+    scan_pool over a generated pool, in a child process:
+    "cold" (empty extraction cache and feature store), then "warm" (same caches, filled).
+    A third run with both caches disabled measures the uncached path.
+    """
+    cache_root = Path(cache_dir) / f"size{manifest.size}_w{workers}_{int(time.time() * 1000)}"
+    job_file = manifest.jobs[0]
+    args = {
+        "cv_dir": manifest.cv_dir,
+        "skills_yaml": skills_yaml,
+        "job_file": job_file,
+        "salaries_csv": manifest.salaries_csv,
+        "min_fit_score": min_fit_score,
+        "top_n": top_n,
+        "workers": workers,
+        "profile": profile,
+    }
+
+    def _child(env_extra: Dict[str, str], runs: List[str]) -> List[Dict[str, Any]]:
+        env = dict(os.environ)
+        env.update(env_extra)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path(__file__).resolve().parents[2]), env.get("PYTHONPATH")]))
+        proc = subprocess.run(
+            [sys.executable, "-c", _E2E_CHILD, json.dumps({**args, "runs": runs})],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+
+    runs = _child(
+        {
+            "EXTRACT_CACHE_ENABLED": "True",
+            "EXTRACT_CACHE_DIR": str(cache_root / "extract"),
+            "FEATURE_STORE_ENABLED": "True",
+            "FEATURE_STORE_PATH": str(cache_root / "features.sqlite"),
+        },
+        ["cold", "warm"],
+    )
+    runs += _child({"EXTRACT_CACHE_ENABLED": "False", "FEATURE_STORE_ENABLED": "False"}, ["uncached"])
+
+    out: Dict[str, Any] = {"size": manifest.size, "workers": workers, "job_file": Path(job_file).name}
+    for r in runs:
+        entry = {
+            "wall_s": round(r["wall_s"], 4),
+            "cvs_per_s": round(manifest.size / r["wall_s"], 2) if r["wall_s"] > 0 else None,
+            "qualified_cvs": r["pool"]["qualified_cvs"],
+        }
+        if r.get("profile"):
+            entry["profile"] = r["profile"]
+        out[r["label"]] = entry
+    return out
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=str(Path(__file__).resolve().parents[2]),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(
+    skills_yaml: str,
+    work_dir: str,
+    sizes: Sequence[int] = (1000,),
+    workers: Sequence[int] = (1,),
+    micro: bool = True,
+    micro_cvs: int = 300,
+    repeat: int = 3,
+    seed: int = 0,
+    profile: bool = False,
+) -> Dict[str, Any]:
+    from talentscope.core.skill_index import skills_file_hash
+
+    report: Dict[str, Any] = {
+        "schema": REPORT_SCHEMA,
+        "created_at": datetime.utcnow().isoformat(),
+        "git_commit": _git_commit(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "params": {
+            "sizes": list(sizes),
+            "workers": list(workers),
+            "seed": seed,
+            "generator_version": GENERATOR_VERSION,
+            "skills_hash": skills_file_hash(skills_yaml),
+        },
+        "micro": None,
+        "e2e": [],
+    }
+
+    if micro:
+        report["micro"] = run_micro(skills_yaml, n_cvs=micro_cvs, repeat=repeat, seed=seed)
+
+    for size in sizes:
+        t0 = time.perf_counter()
+        manifest = generate_pool(str(Path(work_dir) / f"pool_{size}_s{seed}"), size, skills_yaml, seed=seed)
+        gen_s = time.perf_counter() - t0
+        for w in workers:
+            entry = run_e2e(manifest, skills_yaml, str(Path(work_dir) / "caches"), workers=w, profile=profile)
+            entry["pool_generation_s"] = round(gen_s, 3)
+            report["e2e"].append(entry)
+
+    return report
+
+
+def _flatten(report: Dict[str, Any]) -> Dict[str, float]:
+    # Comparable metrics, lower is better: micro mean_us and e2e wall_s.
+    flat: Dict[str, float] = {}
+    for name, r in ((report.get("micro") or {}).get("results") or {}).items():
+        flat[f"micro.{name}.mean_us"] = r["mean_us"]
+    for e in report.get("e2e") or []:
+        for label in ("cold", "warm", "uncached"):
+            if label in e:
+                flat[f"e2e.size{e['size']}.w{e['workers']}.{label}.wall_s"] = e[label]["wall_s"]
+    return flat
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> Dict[str, Any]:
+    """Metric-by-metric ratio current/baseline; ratios above 1 + threshold are regressions."""
+    base, cur = _flatten(baseline), _flatten(current)
+    rows = []
+    for key in sorted(set(base) & set(cur)):
+        ratio = cur[key] / base[key] if base[key] else None
+        rows.append({
+            "metric": key,
+            "baseline": base[key],
+            "current": cur[key],
+            "ratio": round(ratio, 3) if ratio is not None else None,
+            "regression": ratio is not None and ratio > 1.0 + threshold,
+        })
+    return {
+        "baseline_commit": baseline.get("git_commit"),
+        "current_commit": current.get("git_commit"),
+        "threshold": threshold,
+        "rows": rows,
+        "regressions": [r["metric"] for r in rows if r["regression"]],
+    }
@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+# Synthetic CV / job description generator for benchmarks.
+# Texts are built from the real skills.yaml vocabulary, in Turkish and English, and
+# written in the formats extractors.py reads (.pdf and .docx for CVs, .txt for jobs).
+# The PDF and DOCX writers are minimal hand-rolled containers (no extra dependency)
+# that pdfminer / python-docx read back losslessly, Turkish characters included.
+import csv
+import json
+import random
+import zipfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from talentscope.skills.skills_loader import SkillItem, load_yaml
+
+GENERATOR_VERSION = "1"
+
+_FIRST_NAMES = [
+    "Ayşe", "Mehmet", "Zeynep", "Ahmet", "Elif", "Mustafa", "Büşra", "Emre", "Şule", "Çağrı",
+    "Gökhan", "İrem", "Oğuz", "Özge", "Ümit", "Deniz", "Can", "Ece", "Burak", "Selin",
+]
+_LAST_NAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Öztürk", "Aydın", "Arslan", "Doğan",
+    "Kılıç", "Aslan", "Çetin", "Koç", "Kurt", "Özdemir", "Erdoğan", "Güneş", "Acar", "Polat",
+]
+_ASCII_FOLD = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+_COMPANIES = [
+    "Anadolu Yazılım A.Ş.", "Boğaziçi Teknoloji", "Ege Bilişim", "Karadeniz Data Ltd.", "Marmara Fintech",
+    "Northwind Systems", "Contoso Cloud", "Initech", "Globex Software", "Umbrella Analytics",
+]
+_SCHOOLS = [
+    "Orta Doğu Teknik Üniversitesi", "Boğaziçi Üniversitesi", "İstanbul Teknik Üniversitesi",
+    "Hacettepe Üniversitesi", "Ege Üniversitesi", "Yıldız Teknik Üniversitesi", "Ankara Üniversitesi",
+    "Dokuz Eylül Üniversitesi", "Sabancı Üniversitesi", "Koç Üniversitesi",
+]
+_DEGREES = {
+    "tr": ["Bilgisayar Mühendisliği Lisans", "Yazılım Mühendisliği Lisans", "Endüstri Mühendisliği Lisans", "Bilgisayar Bilimleri Yüksek Lisans"],
+    "en": ["BSc Computer Engineering", "BSc Software Engineering", "BSc Industrial Engineering", "MSc Computer Science"],
+}
+_SECTIONS = {
+    "tr": {
+        "summary": "ÖZET", "experience": "DENEYİM", "education": "EĞİTİM",
+        "skills": "YETENEKLER", "certs": "SERTİFİKALAR", "projects": "PROJELER",
+    },
+    "en": {
+        "summary": "SUMMARY", "experience": "EXPERIENCE", "education": "EDUCATION",
+        "skills": "SKILLS", "certs": "CERTIFICATIONS", "projects": "PROJECTS",
+    },
+}
+_TITLES = {
+    "tr": ["Yazılım Geliştirici", "Kıdemli Yazılım Geliştirici", "Yazılım Mühendisi", "Takım Lideri", "Stajyer Mühendis"],
+    "en": ["Software Developer", "Senior Software Engineer", "Software Engineer", "Team Lead", "Engineering Intern"],
+}
+_BULLETS = {
+    "tr": [
+        "{a} ve {b} kullanarak ölçeklenebilir servisler geliştirdim.",
+        "{a} tabanlı altyapının {b} ile entegrasyonunu yönettim.",
+        "Ekip içinde {a} pratiklerini yaygınlaştırdım, {b} süreçlerini iyileştirdim.",
+        "{a} projesinde performans sorunlarını çözdüm; {b} ile izleme kurdum.",
+    ],
+    "en": [
+        "Built scalable services using {a} and {b}.",
+        "Led the integration of the {a} platform with {b}.",
+        "Introduced {a} practices across the team and improved {b} workflows.",
+        "Fixed performance bottlenecks in the {a} project and set up monitoring with {b}.",
+    ],
+}
+
+
+@dataclass
+class PoolManifest:
+    """What generate_pool() wrote; stored as manifest.json next to the files."""
+    root: str
+    size: int
+    seed: int
+    pdf_ratio: float
+    salary_ratio: float
+    tr_ratio: float
+    generator_version: str = GENERATOR_VERSION
+    cv_dir: str = ""
+    jobs: List[str] = field(default_factory=list)
+    salaries_csv: str = ""
+    skills_hash: str = ""
+
+
+class SyntheticGenerator:
+    """
+    Deterministic text generator: every CV / job is derived from (seed, index) only,
+    so the same pool is produced regardless of generation order.
+    """
+
+    def __init__(self, skills_yaml: str, seed: int = 0, tr_ratio: float = 0.5):
+        cfg = load_yaml(skills_yaml)
+        self.seed = seed
+        self.tr_ratio = tr_ratio
+        self.domains: List[Tuple[str, str, List[SkillItem]]] = []
+        for dk, dv in (cfg.get("domains") or {}).items():
+            items = list((dv or {}).get("items") or [])
+            if items:
+                self.domains.append((dk, (dv or {}).get("label", dk), items))
+        if not self.domains:
+            raise ValueError("skills.yaml has no domain with items.")
+
+    def _rng(self, kind: str, i: int) -> random.Random:
+        return random.Random(f"{self.seed}:{kind}:{i}")
+
+    @staticmethod
+    def _surface(rng: random.Random, item: SkillItem) -> str:
+        # Canonical name most of the time, otherwise one of its synonyms
+        if item.variants_norm and rng.random() < 0.4:
+            return rng.choice(item.variants_norm)
+        return item.canonical
+
+    def _skills(self, rng: random.Random, home: int, n_home: int, n_other: int) -> List[str]:
+        _, _, items = self.domains[home]
+        picked = rng.sample(items, min(n_home, len(items)))
+        for _ in range(n_other):
+            _, _, other = self.domains[rng.randrange(len(self.domains))]
+            picked.append(rng.choice(other))
+        out, seen = [], set()
+        for it in picked:
+            s = self._surface(rng, it)
+            if s not in seen:
+                seen.add(s)
+                out.append(s)
+        return out
+
+    def cv_lines(self, i: int) -> Tuple[List[str], str]:
+        """Lines of the i-th CV and its language ("tr" / "en")."""
+        rng = self._rng("cv", i)
+        lang = "tr" if rng.random() < self.tr_ratio else "en"
+        sec = _SECTIONS[lang]
+        home = rng.randrange(len(self.domains))
+        skills = self._skills(rng, home, rng.randint(4, 18), rng.randint(0, 5))
+
+        first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+        now = datetime.now().year
+        career_start = now - rng.randint(0, 15)
+
+        lines = [
+            f"{first} {last}",
+            f"{first.translate(_ASCII_FOLD).lower()}.{last.translate(_ASCII_FOLD).lower()}{i}@example.com | +90 5{rng.randint(30, 59)} {rng.randint(100, 999)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+        ]
+        if rng.random() < 0.5:
+            lines.append(f"https://github.com/user{i}/portfolio")
+        if rng.random() < 0.5:
+            lines.append(f"https://www.linkedin.com/in/user{i}")
+
+        years = now - career_start
+        lines.append(sec["summary"])
+        if lang == "tr":
+            lines.append(f"{self.domains[home][1]} alanında {years} yıl deneyimli, {', '.join(skills[:3])} odaklı mühendis.")
+        else:
+            lines.append(f"Engineer with {years} years of experience in {self.domains[home][1]}, focused on {', '.join(skills[:3])}.")
+
+        lines.append(sec["experience"])
+        start = career_start
+        for j in range(rng.randint(1, 4)):
+            if start >= now:
+                break
+            end = min(now, start + rng.randint(1, 5))
+            title = rng.choice(_TITLES[lang])
+            lines.append(f"{title} - {rng.choice(_COMPANIES)} ({start} - {end if end < now else ('Halen' if lang == 'tr' else 'Present')})")
+            for _ in range(rng.randint(1, 3)):
+                a, b = rng.choice(skills), rng.choice(skills)
+                lines.append("- " + rng.choice(_BULLETS[lang]).format(a=a, b=b))
+            start = end
+
+        lines.append(sec["education"])
+        lines.append(f"{rng.choice(_SCHOOLS)} - {rng.choice(_DEGREES[lang])} ({career_start - rng.randint(4, 6)} - {career_start})")
+
+        lines.append(sec["skills"])
+        lines.append(", ".join(skills))
+
+        if rng.random() < 0.4:
+            lines.append(sec["projects"])
+            lines.append(f"{rng.choice(skills)} / {rng.choice(skills)} - open source side project")
+        if rng.random() < 0.3:
+            lines.append(sec["certs"])
+            lines.append(f"{rng.choice(skills).upper()} Certified Professional")
+        return lines, lang
+
+    def job_text(self, j: int) -> Tuple[str, str]:
+        """Text of the j-th job description and its language."""
+        rng = self._rng("job", j)
+        lang = "tr" if rng.random() < self.tr_ratio else "en"
+        home = rng.randrange(len(self.domains))
+        label = self.domains[home][1]
+        skills = self._skills(rng, home, rng.randint(6, 14), rng.randint(0, 2))
+        min_years = rng.randint(1, 7)
+
+        if lang == "tr":
+            lines = [
+                f"{label} - İş İlanı",
+                "Şirket Hakkında",
+                f"{rng.choice(_COMPANIES)} ekibine katılacak {label} arıyoruz.",
+                "Aranan Nitelikler",
+                f"- En az {min_years} yıl deneyim",
+            ]
+            lines += [f"- {s} konusunda deneyim" for s in skills]
+            lines += ["Yan Haklar", "- Hibrit çalışma modeli", "- Özel sağlık sigortası"]
+        else:
+            lines = [
+                f"{label} - Job Posting",
+                "About Us",
+                f"{rng.choice(_COMPANIES)} is hiring a {label}.",
+                "Requirements",
+                f"- At least {min_years} years of experience",
+            ]
+            lines += [f"- Hands-on experience with {s}" for s in skills]
+            lines += ["Benefits", "- Hybrid work model", "- Private health insurance"]
+        return "\n".join(lines), lang
+
+    def salary(self, i: int) -> Optional[str]:
+        rng = self._rng("salary", i)
+        low = rng.randrange(40_000, 200_000, 5_000)
+        return f"{low}-{low + rng.randrange(0, 60_000, 5_000)}"
+
+
+# --- File writers -------------------------------------------------------------
+
+_PDF_TR_GLYPHS = {
+    "ş": "scedilla", "Ş": "Scedilla", "ğ": "gbreve", "Ğ": "Gbreve", "ı": "dotlessi", "İ": "Idotaccent",
+    "ç": "ccedilla", "Ç": "Ccedilla", "ö": "odieresis", "Ö": "Odieresis", "ü": "udieresis", "Ü": "Udieresis",
+}
+_PDF_CODES = {ch: 128 + k for k, ch in enumerate(_PDF_TR_GLYPHS)}
+_PDF_DIFFERENCES = " ".join(f"{_PDF_CODES[ch]} /{name}" for ch, name in _PDF_TR_GLYPHS.items())
+
+
+def _pdf_escape(line: str) -> str:
+    out = []
+    for ch in line:
+        if ch in _PDF_CODES:
+            out.append("\\%03o" % _PDF_CODES[ch])
+        elif ch in "()\\":
+            out.append("\\" + ch)
+        elif 32 <= ord(ch) < 127:
+            out.append(ch)
+        else:
+            out.append("?")
+    return "".join(out)
+
+
+def _wrap(lines: Sequence[str], width: int) -> List[str]:
+    out: List[str] = []
+    for line in lines:
+        while len(line) > width:
+            cut = line.rfind(" ", 0, width)
+            cut = cut if cut > 0 else width
+            out.append(line[:cut])
+            line = line[cut:].lstrip()
+        out.append(line)
+    return out
+
+
+def pdf_bytes(lines: Sequence[str], lines_per_page: int = 55) -> bytes:
+    """Minimal multi-page text PDF (Helvetica, Turkish letters via an encoding Differences array)."""
+    lines = _wrap(lines, 95)
+    pages = [lines[k:k + lines_per_page] for k in range(0, len(lines), lines_per_page)] or [[]]
+
+    objs: List[bytes] = [b"<< /Type /Catalog /Pages 2 0 R >>", b""]
+    objs.append(
+        (
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding << /Type /Encoding "
+            f"/BaseEncoding /WinAnsiEncoding /Differences [{_PDF_DIFFERENCES}] >> >>"
+        ).encode("ascii")
+    )
+    kids = []
+    for page in pages:
+        content = "BT /F1 10 Tf 14 TL 50 800 Td " + " ".join(f"({_pdf_escape(l)}) '" for l in page) + " ET"
+        data = content.encode("latin-1")
+        page_id = len(objs) + 1
+        objs.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+            ).encode("ascii")
+        )
+        objs.append(b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+        kids.append(page_id)
+    objs[1] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>".encode("ascii")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, obj in enumerate(objs, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n".encode("ascii") + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode("ascii")
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("ascii")
+    return bytes(out)
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+
+def write_docx(path: Path, lines: Sequence[str]) -> None:
+    """Minimal DOCX (one paragraph per line); much faster than building it with python-docx."""
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(l)}</w:t></w:r></w:p>' for l in lines
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _DOCX_RELS)
+        zf.writestr("word/document.xml", document)
+
+
+# --- Pool generation ----------------------------------------------------------
+
+def generate_pool(
+    out_dir: str,
+    size: int,
+    skills_yaml: str,
+    n_jobs: int = 5,
+    seed: int = 0,
+    pdf_ratio: float = 0.5,
+    salary_ratio: float = 0.6,
+    tr_ratio: float = 0.5,
+) -> PoolManifest:
+    """
+    Writes size CVs (cv_pool/), n_jobs job descriptions (jobs/) and salaries.csv under out_dir.
+    An existing pool with the same parameters (manifest.json) is reused as is.
+    """
+    from talentscope.core.skill_index import skills_file_hash
+
+    root = Path(out_dir)
+    manifest = PoolManifest(
+        root=str(root),
+        size=size,
+        seed=seed,
+        pdf_ratio=pdf_ratio,
+        salary_ratio=salary_ratio,
+        tr_ratio=tr_ratio,
+        cv_dir=str(root / "cv_pool"),
+        salaries_csv=str(root / "salaries.csv"),
+        skills_hash=skills_file_hash(skills_yaml),
+    )
+    manifest.jobs = [str(root / "jobs" / f"job_{j:03d}.txt") for j in range(n_jobs)]
+
+    manifest_path = root / "manifest.json"
+    if manifest_path.exists():
+        try:
+            if json.loads(manifest_path.read_text(encoding="utf-8")) == asdict(manifest):
+                return manifest
+        except Exception:
+            pass
+
+    gen = SyntheticGenerator(skills_yaml, seed=seed, tr_ratio=tr_ratio)
+    cv_dir = Path(manifest.cv_dir)
+    cv_dir.mkdir(parents=True, exist_ok=True)
+    for old in cv_dir.iterdir():
+        if old.is_file():
+            old.unlink()
+    (root / "jobs").mkdir(parents=True, exist_ok=True)
+
+    width = max(6, len(str(size)))
+    salary_rows: List[Tuple[str, str]] = []
+    for i in range(size):
+        lines, _ = gen.cv_lines(i)
+        as_pdf = random.Random(f"{seed}:fmt:{i}").random() < pdf_ratio
+        name = f"cv_{i:0{width}d}.{'pdf' if as_pdf else 'docx'}"
+        if as_pdf:
+            (cv_dir / name).write_bytes(pdf_bytes(lines))
+        else:
+            write_docx(cv_dir / name, lines)
+        if random.Random(f"{seed}:has_salary:{i}").random() < salary_ratio:
+            salary_rows.append((name, gen.salary(i)))
+
+    for j, job_path in enumerate(manifest.jobs):
+        text, _ = gen.job_text(j)
+        Path(job_path).write_text(text, encoding="utf-8")
+
+    with open(manifest.salaries_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["filename", "salary_tl"])
+        writer.writerows(salary_rows)
+
+    manifest_path.write_text(json.dumps(asdict(manifest), indent=2), encoding="utf-8")
+    return manifest
+
+
+def sample_texts(skills_yaml: str, n_cvs: int, n_jobs: int, seed: int = 0, tr_ratio: float = 0.5) -> Dict[str, Any]:
+    """In-memory CV / job texts for the micro benchmarks (no extraction involved)."""
+    gen = SyntheticGenerator(skills_yaml, seed=seed, tr_ratio=tr_ratio)
+    return {
+        "cvs": ["\n".join(gen.cv_lines(i)[0]) for i in range(n_cvs)],
+        "jobs": [gen.job_text(j)[0] for j in range(n_jobs)],
+    }
@@ -1,47 +1,244 @@
 # -*- coding: utf-8 -*-
 import argparse
 import json
+import logging
+import sys
 from datetime import datetime
 from pathlib import Path
 
-from talentscope.pipeline import scan_pool
+from talentscope.pipeline import CandidateFilter, merge_scan_outputs, ndjson_line, scan_pool, scan_pool_many, scan_pool_records
 
 
-def _default_out_path(results_dir: str, job_file: str) -> Path:
+def _default_out_path(results_dir: str, job_file: str, shard=None) -> Path:
     ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     job_stem = Path(job_file).stem
-    return Path(results_dir) / f"{job_stem}_{ts}.json"
+    suffix = f"_shard{shard[0]}of{shard[1]}" if shard is not None else ""
+    return Path(results_dir) / f"{job_stem}_{ts}{suffix}.json"
 
 
-def main():
-    p = argparse.ArgumentParser(description="TalentScope: CV–Job matching and candidate ranking engine.")
-    p.add_argument("--pool", required=True, help="CV folder path (.pdf/.docx)")
-    p.add_argument("--job", required=True, help="Job description file path (.txt/.pdf/.docx)")
+def _shard_arg(value: str):
+    # "i/N": the i-th (0-based) of N parts of the pool
+    try:
+        index, count = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected i/N, e.g. 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError("i must be in 0..N-1")
+    return index, count
+
+
+def ingest_main(argv):
+    from talentscope.config import IngestConfig, MinioConfig
+    from talentscope.ingest import ingest_cvs, read_salary_file
+
+    p = argparse.ArgumentParser(
+        prog="talentscope ingest",
+        description="Bulk-ingest CVs (files and/or ZIP archives) into a CV pool: parse, store JSON, Postgres and MinIO.",
+    )
+    p.add_argument("sources", nargs="+", help="CV files (.pdf/.docx) and/or .zip archives")
+    p.add_argument("--pool", default="talentscope/data/cv_pool", help="CV pool folder to ingest into")
+    p.add_argument("--skills", default="talentscope/skills/skills.yaml", help="skills.yaml path")
+    p.add_argument("--salaries", default=None, help="Salary CSV for the batch (filename,salary_tl)")
+    p.add_argument("--pool-salaries", default="talentscope/data/salaries.csv", help="Pool salaries.csv the batch salaries are appended to")
+    p.add_argument("--json-dir", default=None, help="Where parsed JSON results go (default: <pool>/json_results)")
+    p.add_argument("--workers", type=int, default=IngestConfig.PARSE_WORKERS, help="Parse processes (0 = one per CPU)")
+    p.add_argument("--upload-concurrency", type=int, default=IngestConfig.UPLOAD_CONCURRENCY, help="Concurrent MinIO uploads")
+    p.add_argument("--no-db", action="store_true", help="Do not write candidates to Postgres")
+    p.add_argument("--no-upload", action="store_true", help="Do not upload files to MinIO")
+    p.add_argument("--out", default=None, help="Optional path for the JSON summary")
+
+    args = p.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(name)s %(message)s")
+
+    result = ingest_cvs(
+        args.sources,
+        cv_dir=args.pool,
+        skills_yaml=args.skills,
+        salaries_csv=args.pool_salaries,
+        salary_inputs=read_salary_file(args.salaries) if args.salaries else None,
+        json_dir=args.json_dir,
+        store_db=not args.no_db,
+        bucket=None if args.no_upload else MinioConfig.BUCKET_CVS,
+        workers=args.workers,
+        upload_concurrency=args.upload_concurrency,
+    )
+
+    js = json.dumps(result["summary"], indent=2, ensure_ascii=False)
+    print(js)
+    if args.out:
+        Path(args.out).write_text(js, encoding="utf-8")
+    if result["summary"]["counts"].get("failed"):
+        sys.exit(1)
+
+
+def reindex_main(argv):
+    from talentscope.config import DBConfig, IngestConfig
+    from talentscope.ingest import reindex_candidates
+
+    p = argparse.ArgumentParser(
+        prog="talentscope reindex",
+        description="Re-parse the CV pool and upsert every candidate row in Postgres (e.g. after a skills.yaml change).",
+    )
+    p.add_argument("--pool", default="talentscope/data/cv_pool", help="CV pool folder")
+    p.add_argument("--skills", default="talentscope/skills/skills.yaml", help="skills.yaml path")
+    p.add_argument("--salaries", default="talentscope/data/salaries.csv", help="Pool salaries.csv (filename,salary_tl)")
+    p.add_argument("--workers", type=int, default=IngestConfig.PARSE_WORKERS, help="Parse processes (0 = one per CPU)")
+    p.add_argument("--batch-size", type=int, default=DBConfig.UPSERT_BATCH_SIZE, help="CVs parsed and upserted per batch")
+
+    args = p.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(name)s %(message)s")
+
+    summary = reindex_candidates(
+        args.pool,
+        skills_yaml=args.skills,
+        salaries_csv=args.salaries,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    if summary["counts"].get("error"):
+        sys.exit(1)
+
+
+def merge_main(argv):
+    p = argparse.ArgumentParser(
+        prog="talentscope merge",
+        description="Merge the partial outputs of a sharded scan (--shard i/N) into the single-node ranking.",
+    )
+    p.add_argument("partials", nargs="+", help="Shard output JSON files, one per shard (any order)")
+    p.add_argument("--results-dir", default="talentscope/results", help="Where to save the merged JSON")
+    p.add_argument("--out", default=None, help="Optional explicit output JSON path")
+
+    args = p.parse_args(argv)
+    partials = [json.loads(Path(f).read_text(encoding="utf-8")) for f in args.partials]
+    try:
+        output = merge_scan_outputs(partials)
+    except ValueError as e:
+        p.error(str(e))
+
+    js = json.dumps(output, indent=2, ensure_ascii=False)
+    print(js)
+    if args.out:
+        out_path = Path(args.out)
+    else:
+        Path(args.results_dir).mkdir(parents=True, exist_ok=True)
+        out_path = _default_out_path(args.results_dir, output["job"]["job_file"])
+    out_path.write_text(js, encoding="utf-8")
+
+
+COMMANDS = {
+    "ingest": ingest_main,
+    "reindex": reindex_main,
+    "merge": merge_main,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+
+    p = argparse.ArgumentParser(
+        description="TalentScope: CV–Job matching and candidate ranking engine.",
+        epilog="Other commands: " + ", ".join(f"talentscope {c} --help" for c in COMMANDS),
+    )
+    p.add_argument("--pool", required=True, help="CV folder path (.pdf/.docx), or s3://<bucket>[/<prefix>] to read the CVs from the object store")
+    p.add_argument("--job", required=True, nargs="+", help="Job description file path(s) (.txt/.pdf/.docx); several jobs are matched in one batch pass")
     p.add_argument("--skills", required=True, help="skills.yaml path")
     p.add_argument("--salaries", default=None, help="salaries.csv path (optional)")
     p.add_argument("--min-fit", type=float, default=30.0, help="Reject if job_fit_score < this")
     p.add_argument("--top", type=int, default=10, help="Top N for known and unknown salary lists")
     p.add_argument("--results-dir", default="talentscope/results", help="Where to save JSON outputs")
     p.add_argument("--out", default=None, help="Optional explicit output JSON path")
+    p.add_argument("--workers", type=int, default=1, help="Worker processes for CV scoring (0 = one per CPU)")
+    p.add_argument("--min-exp", type=int, default=None, help="Only candidates with at least this many years of experience")
+    p.add_argument("--max-exp", type=int, default=None, help="Only candidates with at most this many years of experience")
+    p.add_argument("--min-salary", type=float, default=None, help="Only candidates whose salary midpoint is >= this (unknown salary excluded)")
+    p.add_argument("--max-salary", type=float, default=None, help="Only candidates whose salary midpoint is <= this (unknown salary excluded)")
+    p.add_argument("--profile", action="store_true", help="Add per-stage timings to the output and log them to stderr")
+    p.add_argument("--stream", action="store_true", help="Write NDJSON line by line (job header, then one line per candidate, then a summary) instead of one indented JSON document")
+    p.add_argument("--shard", type=_shard_arg, default=None, metavar="i/N", help="Scan only the i-th (0-based) of N parts of the pool and write a partial result for `talentscope merge`")
+
+    args = p.parse_args(argv)
 
-    args = p.parse_args()
+    if len(args.job) > 1 and args.out:
+        p.error("--out can only be used with a single --job; use --results-dir for batch runs")
+
+    filters = CandidateFilter(
+        min_experience=args.min_exp,
+        max_experience=args.max_exp,
+        min_salary=args.min_salary,
+        max_salary=args.max_salary,
+    )
+    if len(args.job) > 1 and filters.active:
+        p.error("experience/salary filters can only be used with a single --job")
+    if len(args.job) > 1 and args.profile:
+        p.error("--profile can only be used with a single --job")
+    if len(args.job) > 1 and args.stream:
+        p.error("--stream can only be used with a single --job")
+    if args.shard is not None and (args.stream or args.profile):
+        p.error("--shard cannot be combined with --stream or --profile")
+
+    if args.profile:
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(name)s %(message)s")
+
+    results_dir = Path(args.results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    if len(args.job) > 1:
+        outputs = scan_pool_many(
+            cv_dir=args.pool,
+            skills_yaml=args.skills,
+            jobs=args.job,
+            salaries_csv=args.salaries,
+            min_fit_score=args.min_fit,
+            top_n=args.top,
+            workers=args.workers,
+            shard=args.shard,
+        )
+        print(json.dumps(outputs, indent=2, ensure_ascii=False))
+        for job_file, output in zip(args.job, outputs):
+            js = json.dumps(output, indent=2, ensure_ascii=False)
+            _default_out_path(str(results_dir), job_file, args.shard).write_text(js, encoding="utf-8")
+        return
+
+    if args.stream:
+        out_path = Path(args.out) if args.out else _default_out_path(str(results_dir), args.job[0]).with_suffix(".ndjson")
+        with out_path.open("w", encoding="utf-8") as f:
+            for record in scan_pool_records(
+                cv_dir=args.pool,
+                skills_yaml=args.skills,
+                job_file=args.job[0],
+                salaries_csv=args.salaries,
+                min_fit_score=args.min_fit,
+                top_n=args.top,
+                workers=args.workers,
+                filters=filters,
+                profile=args.profile,
+            ):
+                line = ndjson_line(record)
+                sys.stdout.write(line)
+                sys.stdout.flush()
+                f.write(line)
+        return
 
     output = scan_pool(
         cv_dir=args.pool,
         skills_yaml=args.skills,
-        job_file=args.job,
+        job_file=args.job[0],
         salaries_csv=args.salaries,
         min_fit_score=args.min_fit,
         top_n=args.top,
+        workers=args.workers,
+        filters=filters,
+        profile=args.profile,
+        shard=args.shard,
     )
 
     js = json.dumps(output, indent=2, ensure_ascii=False)
     print(js)
 
-    results_dir = Path(args.results_dir)
-    results_dir.mkdir(parents=True, exist_ok=True)
-
-    out_path = Path(args.out) if args.out else _default_out_path(str(results_dir), args.job)
+    out_path = Path(args.out) if args.out else _default_out_path(str(results_dir), args.job[0], args.shard)
     out_path.write_text(js, encoding="utf-8")
 
 
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Dict, List, Sequence, Tuple
+
+from talentscope.core.matcher import DomainHits
+from talentscope.core.scoring import PreparedJob
+from talentscope.core.skill_index import SkillIndex
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("Batch matching needs numpy (pip install numpy).") from e
+    return np
+
+
+class SkillVocabulary:
+    """
+    Column space for batch matching: one column per (domain_key, canonical).
+    Matching is per domain in match_hits, so the same canonical in two domains
+    gets two columns.
+    """
+
+    def __init__(self, index: SkillIndex):
+        self.columns: Dict[Tuple[str, str], int] = {}
+        self.column_domain: List[str] = []
+        for dk, dom in index.domains.items():
+            for it in dom.items:
+                key = (dk, it.canonical)
+                if key not in self.columns:
+                    self.columns[key] = len(self.column_domain)
+                    self.column_domain.append(dk)
+
+    def __len__(self) -> int:
+        return len(self.column_domain)
+
+    def sparse_row(self, hits: Dict[str, DomainHits]) -> Tuple[List[int], List[int]]:
+        cols: List[int] = []
+        weights: List[int] = []
+        for dk, dh in hits.items():
+            for h in dh.hits:
+                col = self.columns.get((dk, h.canonical))
+                if col is not None:
+                    cols.append(col)
+                    weights.append(int(h.weight))
+        return cols, weights
+
+
+class JobBatch:
+    """
+    Dense job-side matrices for a list of PreparedJobs:
+    job weights (jobs x vocab), job domain mask (jobs x vocab) and job totals.
+    """
+
+    def __init__(self, vocab: SkillVocabulary, jobs: Sequence[PreparedJob]):
+        np = _require_numpy()
+        self.vocab = vocab
+        self.jobs = list(jobs)
+        n_jobs, n_cols = len(self.jobs), len(vocab)
+
+        self.weights = np.zeros((n_jobs, n_cols), dtype=np.int64)
+        self.domain_mask = np.zeros((n_jobs, n_cols), dtype=np.int64)
+        self.totals = np.zeros(n_jobs, dtype=np.int64)
+
+        col_domain = np.array(vocab.column_domain, dtype=object)
+        for j, pj in enumerate(self.jobs):
+            cols, weights = vocab.sparse_row(pj.job_hits)
+            self.weights[j, cols] = weights
+            self.domain_mask[j] = np.isin(col_domain, list(pj.domains))
+            self.totals[j] = int(pj.total_weight)
+
+    def score(self, rows: Sequence[Tuple[List[int], List[int]]]) -> Dict[str, Any]:
+        """
+        Scores a chunk of CVs (sparse rows from SkillVocabulary.sparse_row) against every job.
+        Returns (cvs x jobs) arrays: matched_weight, resume_domain_score (exact integers),
+        match_percent and job_fit_score (float approximations of the scalar pipeline).
+        """
+        np = _require_numpy()
+        n_cvs, n_cols = len(rows), len(self.vocab)
+
+        present = np.zeros((n_cvs, n_cols), dtype=np.int64)
+        res_weights = np.zeros((n_cvs, n_cols), dtype=np.int64)
+        for i, (cols, weights) in enumerate(rows):
+            if cols:
+                present[i, cols] = 1
+                res_weights[i, cols] = weights
+
+        matched_weight = present @ self.weights.T
+        resume_domain_score = res_weights @ self.domain_mask.T
+
+        totals = np.where(self.totals > 0, self.totals, 1)
+        match_percent = np.round(matched_weight / totals * 100.0, 2)
+        job_fit_score = np.round(resume_domain_score * (match_percent / 100.0), 2)
+
+        return {
+            "matched_weight": matched_weight,
+            "resume_domain_score": resume_domain_score,
+            "match_percent": match_percent,
+            "job_fit_score": job_fit_score,
+        }
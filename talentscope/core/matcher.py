@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import re
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from talentscope.core.normalize import boundary_pattern
 from talentscope.skills.skills_loader import SkillItem
@@ -71,3 +73,161 @@ def score_text(
     matched_list.sort(key=lambda x: (-x[1], x[0]))
     score = sum(w for _, w, _ in matched_list)
     return score, matched_list
+
+
+_WORD_RE = re.compile(r"\w+", flags=re.UNICODE)
+
+
+def _fold(word: str) -> str:
+    # Mirrors re.IGNORECASE equivalence (e.g. "ı" ~ "i", "ſ" ~ "s") for already lower-cased words.
+    up = word.upper()
+    if len(up) == len(word):
+        return up.lower()
+    return "".join(ch.upper().lower() if len(ch.upper()) == 1 else ch for ch in word)
+
+
+def _leftmost_longest(occurrences: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    # Same selection as re.finditer over an alternation sorted by length (longest first).
+    picked: List[Tuple[int, int]] = []
+    last_end = -1
+    for s, e in sorted(occurrences, key=lambda x: (x[0], -x[1])):
+        if s >= last_end:
+            picked.append((s, e))
+            last_end = e
+    return picked
+
+
+@dataclass(frozen=True)
+class SkillHit:
+    canonical: str
+    weight: int
+    domain_label: str
+    positions: Tuple[Tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class DomainHits:
+    domain_key: str
+    label: str
+    hits: Tuple[SkillHit, ...]
+
+    @property
+    def score(self) -> int:
+        return sum(h.weight for h in self.hits)
+
+    def matched_list(self) -> List[Tuple[str, int, str]]:
+        return [(h.canonical, h.weight, h.domain_label) for h in self.hits]
+
+
+def hits_to_dict(hits: Dict[str, DomainHits]) -> Dict[str, Any]:
+    """JSON-friendly form of a scan result (see hits_from_dict)."""
+    return {
+        dk: {
+            "label": dh.label,
+            "hits": [[h.canonical, h.weight, h.domain_label, [list(p) for p in h.positions]] for h in dh.hits],
+        }
+        for dk, dh in hits.items()
+    }
+
+
+def hits_from_dict(data: Dict[str, Any]) -> Dict[str, DomainHits]:
+    return {
+        dk: DomainHits(
+            domain_key=dk,
+            label=dv.get("label", dk),
+            hits=tuple(SkillHit(c, int(w), lab, tuple(tuple(p) for p in pos)) for c, w, lab, pos in dv.get("hits", [])),
+        )
+        for dk, dv in (data or {}).items()
+    }
+
+
+class SkillMatcher:
+    """
+    Word-level trie over every variant of every SkillItem.
+    One pass over the tokens of a normalized text finds all variants of all domains;
+    per-domain scoring then applies the same rules as score_text (boundary matches,
+    phrase-first, tokens inside phrase spans ignored).
+    """
+
+    def __init__(self, items: List[SkillItem]):
+        self.items: List[SkillItem] = list(items)
+        self._root: Dict[str, Any] = {}
+        self._domain_items: Dict[str, List[int]] = {}
+
+        for idx, it in enumerate(self.items):
+            self._domain_items.setdefault(it.domain_key, []).append(idx)
+            for v in set(it.variants_norm):
+                words = _WORD_RE.findall(v)
+                if not words:
+                    continue
+                node = self._root
+                for w in words:
+                    node = node.setdefault(_fold(w), {})
+                node.setdefault(None, []).append(idx)
+
+    def find_all(self, text_norm: str) -> Dict[int, List[Tuple[int, int]]]:
+        """Returns every (start, end) occurrence per item index, overlaps included."""
+        tokens = [(m.start(), m.end(), _fold(m.group())) for m in _WORD_RE.finditer(text_norm)]
+        found: Dict[int, List[Tuple[int, int]]] = {}
+        root = self._root
+        n = len(tokens)
+
+        for i in range(n):
+            start = tokens[i][0]
+            node = root.get(tokens[i][2])
+            j = i
+            while node is not None:
+                for idx in node.get(None, ()):
+                    found.setdefault(idx, []).append((start, tokens[j][1]))
+                j += 1
+                if j >= n or text_norm[tokens[j - 1][1]:tokens[j][0]] != " ":
+                    break
+                node = node.get(tokens[j][2])
+
+        return found
+
+    def scan(self, text_norm: str, domain_keys: Optional[List[str]] = None) -> Dict[str, DomainHits]:
+        found = self.find_all(text_norm)
+        keys = self._domain_items.keys() if domain_keys is None else domain_keys
+        out: Dict[str, DomainHits] = {}
+
+        for dk in keys:
+            idxs = self._domain_items.get(dk, [])
+            phrase_idx = [i for i in idxs if self.items[i].kind == "phrase"]
+            token_idx = [i for i in idxs if self.items[i].kind == "token"]
+
+            occ = {i: _leftmost_longest(found[i]) for i in idxs if i in found}
+
+            spans = sorted(s for i in phrase_idx for s in occ.get(i, ()))
+            merged: List[Tuple[int, int]] = []
+            for s, e in spans:
+                if not merged or s > merged[-1][1]:
+                    merged.append((s, e))
+                else:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+            span_starts = [s for s, _ in merged]
+
+            matched: Dict[str, SkillHit] = {}
+            for i in phrase_idx:
+                it = self.items[i]
+                if it.canonical in matched or i not in occ:
+                    continue
+                matched[it.canonical] = SkillHit(it.canonical, it.weight, it.domain_label, tuple(occ[i]))
+
+            for i in token_idx:
+                it = self.items[i]
+                if it.canonical in matched or i not in occ:
+                    continue
+                free = []
+                for s, e in occ[i]:
+                    k = bisect_right(span_starts, s) - 1
+                    if k < 0 or s >= merged[k][1]:
+                        free.append((s, e))
+                if free:
+                    matched[it.canonical] = SkillHit(it.canonical, it.weight, it.domain_label, tuple(free))
+
+            hits = sorted(matched.values(), key=lambda h: (-h.weight, h.canonical))
+            label = self.items[idxs[0]].domain_label if idxs else dk
+            out[dk] = DomainHits(domain_key=dk, label=label, hits=tuple(hits))
+
+        return out
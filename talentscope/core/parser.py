@@ -2,6 +2,9 @@
 import re
 from typing import Any, Dict, List, Optional
 
+# Bump when parse() output can change; cached candidate features depend on it.
+CV_PARSER_VERSION = "v1_cv_parser"
+
 class CVParser:
     def __init__(self, text: str):
         self.raw_text = text
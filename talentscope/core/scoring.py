@@ -1,39 +1,42 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from talentscope.core.matcher import compile_patterns, score_text
-from talentscope.skills.skills_loader import SkillItem
+from talentscope.core.matcher import DomainHits, hits_from_dict, hits_to_dict
+from talentscope.core.skill_index import SkillIndex
 
 
-def _domain_items(domain_cfg: Dict[str, Any]) -> List[SkillItem]:
-    items = domain_cfg.get("items") or domain_cfg.get("skills") or []
-    return items if isinstance(items, list) else []
-
-
-def score_domains(text_norm: str, cfg: Dict[str, Any]) -> List[Tuple[str, str, int]]:
-    out: List[Tuple[str, str, int]] = []
-    domains = (cfg or {}).get("domains") or {}
-    for dk, dv in domains.items():
-        label = (dv or {}).get("label", dk)
-        items = _domain_items(dv or {})
-        if not items:
-            out.append((dk, label, 0))
-            continue
-        compiled = compile_patterns(items)
-        s, _ = score_text(text_norm, items, compiled)
-        out.append((dk, label, int(s)))
+def domain_scores(hits: Dict[str, DomainHits]) -> List[Tuple[str, str, int]]:
+    out = [(dk, h.label, int(h.score)) for dk, h in hits.items()]
     out.sort(key=lambda x: (-x[2], x[0]))
     return out
 
 
-def detect_job_domains(job_text_norm: str, cfg: Dict[str, Any]) -> List[str]:
-    scored = score_domains(job_text_norm, cfg)
+def score_domains(text_norm: str, index: SkillIndex) -> List[Tuple[str, str, int]]:
+    return domain_scores(index.scan(text_norm))
+
+
+def detect_job_domains(job_text_norm: str, index: SkillIndex) -> List[str]:
+    scored = score_domains(job_text_norm, index)
     return [d for (d, _, s) in scored if s > 0]
 
 
-def compute_job_match(job_text_norm: str, resume_text_norm: str, domain_cfg: Dict[str, Any]) -> Dict[str, Any]:
-    domains = (domain_cfg or {}).get("domains") or {}
-    if not domains:
+def overall_score(hits: Dict[str, DomainHits]) -> int:
+    return sum(int(h.score) for h in hits.values())
+
+
+def match_hits(
+    job_hits: Dict[str, DomainHits],
+    resume_hits: Dict[str, DomainHits],
+    domain_keys: Iterable[str],
+) -> Dict[str, Any]:
+    """
+    Job match derived from already scanned hit sets.
+    resume_hits may cover more domains than the job (e.g. a full-taxonomy scan);
+    only domain_keys are taken into account.
+    """
+    wanted = set(domain_keys)
+    if not wanted:
         return {"note": "no_domains"}
 
     job_total = 0
@@ -41,28 +44,23 @@ def compute_job_match(job_text_norm: str, resume_text_norm: str, domain_cfg: Dic
     missing_terms: List[Tuple[str, int, str]] = []
     resume_domain_score = 0
 
-    for _, dv in domains.items():
-        label = (dv or {}).get("label", "")
-        items = _domain_items(dv or {})
-        if not items:
+    # Taxonomy order (job_hits order), not detection order, like the per-domain loop it replaces.
+    for dk, jh in job_hits.items():
+        rh = resume_hits.get(dk)
+        if dk not in wanted or rh is None:
             continue
+        label = jh.label or ""
 
-        compiled = compile_patterns(items)
-
-        job_score, job_hits = score_text(job_text_norm, items, compiled)
-        res_score, res_hits = score_text(resume_text_norm, items, compiled)
-
-        job_total += int(job_score)
-        resume_domain_score += int(res_score)
+        job_total += int(jh.score)
+        resume_domain_score += int(rh.score)
 
-        job_map = {c: (w, dlab) for (c, w, dlab) in job_hits}
-        res_set = {c for (c, _, _) in res_hits}
+        res_set = {h.canonical for h in rh.hits}
 
-        for c, (w, dlab) in job_map.items():
-            if c in res_set:
-                matched_terms.append((c, int(w), dlab or label))
+        for h in jh.hits:
+            if h.canonical in res_set:
+                matched_terms.append((h.canonical, int(h.weight), h.domain_label or label))
             else:
-                missing_terms.append((c, int(w), dlab or label))
+                missing_terms.append((h.canonical, int(h.weight), h.domain_label or label))
 
     if job_total <= 0:
         return {"note": "job_has_no_weight"}
@@ -81,3 +79,72 @@ def compute_job_match(job_text_norm: str, resume_text_norm: str, domain_cfg: Dic
         "job_total_weight": int(job_total),
         "matched_weight": int(matched_w),
     }
+
+
+def compute_job_match(job_text_norm: str, resume_text_norm: str, index: SkillIndex) -> Dict[str, Any]:
+    return match_hits(index.scan(job_text_norm), index.scan(resume_text_norm), index.domains.keys())
+
+
+@dataclass(frozen=True)
+class PreparedJob:
+    """
+    Job-side match state, computed once per job and reused for every candidate.
+    Serializable via to_dict()/from_dict(); the compiled taxonomy subset is
+    re-attached from the SkillIndex on load.
+    """
+    job_file: str
+    index_key: str
+    domains: Tuple[str, ...]
+    job_hits: Dict[str, DomainHits]
+    total_weight: int
+    taxonomy: SkillIndex
+
+    def label(self, domain_key: str) -> str:
+        return self.taxonomy.label(domain_key)
+
+    def match(self, resume_hits: Dict[str, DomainHits]) -> Dict[str, Any]:
+        return match_hits(self.job_hits, resume_hits, self.domains)
+
+    def match_text(self, resume_text_norm: str) -> Dict[str, Any]:
+        # Only the job's domains are scanned; use match() when a full-taxonomy scan is at hand.
+        return self.match(self.taxonomy.scan(resume_text_norm))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_file": self.job_file,
+            "index_key": self.index_key,
+            "domains": list(self.domains),
+            "total_weight": self.total_weight,
+            "job_hits": hits_to_dict(self.job_hits),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], index: SkillIndex) -> "PreparedJob":
+        if data.get("index_key") != index.key:
+            raise ValueError("PreparedJob was built with a different skills.yaml version.")
+
+        domains = tuple(data.get("domains") or [])
+        job_hits = hits_from_dict(data.get("job_hits") or {})
+        return cls(
+            job_file=data.get("job_file", ""),
+            index_key=index.key,
+            domains=domains,
+            job_hits=job_hits,
+            total_weight=int(data.get("total_weight", 0)),
+            taxonomy=index.subset(domains),
+        )
+
+
+def prepare_job(job_text_norm: str, index: SkillIndex, job_file: Optional[str] = None) -> PreparedJob:
+    all_hits = index.scan(job_text_norm)
+    domains = tuple(d for (d, _, s) in domain_scores(all_hits) if s > 0)
+    wanted = set(domains)
+    job_hits = {dk: h for dk, h in all_hits.items() if dk in wanted}
+    return PreparedJob(
+        job_file=job_file or "",
+        index_key=index.key,
+        domains=domains,
+        job_hits=job_hits,
+        total_weight=sum(int(h.score) for h in job_hits.values()),
+        taxonomy=index.subset(domains),
+    )
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from talentscope.core.matcher import DomainHits, SkillMatcher
+from talentscope.skills.skills_loader import SkillItem, load_yaml
+
+
+@dataclass(frozen=True)
+class DomainIndex:
+    key: str
+    label: str
+    items: Tuple[SkillItem, ...]
+
+
+@dataclass(frozen=True)
+class SkillIndex:
+    """
+    Compiled, read-only view of skills.yaml.
+    Built once per taxonomy (keyed by content hash) and shared by every scoring call.
+    """
+    key: str
+    domains: Dict[str, DomainIndex]
+    matcher: SkillMatcher
+
+    def label(self, domain_key: str) -> str:
+        dom = self.domains.get(domain_key)
+        return dom.label if dom else domain_key
+
+    def subset(self, domain_keys: Iterable[str]) -> "SkillIndex":
+        wanted = set(domain_keys)
+        # The matcher is shared with the parent index, nothing is rebuilt.
+        return SkillIndex(
+            key=self.key,
+            domains={k: v for k, v in self.domains.items() if k in wanted},
+            matcher=self.matcher,
+        )
+
+    def scan(self, text_norm: str) -> Dict[str, DomainHits]:
+        """Single pass over text_norm; returns hits for every domain of this index."""
+        found = self.matcher.scan(text_norm, list(self.domains.keys()))
+        return {
+            dk: DomainHits(domain_key=dk, label=dom.label, hits=found[dk].hits)
+            for dk, dom in self.domains.items()
+        }
+
+    @property
+    def cfg(self) -> Dict[str, Any]:
+        # Same shape as load_yaml() output, for callers that still need the raw mapping.
+        return {"domains": {k: {"label": d.label, "items": list(d.items)} for k, d in self.domains.items()}}
+
+
+_INDEX_CACHE: Dict[str, SkillIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _cfg_fingerprint(cfg: Dict[str, Any]) -> str:
+    h = hashlib.sha256()
+    for dk, dv in ((cfg or {}).get("domains") or {}).items():
+        h.update(repr((dk, (dv or {}).get("label", dk))).encode("utf-8"))
+        for it in (dv or {}).get("items") or []:
+            h.update(repr(it).encode("utf-8"))
+    return h.hexdigest()
+
+
+def build_skill_index(cfg: Dict[str, Any], key: Optional[str] = None) -> SkillIndex:
+    domains: Dict[str, DomainIndex] = {}
+    all_items: List[SkillItem] = []
+    for dk, dv in ((cfg or {}).get("domains") or {}).items():
+        dv = dv or {}
+        items = dv.get("items") or dv.get("skills") or []
+        items = tuple(items) if isinstance(items, list) else ()
+        domains[dk] = DomainIndex(
+            key=dk,
+            label=dv.get("label", dk),
+            items=items,
+        )
+        all_items.extend(items)
+    return SkillIndex(key=key or _cfg_fingerprint(cfg), domains=domains, matcher=SkillMatcher(all_items))
+
+
+def skills_file_hash(skills_yaml: str) -> str:
+    p = Path(skills_yaml)
+    if not p.exists():
+        raise FileNotFoundError(f"skills.yaml not found: {skills_yaml}")
+    return hashlib.sha256(p.read_bytes()).hexdigest()
+
+
+def load_skill_index(skills_yaml: str) -> SkillIndex:
+    """
+    Returns the process-wide SkillIndex for the given skills.yaml.
+    The file is re-hashed on every call so edits are picked up without a restart.
+    """
+    key = skills_file_hash(skills_yaml)
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    index = build_skill_index(load_yaml(skills_yaml), key=key)
+    with _INDEX_LOCK:
+        return _INDEX_CACHE.setdefault(key, index)
+
+
+def clear_skill_index_cache() -> None:
+    with _INDEX_LOCK:
+        _INDEX_CACHE.clear()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Batched INSERT ... ON CONFLICT (file_name) DO UPDATE, shared by uploads, bulk ingest and reindex.
+import logging
+from typing import Any, Dict, List, Optional
+
+from talentscope.config import DBConfig
+from talentscope.db.database import get_engine, session_scope
+
+logger = logging.getLogger("talentscope.db")
+
+
+def _insert_for(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upsert is not supported on '{dialect}'")
+    return insert
+
+
+def bulk_upsert(model, rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> Dict[str, str]:
+    """
+    Writes rows (column dicts keyed by the unique file_name) in batches of batch_size,
+    one INSERT ... ON CONFLICT (file_name) DO UPDATE statement and commit per batch.
+    A later row with the same file_name wins. A failing batch is rolled back on its own.
+    Returns file_name -> "inserted" | "updated" | "error: ...".
+    """
+    if not rows:
+        return {}
+    batch_size = max(1, batch_size or DBConfig.UPSERT_BATCH_SIZE)
+
+    # ON CONFLICT cannot touch the same row twice in one statement
+    latest: Dict[str, Dict[str, Any]] = {}
+    for r in rows:
+        latest[r["file_name"]] = r
+    unique = list(latest.values())
+
+    insert = _insert_for(get_engine().dialect.name)
+    table = model.__table__
+    status: Dict[str, str] = {}
+
+    for i in range(0, len(unique), batch_size):
+        batch = unique[i:i + batch_size]
+        names = [r["file_name"] for r in batch]
+        columns = [c for c in batch[0] if c != "file_name"]
+        stmt = insert(table).values(batch)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.file_name],
+            set_={c: stmt.excluded[c] for c in columns},
+        )
+        try:
+            with session_scope() as db:
+                existing = set(
+                    db.execute(table.select().with_only_columns(table.c.file_name).where(table.c.file_name.in_(names))).scalars()
+                )
+                db.execute(stmt)
+            for n in names:
+                status[n] = "updated" if n in existing else "inserted"
+        except Exception as e:
+            logger.error(f"Upsert into {table.name} failed for {len(batch)} rows: {e}")
+            for n in names:
+                status[n] = f"error: {e}"
+    return status
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Dict, List, Optional
+
+from talentscope.db.bulk import bulk_upsert
+from talentscope.db.models import Candidate
+from talentscope.io.salary import parse_salary_range
+
+
+def candidate_values(
+    filename: str,
+    parsed_data: dict,
+    est_exp: int,
+    salary_expectation: Optional[str],
+    skills_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Flattened Candidate columns from CVParser output (same mapping as /cv/upload).
+    skills_key is the SkillIndex.key the skills were found with; rows without it are
+    never used for retrieval (see db.retrieval).
+    """
+    contact = parsed_data.get("contact", {})
+    edu_list = parsed_data.get("education", [])
+    last_school = edu_list[0].get("school") if edu_list else None
+    last_degree = edu_list[0].get("degree") if edu_list else None
+
+    exp_list = parsed_data.get("experience", [])
+    curr_title = exp_list[0].get("title") if exp_list else None
+    curr_company = exp_list[0].get("company") if exp_list else None
+
+    # Same midpoint as scan_pool computes from the salaries CSV
+    salary_min, salary_max = parse_salary_range(salary_expectation)
+    salary_mid = round((salary_min + salary_max) / 2.0, 2) if salary_min is not None and salary_max is not None else None
+
+    return {
+        "file_name": filename,
+        "name": contact.get("name"),
+        "email": contact.get("email"),
+        "phone": contact.get("phone"),
+        "location": None, # Parser might not extract location yet
+        "school": last_school,
+        "degree": last_degree,
+        "current_title": curr_title,
+        "current_company": curr_company,
+        "total_experience_years": est_exp,
+        "salary_expectation": salary_expectation,
+        "salary_mid_tl": salary_mid,
+        "skills": parsed_data.get("skills", []),
+        "skills_key": skills_key,
+        "full_json": parsed_data,
+    }
+
+
+def upsert_candidates(rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> Dict[str, str]:
+    """
+    Inserts or refreshes candidate rows (file_name is unique), batched.
+    Returns file_name -> "inserted" | "updated" | "error: ...".
+    """
+    return bulk_upsert(Candidate, rows, batch_size)
@@ -1,17 +1,84 @@
 # -*- coding: utf-8 -*-
-from sqlalchemy import create_engine
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from talentscope.config import DBConfig
 
-# Engine
-engine = create_engine(DBConfig.URL, echo=False)
+logger = logging.getLogger("talentscope.db")
+
+# Engine is created on first use: importing this module neither loads the DB driver
+# nor opens a connection, so the API starts even when Postgres is not up yet.
+_engine = None
+_engine_lock = threading.Lock()
+_tables_ready = False
+_last_init_attempt = 0.0
+# While Postgres is down, table creation is retried at most this often
+_INIT_RETRY_SECONDS = 5.0
 
-# SessionLocal
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
 
 # Base Model
 Base = declarative_base()
 
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                connect_args = {}
+                pool_args = {}
+                if DBConfig.URL.startswith("postgresql"):
+                    connect_args["connect_timeout"] = DBConfig.CONNECT_TIMEOUT
+                    pool_args = {
+                        "pool_size": DBConfig.POOL_SIZE,
+                        "max_overflow": DBConfig.MAX_OVERFLOW,
+                        "pool_timeout": DBConfig.POOL_TIMEOUT,
+                        "pool_recycle": DBConfig.POOL_RECYCLE,
+                    }
+                _engine = create_engine(
+                    DBConfig.URL,
+                    echo=False,
+                    connect_args=connect_args,
+                    # Pre-ping: connections dropped by a DB restart are replaced at checkout
+                    pool_pre_ping=DBConfig.POOL_PRE_PING,
+                    **pool_args,
+                )
+                _session_factory.configure(bind=_engine)
+    return _engine
+
+
+def SessionLocal():
+    """
+    New DB session. The first call creates the engine and the tables
+    (retried on later calls while the database is unreachable).
+    """
+    get_engine()
+    ensure_db()
+    return _session_factory()
+
+
+@contextmanager
+def session_scope():
+    """
+    Session for one unit of work: commits when the block succeeds, rolls back on error
+    and always returns the connection to the pool.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def get_db():
     """
     Dependency for FastAPI route handlers.
@@ -23,8 +90,56 @@ def get_db():
     finally:
         db.close()
 
+
 def init_db():
     """
     Creates tables if they don't exist.
     """
+    global _tables_ready
+    # Models register themselves on Base when imported
+    from talentscope.db import models  # noqa: F401
+
+    engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    if engine.dialect.name == "postgresql":
+        _upgrade_schema(engine)
+    _tables_ready = True
+
+
+# create_all only creates missing tables; columns/indexes added later are applied here (idempotent)
+_SCHEMA_UPGRADES = (
+    "ALTER TABLE candidates ADD COLUMN IF NOT EXISTS salary_mid_tl DOUBLE PRECISION",
+    "ALTER TABLE candidates ADD COLUMN IF NOT EXISTS skills_key VARCHAR",
+    "CREATE INDEX IF NOT EXISTS ix_candidates_skills_gin ON candidates USING gin (skills)",
+)
+
+
+def _upgrade_schema(engine) -> None:
+    with engine.begin() as conn:
+        for stmt in _SCHEMA_UPGRADES:
+            conn.execute(text(stmt))
+
+
+def ensure_db() -> bool:
+    global _last_init_attempt
+    if _tables_ready:
+        return True
+    now = time.monotonic()
+    if now - _last_init_attempt < _INIT_RETRY_SECONDS:
+        return False
+    _last_init_attempt = now
+    try:
+        init_db()
+        return True
+    except Exception as e:
+        logger.warning(f"Database not ready: {e}")
+        return False
+
+
+def ping() -> bool:
+    """Round trip to the database (health probe); creates the tables on first success."""
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+    if not _tables_ready:
+        init_db()
+    return True
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from talentscope.config import CacheConfig
+from talentscope.core.experience import estimate_experience_years
+from talentscope.core.matcher import DomainHits, hits_from_dict, hits_to_dict
+from talentscope.core.normalize import norm
+from talentscope.core.parser import CV_PARSER_VERSION, CVParser
+from talentscope.core.scoring import overall_score
+from talentscope.core.skill_index import SkillIndex
+from talentscope.io.extractors import EXTRACTOR_VERSION, FileSource, extract_file_content_cached, source_name, source_sha256
+from talentscope.profiling import stage
+
+logger = logging.getLogger("talentscope.features")
+
+# Any change in extraction, parsing or experience estimation invalidates stored features.
+FEATURE_VERSION = f"{EXTRACTOR_VERSION}:{CV_PARSER_VERSION}:exp1"
+
+
+def feature_version() -> str:
+    # estimate_experience_years counts up to the current year: rows expire when the year changes
+    return f"{FEATURE_VERSION}:y{datetime.now().year}"
+
+
+@dataclass
+class CandidateFeatures:
+    """Job-independent per-CV state; everything scan_pool needs before job scoring."""
+    raw_text: str
+    resume_hits: Dict[str, DomainHits]
+    overall_score: int
+    experience_years: int
+    parsed_data: Dict[str, Any]
+
+
+def compute_candidate_features(
+    raw_text: str,
+    index: SkillIndex,
+    timings: Optional[Dict[str, float]] = None,
+) -> CandidateFeatures:
+    with stage(timings, "norm"):
+        text_norm = norm(raw_text)
+    with stage(timings, "score_domains"):
+        resume_hits = index.scan(text_norm)
+        overall = overall_score(resume_hits)
+    with stage(timings, "estimate_experience"):
+        experience_years = estimate_experience_years(raw_text)
+    with stage(timings, "cv_parser"):
+        parsed_data = CVParser(raw_text).parse()
+    return CandidateFeatures(
+        raw_text=raw_text,
+        resume_hits=resume_hits,
+        overall_score=overall,
+        experience_years=experience_years,
+        parsed_data=parsed_data,
+    )
+
+
+class CandidateFeatureStore:
+    """
+    SQLite-backed store of CandidateFeatures.
+    Rows are keyed by (content_sha256, feature_version, taxonomy_key), so an edited CV,
+    a parser change, a new skills.yaml or a new calendar year simply misses and gets recomputed.
+    The first write under a new (feature_version, taxonomy_key) deletes the rows of every
+    other pair, which no lookup can reach any more.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._pruned_for: Optional[tuple] = None
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # Connections must not cross a fork (process-pool workers open their own).
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self) -> None:
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cv_features (
+                content_sha256 TEXT NOT NULL,
+                feature_version TEXT NOT NULL,
+                taxonomy_key TEXT NOT NULL,
+                file_name TEXT,
+                raw_text BLOB,
+                resume_hits TEXT,
+                overall_score INTEGER,
+                experience_years INTEGER,
+                parsed_json TEXT,
+                updated_at REAL,
+                PRIMARY KEY (content_sha256, feature_version, taxonomy_key)
+            )
+            """
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.commit()
+
+    def prune(self, taxonomy_key: str, version: Optional[str] = None) -> int:
+        """Deletes the rows of any other feature version or taxonomy; returns the number removed."""
+        current = (version or feature_version(), taxonomy_key)
+        conn = self._conn()
+        marker = json.dumps(current)
+        row = conn.execute("SELECT value FROM store_meta WHERE key = 'pruned_for'").fetchone()
+        removed = 0
+        if row is None or row[0] != marker:
+            removed = conn.execute(
+                "DELETE FROM cv_features WHERE feature_version != ? OR taxonomy_key != ?", current
+            ).rowcount
+            conn.execute("INSERT OR REPLACE INTO store_meta VALUES ('pruned_for', ?)", (marker,))
+            conn.commit()
+            if removed:
+                logger.info(f"Feature store: removed {removed} rows of older feature versions / taxonomies")
+        self._pruned_for = current
+        return removed
+
+    def get(self, content_sha256: str, taxonomy_key: str, version: Optional[str] = None) -> Optional[CandidateFeatures]:
+        try:
+            row = self._conn().execute(
+                "SELECT raw_text, resume_hits, overall_score, experience_years, parsed_json "
+                "FROM cv_features WHERE content_sha256 = ? AND feature_version = ? AND taxonomy_key = ?",
+                (content_sha256, version or feature_version(), taxonomy_key),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Feature store read failed: {e}")
+            return None
+        if row is None:
+            return None
+
+        raw_blob, hits_json, overall, exp_years, parsed_json = row
+        return CandidateFeatures(
+            raw_text=zlib.decompress(raw_blob).decode("utf-8"),
+            resume_hits=hits_from_dict(json.loads(hits_json)),
+            overall_score=int(overall),
+            experience_years=int(exp_years),
+            parsed_data=json.loads(parsed_json),
+        )
+
+    def put(
+        self,
+        content_sha256: str,
+        taxonomy_key: str,
+        file_name: str,
+        features: CandidateFeatures,
+        version: Optional[str] = None,
+    ) -> None:
+        version = version or feature_version()
+        if self._pruned_for != (version, taxonomy_key):
+            try:
+                self.prune(taxonomy_key, version)
+            except sqlite3.Error as e:
+                logger.warning(f"Feature store prune failed: {e}")
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cv_features VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    content_sha256,
+                    version,
+                    taxonomy_key,
+                    file_name,
+                    zlib.compress(features.raw_text.encode("utf-8")),
+                    json.dumps(hits_to_dict(features.resume_hits), ensure_ascii=False),
+                    int(features.overall_score),
+                    int(features.experience_years),
+                    json.dumps(features.parsed_data, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Feature store write failed: {e}")
+
+    def get_or_compute(
+        self,
+        file_path: FileSource,
+        index: SkillIndex,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> CandidateFeatures:
+        """
+        Features for a CV file: served from the store when the content is known,
+        otherwise extracted, computed and stored. Extraction errors propagate.
+        file_path may be an InMemoryFile (object-store pools).
+        """
+        # Taken before computing, so features are never stored under a later year than they used
+        version = feature_version()
+        with stage(timings, "hash"):
+            sha = source_sha256(file_path)
+        with stage(timings, "feature_store"):
+            cached = self.get(sha, index.key, version)
+        if cached is not None:
+            return cached
+
+        with stage(timings, "extract"):
+            raw = extract_file_content_cached(file_path, content_sha256=sha)
+        features = compute_candidate_features(raw, index, timings)
+        with stage(timings, "feature_store"):
+            self.put(sha, index.key, source_name(file_path), features, version)
+        return features
+
+
+_default_store: Optional[CandidateFeatureStore] = None
+_default_lock = threading.Lock()
+
+
+def get_feature_store() -> Optional[CandidateFeatureStore]:
+    global _default_store
+    if not CacheConfig.FEATURES_ENABLED:
+        return None
+    with _default_lock:
+        if _default_store is None:
+            _default_store = CandidateFeatureStore(CacheConfig.FEATURES_PATH)
+    return _default_store
+
+
+def load_candidate_features(
+    file_path: FileSource,
+    index: SkillIndex,
+    timings: Optional[Dict[str, float]] = None,
+) -> CandidateFeatures:
+    """
+    Feature-store backed when enabled, plain computation otherwise.
+    timings (optional) collects per-stage seconds, see talentscope.profiling.
+    """
+    store = get_feature_store()
+    if store is not None:
+        return store.get_or_compute(file_path, index, timings)
+    with stage(timings, "extract"):
+        raw = extract_file_content_cached(file_path)
+    return compute_candidate_features(raw, index, timings)
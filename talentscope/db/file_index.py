@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from talentscope.config import IndexConfig
+
+logger = logging.getLogger("talentscope.file_index")
+
+SORT_KEYS = ("created_at", "filename")
+ORDERS = ("asc", "desc")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw.decode("utf-8"))
+    except Exception:
+        raise InvalidCursor("Malformed cursor")
+    if sort == "created_at":
+        if not (isinstance(values, list) and len(values) == 2 and isinstance(values[0], (int, float)) and isinstance(values[1], str)):
+            raise InvalidCursor("Cursor does not match sort=created_at")
+    elif not (isinstance(values, list) and len(values) == 1 and isinstance(values[0], str)):
+        raise InvalidCursor("Cursor does not match sort=filename")
+    return values
+
+
+class FileIndex:
+    """
+    SQLite manifest of the files behind the listing endpoints (jobs, parsed JSON results).
+    Rows are keyed by (directory, filename), so listing a page is one indexed range query
+    instead of iterdir() + stat() over the whole directory. The manifest is a per-host file:
+    a directory is scanned again whenever its mtime differs from the one seen at the last
+    scan, so files created or deleted by other replicas or out of band are picked up.
+    Files written through the API (or `talentscope ingest`) are also recorded on write,
+    which covers writes within the filesystem's mtime granularity.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self) -> None:
+        conn = self._conn()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                directory TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                size_bytes INTEGER,
+                created_at REAL,
+                PRIMARY KEY (directory, filename)
+            );
+            CREATE INDEX IF NOT EXISTS files_by_created ON files (directory, created_at, filename);
+            CREATE TABLE IF NOT EXISTS indexed_dirs (
+                directory TEXT PRIMARY KEY,
+                scanned_at REAL,
+                dir_mtime_ns INTEGER
+            );
+            """
+        )
+        try:
+            # Manifests created before dir_mtime_ns: their directories are scanned again once
+            conn.execute("ALTER TABLE indexed_dirs ADD COLUMN dir_mtime_ns INTEGER")
+        except sqlite3.OperationalError:
+            pass
+        conn.commit()
+
+    @staticmethod
+    def _dir_mtime_ns(directory: Path) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _dir_key(directory: Path) -> str:
+        return str(Path(directory).resolve())
+
+    @staticmethod
+    def _row(dir_key: str, path: Path) -> Optional[Tuple[str, str, int, float]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (dir_key, path.name, st.st_size, st.st_ctime)
+
+    def add_many(self, paths: Iterable[Path]) -> None:
+        """Records (or refreshes) files after they were written."""
+        rows = []
+        for p in paths:
+            p = Path(p)
+            row = self._row(self._dir_key(p.parent), p)
+            if row is not None:
+                rows.append(row)
+        if not rows:
+            return
+        try:
+            conn = self._conn()
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", rows)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"File index write failed: {e}")
+
+    def add(self, path: Path) -> None:
+        self.add_many([path])
+
+    def rebuild(self, directory: Path, suffix: Optional[str] = None) -> int:
+        """Replaces the rows of one directory with a fresh scan; returns the file count."""
+        dir_key = self._dir_key(directory)
+        # Taken before the scan: a file created meanwhile makes the next listing scan again
+        dir_mtime = self._dir_mtime_ns(directory)
+        rows = []
+        if Path(directory).exists():
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name == ".gitkeep" or (suffix and not name.lower().endswith(suffix)):
+                        continue
+                    if entry.is_file():
+                        st = entry.stat()
+                        rows.append((dir_key, name, st.st_size, st.st_ctime))
+
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM files WHERE directory = ?", (dir_key,))
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", rows)
+            conn.execute("INSERT OR REPLACE INTO indexed_dirs VALUES (?, ?, ?)", (dir_key, time.time(), dir_mtime))
+        logger.info(f"Indexed {len(rows)} files of {directory}.")
+        return len(rows)
+
+    def _ensure_indexed(self, directory: Path, suffix: Optional[str]) -> str:
+        dir_key = self._dir_key(directory)
+        row = self._conn().execute("SELECT dir_mtime_ns FROM indexed_dirs WHERE directory = ?", (dir_key,)).fetchone()
+        if row is None or row[0] is None or row[0] != self._dir_mtime_ns(directory):
+            self.rebuild(directory, suffix)
+        return dir_key
+
+    def page(
+        self,
+        directory: Path,
+        suffix: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "created_at",
+        order: str = "desc",
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One page of a directory listing (keyset pagination); limit=None lists every file.
+        Returns (items, next_cursor); next_cursor is None on the last page.
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"sort must be one of {', '.join(SORT_KEYS)}")
+        if order not in ORDERS:
+            raise ValueError(f"order must be one of {', '.join(ORDERS)}")
+
+        dir_key = self._ensure_indexed(directory, suffix)
+        op, direction = ("<", "DESC") if order == "desc" else (">", "ASC")
+
+        where, params = "directory = ?", [dir_key]
+        if sort == "created_at":
+            if cursor:
+                where += f" AND (created_at, filename) {op} (?, ?)"
+                params += _decode_cursor(cursor, sort)
+            order_by = f"created_at {direction}, filename {direction}"
+        else:
+            if cursor:
+                where += f" AND filename {op} ?"
+                params += _decode_cursor(cursor, sort)
+            order_by = f"filename {direction}"
+
+        sql = f"SELECT filename, size_bytes, created_at FROM files WHERE {where} ORDER BY {order_by}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit + 1)
+        rows = self._conn().execute(sql, params).fetchall()
+
+        has_more = limit is not None and len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+        items = [
+            {
+                "filename": name,
+                "size_bytes": size,
+                "created_at": datetime.fromtimestamp(created).isoformat(),
+                "path": str(Path(directory) / name),
+            }
+            for (name, size, created) in rows
+        ]
+
+        next_cursor = None
+        if has_more and rows:
+            last_name, _, last_created = rows[-1]
+            next_cursor = _encode_cursor([last_created, last_name] if sort == "created_at" else [last_name])
+        return items, next_cursor
+
+
+_default_index: Optional[FileIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_file_index() -> FileIndex:
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = FileIndex(IndexConfig.PATH)
+    return _default_index
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.sql import func
 from talentscope.db.database import Base
@@ -49,11 +49,17 @@ class Candidate(Base):
     current_company = Column(String, nullable=True)
     total_experience_years = Column(Float, default=0.0)
     salary_expectation = Column(String, nullable=True)
+    salary_mid_tl = Column(Float, nullable=True) # Parsed from salary_expectation (SQL salary filter)
     
-    # Skills Flattened
+    # Skills Flattened (canonical taxonomy terms; GIN index for `skills && :job_skills` retrieval)
     skills = Column(ARRAY(String), nullable=True)
+    skills_key = Column(String, nullable=True) # SkillIndex.key the skills were scanned with
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Full JSON Backup (No HR Score as requested)
     full_json = Column(JSONB, nullable=True)
+
+    __table_args__ = (
+        Index("ix_candidates_skills_gin", "skills", postgresql_using="gin"),
+    )
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-from pymongo import MongoClient
-from pymongo.errors import PyMongoError
 from talentscope.config import MongoConfig
 import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List
 
 logger = logging.getLogger("talentscope.mongo")
 
@@ -11,38 +13,64 @@ class MatchMongoClient:
         self.client = None
         self.db = None
         self.collection = None
-        self._connect()
+        self._indexes_ready = False
+        # Connected on first use (pymongo is imported there too), not at import time
 
     def _connect(self):
+        from pymongo import MongoClient
+
         try:
             self.client = MongoClient(MongoConfig.URI, serverSelectionTimeoutMS=2000)
             self.db = self.client[MongoConfig.DB_NAME]
             self.collection = self.db[MongoConfig.COLLECTION_MATCHES]
             # Trigger a connection attempt to check availability
-            # self.client.admin.command('ping') 
+            # self.client.admin.command('ping')
             logger.info("MongoDB client initialized.")
         except Exception as e:
             logger.error(f"Failed to initialize MongoDB client: {e}")
             self.client = None
 
+    def ping(self) -> bool:
+        """Server round trip (health probe)."""
+        if self.client is None:
+            self._connect()
+        if self.client is None:
+            return False
+        self.client.admin.command("ping")
+        return True
+
+    def ensure_indexes(self) -> None:
+        """Match-log indexes (idempotent): per job / per candidate history, time range."""
+        if self._indexes_ready or self.collection is None:
+            return
+        from pymongo import ASCENDING, DESCENDING
+
+        self.collection.create_index([("job_id", ASCENDING), ("timestamp", DESCENDING)])
+        self.collection.create_index([("candidate_id", ASCENDING), ("timestamp", DESCENDING)])
+        self.collection.create_index([("timestamp", DESCENDING)])
+        self._indexes_ready = True
+
     def insert_match_results(self, documents: list) -> bool:
         """
-        Inserts a list of match result documents into MongoDB.
+        Inserts a list of match result documents into MongoDB (unordered: one bad
+        document does not stop the rest of the batch).
         """
-        if not self.collection:
+        from pymongo.errors import PyMongoError
+
+        # Collection objects do not support truth testing, compare with None
+        if self.collection is None:
             self._connect()
-            
-        if not self.collection:
+
+        if self.collection is None:
             logger.warning("MongoDB collection not available. Skipping insert.")
             return False
-            
+
         if not documents:
             return True
 
         try:
-            result = self.collection.insert_many(documents)
+            result = self.collection.insert_many(documents, ordered=False)
             logger.info(f"Inserted {len(result.inserted_ids)} match records into MongoDB.")
-            return True
         except PyMongoError as e:
             logger.error(f"MongoDB Insert Error: {e}")
             return False
@@ -50,5 +78,136 @@ class MatchMongoClient:
             logger.error(f"Unexpected MongoDB Error: {e}")
             return False
 
+        # Server is reachable: create the indexes once (a failure here never loses the batch)
+        try:
+            self.ensure_indexes()
+        except Exception as e:
+            logger.warning(f"MongoDB index creation failed: {e}")
+        return True
+
+
+_STOP = object()
+
+
+class MatchLogWriter:
+    """
+    Background writer for match logs. submit() only enqueues (never blocks the request);
+    a daemon thread batches documents and writes them with one unordered insert_many when
+    the batch is full or the oldest queued document is flush_seconds old.
+    When the queue is full (MongoDB slow or down) new documents are dropped and counted;
+    a failed batch is dropped too. shutdown() writes what is still queued.
+    """
+
+    def __init__(self, client: MatchMongoClient, batch_size: int, flush_seconds: float, max_queue: int):
+        self.client = client
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = max(0.0, flush_seconds)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="ts-mongo-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, documents: List[Dict[str, Any]]) -> int:
+        """Queues documents for writing; returns how many were accepted."""
+        accepted = 0
+        if not self._closed:
+            self._ensure_started()
+            for doc in documents:
+                try:
+                    self._queue.put_nowait(doc)
+                except queue.Full:
+                    break
+                accepted += 1
+
+        dropped = len(documents) - accepted
+        if dropped:
+            with self._lock:
+                self.dropped += dropped
+            logger.warning(f"Match log queue full or closed, dropped {dropped} documents.")
+        return accepted
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        ok = self.client.insert_match_results(batch)
+        with self._lock:
+            if ok:
+                self.written += len(batch)
+            else:
+                self.failed += len(batch)
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None # Flush interval reached
+
+            if isinstance(item, dict):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_seconds
+                if len(batch) < self.batch_size:
+                    continue
+
+            self._write(batch)
+            batch, deadline = [], None
+            if isinstance(item, threading.Event): # flush() barrier
+                item.set()
+            elif item is _STOP:
+                return
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Writes everything queued so far; False if it did not finish within timeout."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Match log queue still full at shutdown, pending documents are lost.")
+            return
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
 # Global instance
 mongo_client = MatchMongoClient()
+match_log_writer = MatchLogWriter(
+    mongo_client,
+    batch_size=MongoConfig.WRITER_BATCH_SIZE,
+    flush_seconds=MongoConfig.WRITER_FLUSH_SECONDS,
+    max_queue=MongoConfig.WRITER_QUEUE_MAX,
+)
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Candidate retrieval for /jobs/match: one indexed Postgres lookup picks the CVs worth scoring.
+# A CV can only reach a job fit score > 0 if it shares at least one canonical skill with the
+# job, so with a positive fit threshold the `skills && :job_skills` overlap (GIN index) drops
+# only CVs that the full scan would reject anyway.
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, FrozenSet, List, Optional
+
+from talentscope.config import RetrievalConfig
+from talentscope.core.scoring import PreparedJob
+
+if TYPE_CHECKING:
+    from talentscope.pipeline.filters import CandidateFilter
+
+logger = logging.getLogger("talentscope.retrieval")
+
+# iter_pool plan per CV file
+SCORE = "score"
+HOLD = "hold" # Shares a skill but fails the SQL predicates: scored only for the fallback
+SKIP = "skip"
+
+
+@dataclass(frozen=True)
+class Retrieval:
+    """
+    Result of retrieve_candidates (plain data, passed to scan_pool in worker processes).
+    - selected: file names sharing a job skill and passing the salary predicates,
+    - held_back: file names sharing a job skill but failing the predicates,
+    - covered: every file name with a row scanned by the current skills.yaml.
+    Files outside `covered` (not in Postgres yet, other taxonomy version) are scored as usual.
+    """
+    selected: FrozenSet[str]
+    held_back: FrozenSet[str] = frozenset()
+    covered: FrozenSet[str] = frozenset()
+    elapsed_ms: float = 0.0
+    job_skills: int = 0
+
+    def plan(self, filename: str) -> str:
+        if filename in self.selected or filename not in self.covered:
+            return SCORE
+        if filename in self.held_back:
+            return HOLD
+        return SKIP
+
+    def summary(self) -> dict:
+        return {
+            "source": "postgres",
+            "job_skills": self.job_skills,
+            "selected": len(self.selected),
+            "held_back": len(self.held_back),
+            "covered": len(self.covered),
+            "ms": self.elapsed_ms,
+        }
+
+
+def job_skill_terms(prepared_job: PreparedJob) -> List[str]:
+    """Canonical terms of the job's detected domains (the only ones match_hits can match)."""
+    wanted = set(prepared_job.domains)
+    terms = set()
+    for dk, hits in prepared_job.job_hits.items():
+        if dk in wanted:
+            terms.update(h.canonical for h in hits.hits)
+    return sorted(terms)
+
+
+def _predicates(filters: Optional["CandidateFilter"]):
+    from sqlalchemy import and_, or_, true
+
+    from talentscope.db.models import Candidate
+
+    if filters is None or not filters.active:
+        return true()
+
+    # Salary only: the stored experience is frozen at upload while the scan counts it up to
+    # the current year, so the experience filters are left to the scan.
+    # Rows without a stored salary stay in: the scan decides on them (the salaries CSV may know more)
+    conds = []
+    sal = Candidate.salary_mid_tl
+    if filters.min_salary is not None:
+        conds.append(or_(sal.is_(None), sal >= filters.min_salary))
+    if filters.max_salary is not None:
+        conds.append(or_(sal.is_(None), sal <= filters.max_salary))
+    return and_(*conds) if conds else true()
+
+
+def retrieve_candidates(
+    prepared_job: PreparedJob,
+    filters: Optional["CandidateFilter"] = None,
+    min_fit_score: float = 0.0,
+) -> Optional[Retrieval]:
+    """
+    Candidates to score for a job, from Postgres. Returns None (= scan the whole pool)
+    when retrieval is disabled or cannot be exact: non-Postgres database, fit threshold
+    <= 0 (CVs without shared skills would qualify), a job without skill terms, or a DB error.
+    """
+    if not RetrievalConfig.ENABLED or min_fit_score <= 0:
+        return None
+    terms = job_skill_terms(prepared_job)
+    if not terms:
+        return None
+
+    try:
+        from sqlalchemy import select
+
+        from talentscope.db.database import get_engine, session_scope
+        from talentscope.db.models import Candidate
+
+        if get_engine().dialect.name != "postgresql":
+            return None
+
+        t0 = time.perf_counter()
+        with session_scope() as db:
+            current = Candidate.skills_key == prepared_job.index_key
+            # Indexed lookup: skills && ARRAY[...] (GIN), predicates evaluated on the hits only
+            rows = db.execute(
+                select(Candidate.file_name, _predicates(filters).label("passes"))
+                .where(Candidate.skills.overlap(terms), current)
+            ).all()
+            covered = db.execute(select(Candidate.file_name).where(current)).scalars().all()
+    except Exception as e:
+        logger.warning(f"Candidate retrieval unavailable, scanning the whole pool: {e}")
+        return None
+
+    retrieval = Retrieval(
+        selected=frozenset(n for n, passes in rows if passes),
+        held_back=frozenset(n for n, passes in rows if not passes),
+        covered=frozenset(covered),
+        elapsed_ms=round((time.perf_counter() - t0) * 1000.0, 1),
+        job_skills=len(terms),
+    )
+    logger.info(
+        f"Retrieved {len(retrieval.selected)} of {len(retrieval.covered)} indexed candidates "
+        f"({len(terms)} job skills) in {retrieval.elapsed_ms} ms"
+    )
+    return retrieval
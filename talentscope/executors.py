@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from talentscope.config import ExecutorConfig
+
+logger = logging.getLogger("talentscope.executors")
+
+
+class ExecutorLayer:
+    """
+    Keeps blocking work off the event loop.
+    - run_io: thread pool for file copies, DB commits, object-store calls.
+    - run_cpu: process pool for extraction, parsing and scoring (functions and
+      arguments must be picklable, see talentscope.pipeline.tasks).
+    Each pool has its own concurrency limit; callers over the limit wait on the
+    event loop without blocking other requests.
+    - submit_cpu: the same process pool for plain threads (match queue workers).
+    - shared_dict: state (progress, cancel flags) shared by API threads and CPU tasks.
+    """
+
+    def __init__(
+        self,
+        io_workers: int,
+        io_concurrency: int,
+        cpu_workers: int,
+        cpu_concurrency: int,
+        cpu_mode: str = "process",
+    ):
+        self.io_workers = max(1, io_workers)
+        self.cpu_workers = max(1, cpu_workers)
+        self.io_concurrency = max(1, io_concurrency)
+        self.cpu_concurrency = max(1, cpu_concurrency)
+        self.cpu_mode = cpu_mode
+        self._io_pool: Optional[Executor] = None
+        self._cpu_pool: Optional[Executor] = None
+        self._io_sem: Optional[asyncio.Semaphore] = None
+        self._cpu_sem: Optional[asyncio.Semaphore] = None
+        self._manager = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "ExecutorLayer":
+        return cls(
+            io_workers=ExecutorConfig.IO_WORKERS,
+            io_concurrency=ExecutorConfig.IO_CONCURRENCY,
+            cpu_workers=ExecutorConfig.CPU_WORKERS,
+            cpu_concurrency=ExecutorConfig.CPU_CONCURRENCY,
+            cpu_mode=ExecutorConfig.CPU_MODE,
+        )
+
+    @property
+    def io_pool(self) -> Executor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="ts-io")
+        return self._io_pool
+
+    @property
+    def cpu_pool(self) -> Executor:
+        # Also reached from match queue threads, hence the lock
+        with self._lock:
+            if self._cpu_pool is None:
+                if self.cpu_mode == "thread":
+                    self._cpu_pool = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix="ts-cpu")
+                else:
+                    # spawn: the server process has threads (event loop, I/O pool), forking it is unsafe.
+                    self._cpu_pool = ProcessPoolExecutor(
+                        max_workers=self.cpu_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                logger.info(f"CPU executor started ({self.cpu_mode}, {self.cpu_workers} workers).")
+            return self._cpu_pool
+
+    def shared_dict(self, **initial) -> Any:
+        """
+        A dict CPU tasks and API threads both see: a Manager dict proxy (one spawn server
+        process, started on first use) for the process pool, a plain dict in thread mode
+        (single dict operations are atomic there).
+        """
+        if self.cpu_mode == "thread":
+            return dict(initial)
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.get_context("spawn").Manager()
+        return self._manager.dict(initial)
+
+    async def _run(self, pool: Executor, sem: asyncio.Semaphore, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        async with sem:
+            return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+
+    async def run_io(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._io_sem is None:
+            self._io_sem = asyncio.Semaphore(self.io_concurrency)
+        return await self._run(self.io_pool, self._io_sem, fn, *args, **kwargs)
+
+    async def run_cpu(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._cpu_sem is None:
+            self._cpu_sem = asyncio.Semaphore(self.cpu_concurrency)
+        return await self._run(self.cpu_pool, self._cpu_sem, fn, *args, **kwargs)
+
+    def submit_cpu(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        # Not bounded by the async semaphore: callers (match queue threads) are few already
+        return self.cpu_pool.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in (self._io_pool, self._cpu_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        self._io_pool = None
+        self._cpu_pool = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+
+# Global instance
+executors = ExecutorLayer.from_config()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Startup health probes and startup-time report for the API lifespan hook.
+# Backing services are connected lazily on first use; the probes only tell whether
+# they are reachable (and create the Postgres tables early when they are).
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+from talentscope.config import StartupConfig
+from talentscope.executors import executors
+
+logger = logging.getLogger("talentscope.startup")
+
+
+def _probe_postgres() -> bool:
+    from talentscope.db.database import ping
+
+    return ping()
+
+
+def _probe_mongo() -> bool:
+    from talentscope.db.mongo_client import mongo_client
+
+    return mongo_client.ping()
+
+
+def _probe_minio() -> bool:
+    from talentscope.io.minio_client import object_store
+
+    return object_store.ping()
+
+
+PROBES: Dict[str, Callable[[], bool]] = {
+    "postgres": _probe_postgres,
+    "mongo": _probe_mongo,
+    "minio": _probe_minio,
+}
+
+
+async def _run_probe(name: str, fn: Callable[[], bool], timeout: float) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    try:
+        ok = bool(await asyncio.wait_for(executors.run_io(fn), timeout=timeout))
+        error = None if ok else "not initialized"
+    except asyncio.TimeoutError:
+        ok, error = False, f"timeout after {timeout}s"
+    except Exception as e:
+        ok, error = False, str(e)
+    return {"ok": ok, "ms": round((time.perf_counter() - t0) * 1000.0, 1), "error": error}
+
+
+async def run_probes(timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """All probes concurrently; each one bounded by timeout seconds."""
+    timeout = StartupConfig.PROBE_TIMEOUT_SECONDS if timeout is None else timeout
+    results = await asyncio.gather(*(_run_probe(n, fn, timeout) for n, fn in PROBES.items()))
+    return dict(zip(PROBES.keys(), results))
+
+
+class StartupReport:
+    """
+    How long this replica took to become ready:
+    - import_ms: importing the API module (measured from its first line),
+    - ready_ms: import start -> lifespan startup done (app accepts requests),
+    - probes: per-service reachability and latency (filled in when they finish;
+      in "background" mode that can be after ready).
+    """
+
+    def __init__(self, import_started: float, import_finished: float):
+        self.import_started = import_started
+        self.import_ms = round((import_finished - import_started) * 1000.0, 1)
+        self.ready_ms: Optional[float] = None
+        self.probes: Dict[str, Dict[str, Any]] = {}
+        self.probes_ms: Optional[float] = None
+        self.mode = StartupConfig.PROBES
+
+    def mark_ready(self) -> None:
+        self.ready_ms = round((time.perf_counter() - self.import_started) * 1000.0, 1)
+
+    async def probe(self) -> Dict[str, Dict[str, Any]]:
+        t0 = time.perf_counter()
+        self.probes = await run_probes()
+        self.probes_ms = round((time.perf_counter() - t0) * 1000.0, 1)
+        return self.probes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "probe_mode": self.mode,
+            "import_ms": self.import_ms,
+            "ready_ms": self.ready_ms,
+            "probes_ms": self.probes_ms,
+            "probes": self.probes,
+        }
+
+    def log(self, event: str = "startup") -> None:
+        # One JSON line, same shape as /health "startup"
+        logger.info(json.dumps({"event": event, **self.to_dict()}, ensure_ascii=False))
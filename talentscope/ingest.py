@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+# Bulk CV ingestion: many files or ZIP archives in one call.
+# Same steps as /cv/upload (store, object store, salary CSV, parse, JSON, Postgres), batched:
+# files are parsed in parallel, object-store uploads run concurrently while parsing,
+# salaries are appended in one write and candidates go to Postgres in batched upserts.
+import io
+import json
+import logging
+import os
+import shutil
+import time
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from talentscope.config import IngestConfig
+
+logger = logging.getLogger("talentscope.ingest")
+
+CV_EXTENSIONS = {".pdf", ".docx"}
+
+# A source is a path on disk, or (filename, binary file object) for uploads.
+Source = Union[str, Path, Tuple[str, BinaryIO]]
+
+
+class IngestLimitError(ValueError):
+    pass
+
+
+@dataclass
+class IngestItem:
+    filename: str
+    source: str # Upload / archive the file came from
+    status: str = "pending" # success | partial_success | failed | skipped
+    stored: bool = False
+    parsed: bool = False
+    is_new: bool = False
+    salary: Optional[str] = None
+    object_store: str = "disabled" # uploaded | exists (same content already stored) | failed | disabled
+    db: str = "disabled" # inserted | updated | error: ... | disabled
+    error: Optional[str] = None
+    estimated_experience: Optional[int] = None
+    skills_found: int = 0
+    path: Optional[str] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("path")
+        data.pop("is_new")
+        return data
+
+
+def _clean_name(name: str) -> str:
+    # Archive members and client filenames: keep the base name only (no directories, no "..").
+    return Path(name.replace("\\", "/")).name.strip()
+
+
+def _zip_members(zf: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    return [m for m in zf.infolist() if not m.is_dir() and not m.filename.startswith("__MACOSX/")]
+
+
+def _measure(name: str, fobj: BinaryIO) -> Tuple[int, int]:
+    """(files, expanded bytes) that _iter_members yields for one source; rewinds fobj."""
+    try:
+        if not name.lower().endswith(".zip"):
+            return 1, fobj.seek(0, io.SEEK_END)
+        try:
+            with zipfile.ZipFile(fobj) as zf:
+                members = _zip_members(zf)
+        except zipfile.BadZipFile:
+            return 1, 0
+        return len(members), sum(m.file_size for m in members)
+    finally:
+        fobj.seek(0)
+
+
+def _check_limits(sources: List[Source]) -> None:
+    """
+    Raises IngestLimitError when the batch as a whole (ZIPs expanded) has more than
+    MAX_FILES files or more than MAX_UNCOMPRESSED_MB; reads ZIP directories only.
+    """
+    files = size = 0
+    for src in sources:
+        if isinstance(src, tuple):
+            n, b = _measure(src[0], src[1])
+        else:
+            with open(src, "rb") as f:
+                n, b = _measure(str(src), f)
+        files += n
+        size += b
+    if files > IngestConfig.MAX_FILES:
+        raise IngestLimitError(f"{files} files in one batch (limit {IngestConfig.MAX_FILES})")
+    if size > IngestConfig.MAX_UNCOMPRESSED_MB * 1024 * 1024:
+        raise IngestLimitError(
+            f"Batch expands to {size // (1024 * 1024)} MB (limit {IngestConfig.MAX_UNCOMPRESSED_MB} MB)"
+        )
+
+
+def _iter_members(name: str, fobj: BinaryIO) -> Iterator[Tuple[str, Optional[BinaryIO], str]]:
+    """Yields (filename, readable, source) for a single file or for each file of a ZIP."""
+    if not name.lower().endswith(".zip"):
+        yield _clean_name(name), fobj, name
+        return
+
+    try:
+        zf = zipfile.ZipFile(fobj)
+    except zipfile.BadZipFile:
+        yield _clean_name(name), None, name
+        return
+
+    with zf:
+        for m in _zip_members(zf):
+            with zf.open(m) as member:
+                yield _clean_name(m.filename), member, name
+
+
+def _copy_to(src: BinaryIO, destination: Path) -> None:
+    with destination.open("wb") as buffer:
+        shutil.copyfileobj(src, buffer)
+
+
+def stage_sources(sources: List[Source], cv_dir: Path) -> List[IngestItem]:
+    """
+    Writes every CV of the sources into cv_dir (ZIPs are expanded, other types skipped).
+    Duplicate names inside one batch keep the first file. The batch limits are checked
+    first, so a rejected batch writes nothing.
+    """
+    _check_limits(sources)
+    items: List[IngestItem] = []
+    seen = set()
+
+    for src in sources:
+        if isinstance(src, tuple):
+            name, fobj = src
+            opened = None
+        else:
+            name = str(src)
+            fobj = opened = open(src, "rb")
+
+        try:
+            for filename, member, origin in _iter_members(name, fobj):
+                item = IngestItem(filename=filename, source=origin)
+                items.append(item)
+
+                if member is None:
+                    item.status, item.error = "failed", "invalid ZIP archive"
+                    continue
+                ext = Path(filename).suffix.lower()
+                if not filename or filename.startswith(".") or ext not in CV_EXTENSIONS:
+                    item.status, item.error = "skipped", f"unsupported file type '{ext}'"
+                    continue
+                if filename in seen:
+                    item.status, item.error = "skipped", "duplicate file name in batch"
+                    continue
+                seen.add(filename)
+
+                destination = cv_dir / filename
+                item.is_new = not destination.exists()
+                try:
+                    _copy_to(member, destination)
+                    item.stored, item.path = True, str(destination)
+                except Exception as e:
+                    item.status, item.error = "failed", f"file save error: {e}"
+        finally:
+            if opened is not None:
+                opened.close()
+
+    return items
+
+
+def _parse_all(paths: List[str], skills_yaml: str, cpu_pool: Optional[Executor], workers: int) -> List[Tuple[Optional[dict], Optional[str]]]:
+    from talentscope.pipeline.tasks import parse_cv_file_safe
+
+    if not paths:
+        return []
+    args = (paths, [skills_yaml] * len(paths))
+
+    if cpu_pool is not None:
+        # A few chunks per worker: low IPC overhead, slow PDFs still spread out
+        chunksize = max(1, min(32, len(paths) // (max(1, workers) * 4)))
+        return list(cpu_pool.map(parse_cv_file_safe, *args, chunksize=chunksize))
+
+    workers = min(workers, len(paths))
+    if workers <= 1:
+        return [parse_cv_file_safe(p, skills_yaml) for p in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, min(32, len(paths) // (workers * 4)))
+        return list(pool.map(parse_cv_file_safe, *args, chunksize=chunksize))
+
+
+def ingest_cvs(
+    sources: List[Source],
+    cv_dir: str,
+    skills_yaml: str,
+    salaries_csv: Optional[str] = None,
+    salary_inputs: Optional[Dict[str, str]] = None,
+    json_dir: Optional[str] = None,
+    store_db: bool = True,
+    bucket: Optional[str] = None,
+    cpu_pool: Optional[Executor] = None,
+    workers: Optional[int] = None,
+    upload_concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Ingests a batch of CVs into the pool and returns a per-file status summary.
+    - sources: file paths or (filename, file object); ZIP archives are expanded.
+    - salary_inputs: filename -> raw salary input (see io.salary.read_salary_inputs),
+      appended to salaries_csv and stored with the candidate.
+    - cpu_pool: executor for parsing (the API passes its shared pool, `workers` is then
+      only used for chunking); otherwise a process pool with `workers` processes
+      (0 = one per CPU, 1 = in process).
+    - bucket: object-store bucket to upload to (None = no upload).
+    """
+    from talentscope.io.salary import append_salaries_to_csv
+
+    t0 = time.perf_counter()
+    pool_dir = Path(cv_dir)
+    pool_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = Path(json_dir) if json_dir else pool_dir / "json_results"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    salary_inputs = salary_inputs or {}
+    if workers is None:
+        workers = IngestConfig.PARSE_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    items = stage_sources(sources, pool_dir)
+    stored = [it for it in items if it.stored]
+
+    # 1. Object store uploads run in the background while the batch is parsed
+    uploader = None
+    uploads = {}
+    if bucket and stored:
+        from talentscope.config import MinioConfig
+        from talentscope.io.minio_client import ObjectUploader, object_store
+
+        uploader = ObjectUploader(
+            object_store,
+            max_workers=upload_concurrency or IngestConfig.UPLOAD_CONCURRENCY,
+            retries=MinioConfig.UPLOAD_RETRIES,
+            backoff_seconds=MinioConfig.UPLOAD_BACKOFF_SECONDS,
+        )
+        uploads = {it.filename: uploader.submit(bucket, it.path, it.filename) for it in stored}
+
+    try:
+        # 2. Salaries (one append for the whole batch)
+        salary_rows = []
+        for it in stored:
+            value = salary_inputs.get(it.filename)
+            if value:
+                it.salary = value
+                salary_rows.append((it.filename, value))
+        if salaries_csv and salary_rows:
+            append_salaries_to_csv(Path(salaries_csv), salary_rows)
+
+        # 3. Parse (extraction, CVParser, skill scan; fills the feature store)
+        parsed = _parse_all([it.path for it in stored], skills_yaml, cpu_pool, workers)
+
+        # 4. JSON results (recorded in the listing index in one write)
+        done = []
+        json_paths = []
+        for it, (data, err) in zip(stored, parsed):
+            if data is None:
+                it.error = f"parsing failed: {err}"
+                continue
+            it.parsed = True
+            data["salary"] = it.salary
+            it.estimated_experience = data.get("estimated_experience", 0)
+            it.skills_found = len(data.get("skills", []))
+            try:
+                json_path = out_dir / (Path(it.filename).stem + ".json")
+                with json_path.open("w", encoding="utf-8") as jf:
+                    json.dump(data, jf, indent=2, ensure_ascii=False)
+                json_paths.append(json_path)
+            except Exception as e:
+                it.error = f"JSON save error: {e}"
+            done.append((it, data))
+        if json_paths:
+            from talentscope.db.file_index import get_file_index
+
+            get_file_index().add_many(json_paths)
+
+        # 5. Postgres, batched upsert
+        if store_db and done:
+            from talentscope.core.skill_index import load_skill_index
+            from talentscope.db.candidates import candidate_values, upsert_candidates
+
+            skills_key = load_skill_index(skills_yaml).key
+            db_status = upsert_candidates([
+                candidate_values(it.filename, data, it.estimated_experience, it.salary, skills_key) for it, data in done
+            ])
+            for it in stored:
+                if it.filename in db_status:
+                    it.db = db_status[it.filename]
+
+        # 6. Wait for the uploads
+        for it in stored:
+            fut = uploads.get(it.filename)
+            if fut is None:
+                continue
+            try:
+                it.object_store = fut.result()
+            except Exception as e:
+                it.object_store = "failed"
+                logger.error(f"Object store upload error ({it.filename}): {e}")
+    finally:
+        if uploader is not None:
+            uploader.shutdown(wait=True)
+
+    for it in stored:
+        ok = it.parsed and it.error is None and not it.db.startswith("error")
+        it.status = "success" if ok else "partial_success"
+
+    counts: Dict[str, int] = {}
+    for it in items:
+        counts[it.status] = counts.get(it.status, 0) + 1
+
+    names = {it.filename for it in stored}
+    summary = {
+        "total_files": len(items),
+        "counts": counts,
+        "salaries_applied": sum(1 for it in stored if it.salary),
+        "salaries_unmatched": sorted(n for n in salary_inputs if n not in names),
+        "elapsed_s": round(time.perf_counter() - t0, 3),
+        "files": [it.to_dict() for it in items],
+    }
+    logger.info(
+        f"Ingested {len(items)} files in {summary['elapsed_s']}s: "
+        + ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+    )
+    return {"summary": summary, "items": items}
+
+
+def reindex_candidates(
+    cv_dir: str,
+    skills_yaml: str,
+    salaries_csv: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Re-parses every CV of the pool and upserts its Postgres row (e.g. after a skills.yaml
+    change, so the rows are used by candidate retrieval again). Salaries come from the pool
+    salaries CSV. Works batch by batch: parse batch_size CVs in parallel, one upsert.
+    Returns counts: inserted / updated / parse_failed / error.
+    """
+    from talentscope.config import DBConfig
+    from talentscope.core.skill_index import load_skill_index
+    from talentscope.db.candidates import candidate_values, upsert_candidates
+    from talentscope.pipeline.pipeline import list_pool_files
+
+    t0 = time.perf_counter()
+    files = list_pool_files(cv_dir)
+    salary_inputs = read_salary_file(salaries_csv) if salaries_csv and Path(salaries_csv).exists() else {}
+    skills_key = load_skill_index(skills_yaml).key
+    batch_size = max(1, batch_size or DBConfig.UPSERT_BATCH_SIZE)
+    if workers is None:
+        workers = IngestConfig.PARSE_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(files)))
+
+    counts: Dict[str, int] = {}
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for i in range(0, len(files), batch_size):
+            batch = files[i:i + batch_size]
+            rows = []
+            for path, (data, err) in zip(batch, _parse_all(batch, skills_yaml, pool, workers)):
+                if data is None:
+                    counts["parse_failed"] = counts.get("parse_failed", 0) + 1
+                    logger.warning(f"Reindex parse error ({Path(path).name}): {err}")
+                    continue
+                name = Path(path).name
+                salary = salary_inputs.get(name)
+                data["salary"] = salary
+                rows.append(candidate_values(name, data, data.get("estimated_experience", 0), salary, skills_key))
+            for status in upsert_candidates(rows, batch_size).values():
+                key = "error" if status.startswith("error") else status
+                counts[key] = counts.get(key, 0) + 1
+            logger.info(f"Reindexed {min(i + batch_size, len(files))}/{len(files)} CVs.")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {
+        "total_files": len(files),
+        "counts": counts,
+        "skills_key": skills_key,
+        "elapsed_s": round(time.perf_counter() - t0, 3),
+    }
+
+
+def read_salary_file(path_or_bytes: Union[str, bytes]) -> Dict[str, str]:
+    from talentscope.io.salary import read_salary_inputs
+
+    if isinstance(path_or_bytes, bytes):
+        return read_salary_inputs(io.StringIO(path_or_bytes.decode("utf-8-sig", errors="ignore")))
+    with open(path_or_bytes, "r", encoding="utf-8-sig", errors="ignore", newline="") as f:
+        return read_salary_inputs(f)
@@ -1,12 +1,56 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple, Union
+
+from talentscope.config import CacheConfig
+
+logger = logging.getLogger("talentscope.extractors")
+
+# Bump whenever extraction output can change (extractor logic, library swap, ...).
+# Cached texts from older versions are never read again and age out via LRU eviction.
+EXTRACTOR_VERSION = "1"
+
+
+@dataclass(frozen=True)
+class InMemoryFile:
+    """
+    File content already in memory (CVs fetched from the object store). Extraction reads
+    the buffer directly, no temp file. data=None: the object could not be read.
+    """
+    name: str
+    data: Optional[bytes]
+
+    def content(self) -> bytes:
+        if self.data is None:
+            raise OSError(f"'{self.name}' could not be read from the object store")
+        return self.data
+
+
+# A file path, or content fetched into memory
+FileSource = Union[str, InMemoryFile]
+
+
+def source_name(src: FileSource) -> str:
+    return src.name if isinstance(src, InMemoryFile) else Path(src).name
+
+
+def _readable(path):
+    # Paths are passed as str, in-memory buffers (BytesIO) as they are
+    return path if hasattr(path, "read") else str(path)
 
 
 def extract_text_from_pdf(path: Path) -> str:
     from pdfminer.high_level import extract_text
     try:
-        return extract_text(str(path)) or ""
+        return extract_text(_readable(path)) or ""
     except Exception:
         return ""
 
@@ -14,7 +58,7 @@ def extract_text_from_pdf(path: Path) -> str:
 def extract_text_from_docx(path: Path) -> str:
     from docx import Document
     try:
-        doc = Document(str(path))
+        doc = Document(_readable(path))
         parts: List[str] = []
         for p in doc.paragraphs:
             if p.text:
@@ -50,7 +94,190 @@ def extract_file_content(file_path: str) -> str:
     raise ValueError(f"Unsupported file type: {suf}. Only .pdf, .docx, and .txt are supported.")
 
 
+def extract_bytes_content(data: bytes, filename: str) -> str:
+    """extract_file_content for content in memory; filename only selects the extractor."""
+    suf = Path(filename).suffix.lower()
+    if suf == ".pdf":
+        return extract_text_from_pdf(io.BytesIO(data))
+    if suf == ".docx":
+        return extract_text_from_docx(io.BytesIO(data))
+    if suf == ".txt":
+        return data.decode("utf-8", errors="ignore")
+    raise ValueError(f"Unsupported file type: {suf}. Only .pdf, .docx, and .txt are supported.")
+
+
+def extract_source_content(src: FileSource) -> str:
+    if isinstance(src, InMemoryFile):
+        return extract_bytes_content(src.content(), src.name)
+    return extract_file_content(src)
+
+
 def extract_resume_text(file_path: str) -> str:
     """Wrapper for backward compatibility, though extract_file_content covers all."""
     return extract_file_content(file_path)
 
+
+def file_sha256(file_path: str, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def source_sha256(src: FileSource) -> str:
+    if isinstance(src, InMemoryFile):
+        return hashlib.sha256(src.content()).hexdigest()
+    return file_sha256(src)
+
+
+class ExtractionCache:
+    """
+    On-disk cache of extracted text, keyed by file content hash + extractor version.
+    Writes are atomic (temp file + rename); total size is bounded with LRU eviction
+    (entry mtime is refreshed on every hit).
+    Each process tracks the size it writes and re-reads the directory total every
+    RESYNC_SECONDS, so writes of other processes (spawn workers) count within that delay.
+    """
+
+    RESYNC_SECONDS = 30.0
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._synced_at = 0.0
+
+    def key_for(self, content_sha256: str, suffix: str) -> str:
+        return hashlib.sha256(f"{EXTRACTOR_VERSION}:{suffix.lower()}:{content_sha256}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        p = self._entry_path(key)
+        try:
+            text = p.read_text(encoding="utf-8")
+        except (FileNotFoundError, OSError):
+            return None
+        try:
+            os.utime(p)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        p = self._entry_path(key)
+        data = text.encode("utf-8")
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                replaced = p.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            fd, tmp = tempfile.mkstemp(dir=str(p.parent), prefix=".tmp_")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, p)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+            return
+
+        with self._lock:
+            if self._size is not None:
+                self._size += len(data) - replaced
+            self._evict_if_needed()
+
+    def _entries(self) -> List[Tuple[str, os.stat_result]]:
+        out = []
+        if not self.cache_dir.exists():
+            return out
+        for sub in os.scandir(self.cache_dir):
+            if not sub.is_dir():
+                continue
+            for e in os.scandir(sub.path):
+                if e.is_file() and e.name.endswith(".txt"):
+                    try:
+                        out.append((e.path, e.stat()))
+                    except OSError:
+                        pass
+        return out
+
+    def _evict_if_needed(self) -> None:
+        if self._size is None or time.monotonic() - self._synced_at >= self.RESYNC_SECONDS:
+            self._size = sum(st.st_size for _, st in self._entries())
+            self._synced_at = time.monotonic()
+        if self._size <= self.max_bytes:
+            return
+
+        entries = sorted(self._entries(), key=lambda x: x[1].st_mtime)
+        total = sum(st.st_size for _, st in entries)
+        # Evict down to 90% so we don't rescan the directory on every write.
+        target = int(self.max_bytes * 0.9)
+        for path, st in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= st.st_size
+            except OSError:
+                pass
+        self._size = total
+        self._synced_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _ in self._entries():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+
+_default_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    global _default_cache
+    if not CacheConfig.EXTRACT_ENABLED:
+        return None
+    if _default_cache is None:
+        _default_cache = ExtractionCache(CacheConfig.EXTRACT_DIR, CacheConfig.EXTRACT_MAX_MB * 1024 * 1024)
+    return _default_cache
+
+
+def extract_file_content_cached(
+    file_path: FileSource,
+    cache: Optional[ExtractionCache] = None,
+    content_sha256: Optional[str] = None,
+) -> str:
+    """
+    Same as extract_file_content, but unchanged files (same SHA-256) are served from
+    the extraction cache instead of being parsed again.
+    Pass content_sha256 when the caller already hashed the file.
+    file_path may also be an InMemoryFile (extracted from its buffer).
+    """
+    cache = cache or get_extraction_cache()
+    if cache is None:
+        return extract_source_content(file_path)
+
+    suffix = Path(source_name(file_path)).suffix
+    key = cache.key_for(content_sha256 or source_sha256(file_path), suffix)
+    text = cache.get(key)
+    if text is not None:
+        return text
+
+    text = extract_source_content(file_path)
+    if text:
+        # Empty output usually means a failed parse; don't pin it in the cache.
+        cache.put(key, text)
+    return text
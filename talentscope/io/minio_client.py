@@ -1,21 +1,98 @@
 # -*- coding: utf-8 -*-
 import logging
-from minio import Minio
-from minio.error import S3Error
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
 from talentscope.config import MinioConfig
 
 logger = logging.getLogger("talentscope.minio")
 
-class MinioHandler:
+# store_file / ObjectUploader outcomes
+UPLOADED = "uploaded"
+EXISTS = "exists" # Same content already stored under that name, upload skipped
+FAILED = "failed"
+
+
+class ObjectStoreBase:
+    """
+    Upload logic shared by the backends: buckets are checked once per process, and an
+    object whose stored sha256 equals the local file's is not uploaded again.
+    Backends implement _check_bucket, object_sha256 and _put (uploads) and
+    list_objects / get_bytes (reads, used by object-store CV pools).
+    """
+
+    def __init__(self):
+        self._ready_buckets = set()
+        self._bucket_lock = threading.Lock()
+
+    def ensure_bucket(self, bucket_name: str) -> None:
+        if bucket_name in self._ready_buckets:
+            return
+        with self._bucket_lock:
+            if bucket_name not in self._ready_buckets:
+                self._check_bucket(bucket_name)
+                self._ready_buckets.add(bucket_name)
+
+    def store_file(self, bucket_name: str, file_path: str, object_name: str) -> str:
+        """Uploads unless the same content is already there; returns UPLOADED or EXISTS, raises on errors."""
+        from talentscope.io.extractors import file_sha256
+
+        self.ensure_bucket(bucket_name)
+        sha256 = file_sha256(file_path)
+        if self.object_sha256(bucket_name, object_name) == sha256:
+            return EXISTS
+        self._put(bucket_name, file_path, object_name, sha256)
+        return UPLOADED
+
+    def upload_file(self, bucket_name: str, file_path: str, object_name: str) -> bool:
+        """
+        Uploads a file to the specified bucket.
+        Returns True if successful (or already stored), False otherwise.
+        """
+        try:
+            status = self.store_file(bucket_name, file_path, object_name)
+            logger.info(f"File '{object_name}' {status} in bucket '{bucket_name}'.")
+            return True
+        except Exception as e:
+            logger.error(f"Object store upload error ({object_name}): {e}")
+            return False
+
+    def _check_bucket(self, bucket_name: str) -> None:
+        raise NotImplementedError
+
+    def object_sha256(self, bucket_name: str, object_name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def _put(self, bucket_name: str, file_path: str, object_name: str, sha256: str) -> None:
+        raise NotImplementedError
+
+    def list_objects(self, bucket_name: str, prefix: str = "") -> Iterator[str]:
+        """Object names directly under prefix (no sub-"folders"), streamed as they are listed."""
+        raise NotImplementedError
+
+    def get_bytes(self, bucket_name: str, object_name: str) -> bytes:
+        raise NotImplementedError
+
+
+class MinioHandler(ObjectStoreBase):
     def __init__(self):
+        super().__init__()
         self.endpoint = MinioConfig.ENDPOINT
         self.access_key = MinioConfig.ACCESS_KEY
         self.secret_key = MinioConfig.SECRET_KEY
         self.secure = MinioConfig.SECURE
         self.client = None
-        self._connect()
+        # Client is created on first use (minio is imported there too), not at import time
 
     def _connect(self):
+        from minio import Minio
+
         try:
             self.client = Minio(
                 self.endpoint,
@@ -28,39 +105,197 @@ class MinioHandler:
             logger.error(f"Failed to initialize MinIO client: {e}")
             self.client = None
 
-    def upload_file(self, bucket_name: str, file_path: str, object_name: str) -> bool:
-        """
-        Uploads a file to the specified bucket.
-        Returns True if successful, False otherwise.
-        """
+    def _require_client(self):
         # Retry connection if not initialized
         if not self.client:
             self._connect()
-            
         if not self.client:
-            logger.warning("MinIO client is not initialized. Skipping upload.")
+            raise ConnectionError("MinIO client is not initialized.")
+        return self.client
+
+    def ping(self) -> bool:
+        """Object store round trip (health probe)."""
+        if not self.client:
+            self._connect()
+        if not self.client:
             return False
+        self.client.bucket_exists(MinioConfig.BUCKET_CVS)
+        return True
+
+    def _check_bucket(self, bucket_name: str) -> None:
+        from minio.error import S3Error
 
+        client = self._require_client()
+        if client.bucket_exists(bucket_name):
+            return
         try:
-            # Check if bucket exists
-            if not self.client.bucket_exists(bucket_name):
-                self.client.make_bucket(bucket_name)
-                logger.info(f"Bucket '{bucket_name}' created.")
-
-            # Upload
-            self.client.fput_object(
-                bucket_name,
-                object_name,
-                file_path,
-            )
-            logger.info(f"File '{object_name}' uploaded to bucket '{bucket_name}'.")
-            return True
+            client.make_bucket(bucket_name)
+            logger.info(f"Bucket '{bucket_name}' created.")
         except S3Error as e:
-            logger.error(f"MinIO S3 Error during upload: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error during MinIO upload: {e}")
-            return False
+            # Another worker created it in between
+            if e.code not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                raise
+
+    def object_sha256(self, bucket_name: str, object_name: str) -> Optional[str]:
+        from minio.error import S3Error
+
+        try:
+            stat = self._require_client().stat_object(bucket_name, object_name)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject", "ResourceNotFound"):
+                return None
+            raise
+        return (stat.metadata or {}).get("x-amz-meta-sha256")
+
+    def _put(self, bucket_name: str, file_path: str, object_name: str, sha256: str) -> None:
+        # Files above the part size go up as multipart uploads with parts of that size
+        self._require_client().fput_object(
+            bucket_name,
+            object_name,
+            file_path,
+            metadata={"sha256": sha256},
+            part_size=MinioConfig.PART_SIZE_MB * 1024 * 1024,
+        )
+
+    def list_objects(self, bucket_name: str, prefix: str = "") -> Iterator[str]:
+        # ListObjectsV2 is paged (1000 keys per page): the SDK follows the continuation
+        # tokens lazily, so names are yielded while later pages are still being fetched
+        for obj in self._require_client().list_objects(bucket_name, prefix=prefix or None, recursive=False):
+            if not obj.is_dir:
+                yield obj.object_name
+
+    def get_bytes(self, bucket_name: str, object_name: str) -> bytes:
+        response = self._require_client().get_object(bucket_name, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+
+class LocalObjectStore(ObjectStoreBase):
+    """
+    Filesystem stand-in for MinIO (tests, local runs without an object store):
+    objects are <root>/<bucket>/<object>, their sha256 is kept in <root>/<bucket>/.sha256/<object>.
+    """
+
+    def __init__(self, root: str):
+        super().__init__()
+        self.root = Path(root)
+
+    def ping(self) -> bool:
+        self.root.mkdir(parents=True, exist_ok=True)
+        return True
+
+    def _paths(self, bucket_name: str, object_name: str):
+        bucket = self.root / bucket_name
+        name = Path(object_name).name
+        return bucket / name, bucket / ".sha256" / name
+
+    def _check_bucket(self, bucket_name: str) -> None:
+        (self.root / bucket_name / ".sha256").mkdir(parents=True, exist_ok=True)
+
+    def object_sha256(self, bucket_name: str, object_name: str) -> Optional[str]:
+        obj, meta = self._paths(bucket_name, object_name)
+        if not obj.exists() or not meta.exists():
+            return None
+        return meta.read_text(encoding="utf-8").strip()
+
+    def _put(self, bucket_name: str, file_path: str, object_name: str, sha256: str) -> None:
+        obj, meta = self._paths(bucket_name, object_name)
+        fd, tmp = tempfile.mkstemp(dir=str(obj.parent), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out, open(file_path, "rb") as src:
+                shutil.copyfileobj(src, out)
+            os.replace(tmp, obj)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        meta.write_text(sha256, encoding="utf-8")
+
+    def list_objects(self, bucket_name: str, prefix: str = "") -> Iterator[str]:
+        bucket = self.root / bucket_name
+        if not bucket.is_dir():
+            return
+        # Objects are stored flat under the bucket (see _paths), so is the prefix
+        name_prefix = prefix.rsplit("/", 1)[-1]
+        with os.scandir(bucket) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.startswith(".") and entry.name.startswith(name_prefix):
+                    yield entry.name
+
+    def get_bytes(self, bucket_name: str, object_name: str) -> bytes:
+        obj, _ = self._paths(bucket_name, object_name)
+        return obj.read_bytes()
+
+
+class ObjectUploader:
+    """
+    Background uploads: submit() returns a Future right away and the file is stored by a
+    bounded thread pool, so request latency does not depend on the object store.
+    Failed uploads are retried with exponential backoff (backoff_seconds, x2 per attempt).
+    Future result: UPLOADED, EXISTS or FAILED.
+    """
+
+    def __init__(self, store: ObjectStoreBase, max_workers: int, retries: int = 3, backoff_seconds: float = 0.5):
+        self.store = store
+        self.max_workers = max(1, max_workers)
+        self.retries = max(0, retries)
+        self.backoff_seconds = max(0.0, backoff_seconds)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {UPLOADED: 0, EXISTS: 0, FAILED: 0, "retries": 0}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ts-object-upload")
+            return self._pool
+
+    def submit(self, bucket_name: str, file_path: str, object_name: str) -> "Future[str]":
+        return self._executor().submit(self._upload, bucket_name, file_path, object_name)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def _upload(self, bucket_name: str, file_path: str, object_name: str) -> str:
+        for attempt in range(self.retries + 1):
+            try:
+                status = self.store.store_file(bucket_name, file_path, object_name)
+                logger.info(f"File '{object_name}' {status} in bucket '{bucket_name}'.")
+                self._count(status)
+                return status
+            except Exception as e:
+                if attempt == self.retries:
+                    logger.error(f"Upload of '{object_name}' to '{bucket_name}' failed after {attempt + 1} attempts: {e}")
+                    self._count(FAILED)
+                    return FAILED
+                delay = self.backoff_seconds * (2 ** attempt)
+                logger.warning(f"Upload of '{object_name}' failed ({e}), retrying in {delay:.1f}s")
+                self._count("retries")
+                time.sleep(delay)
+        return FAILED
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
 
-# Global instance
+# Global instances
 minio_client = MinioHandler()
+# OBJECT_STORE_BACKEND=local swaps MinIO for a folder (same upload/dedup behaviour)
+object_store = LocalObjectStore(MinioConfig.LOCAL_DIR) if MinioConfig.BACKEND == "local" else minio_client
+object_uploader = ObjectUploader(
+    object_store,
+    max_workers=MinioConfig.UPLOAD_WORKERS,
+    retries=MinioConfig.UPLOAD_RETRIES,
+    backoff_seconds=MinioConfig.UPLOAD_BACKOFF_SECONDS,
+)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Where scan_pool reads CVs from: a local folder, or a bucket of the object store
+# ("s3://<bucket>[/<prefix>]") so API replicas can match without a shared volume.
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List
+
+from talentscope.config import PoolSourceConfig
+from talentscope.io.extractors import FileSource, InMemoryFile
+
+logger = logging.getLogger("talentscope.pool_source")
+
+OBJECT_SCHEMES = ("s3://", "minio://")
+
+
+def is_cv_name(name: str) -> bool:
+    # Case-sensitive suffix, hidden files skipped (same selection as the old glob)
+    return not name.startswith(".") and (name.endswith(".pdf") or name.endswith(".docx"))
+
+
+def list_pool_files(cv_dir: str) -> List[str]:
+    """
+    CV files of a pool directory (*.pdf, *.docx), sorted by name.
+    Same selection as glob (case-sensitive suffix, hidden files skipped) via a single scandir.
+    """
+    names: List[str] = []
+    with os.scandir(cv_dir) as it:
+        for entry in it:
+            if is_cv_name(entry.name) and entry.is_file():
+                names.append(entry.name)
+    names.sort()
+    base = Path(cv_dir)
+    return [str(base / name) for name in names]
+
+
+class PoolSource:
+    """
+    A CV pool. list_files() returns the pool's file references in scan order (their
+    base name is the CV file name); fetch(refs) yields what extraction reads for each
+    ref, in the same order: the path itself, or an InMemoryFile.
+    """
+
+    # True when fetch() yields file contents (memory grows with the number in flight)
+    buffered = False
+
+    def list_files(self) -> List[str]:
+        raise NotImplementedError
+
+    def fetch(self, refs: Iterable[str]) -> Iterator[FileSource]:
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        raise NotImplementedError
+
+
+class LocalPoolSource(PoolSource):
+    def __init__(self, cv_dir: str):
+        self.cv_dir = cv_dir
+
+    def list_files(self) -> List[str]:
+        return list_pool_files(self.cv_dir)
+
+    def fetch(self, refs: Iterable[str]) -> Iterator[FileSource]:
+        # Extraction opens the files itself
+        yield from refs
+
+    def describe(self) -> str:
+        return str(Path(self.cv_dir).resolve())
+
+
+class ObjectPoolSource(PoolSource):
+    """
+    CVs in an object-store bucket (objects directly under prefix). Bodies are downloaded by
+    fetch_workers threads into memory, at most `prefetch` objects ahead of the consumer,
+    and handed to extraction as InMemoryFile; nothing is written to disk.
+    An object that cannot be read is yielded with data=None (the CV is rejected).
+    """
+
+    buffered = True
+
+    def __init__(self, store, bucket: str, prefix: str = "", fetch_workers: int = 8, prefetch: int = 64):
+        self.store = store
+        self.bucket = bucket
+        self.prefix = prefix
+        self.fetch_workers = max(1, fetch_workers)
+        self.prefetch = max(self.fetch_workers, prefetch)
+        self._lock = threading.Lock()
+        self.fetched = 0
+        self.fetch_errors = 0
+        self.fetched_bytes = 0
+
+    def list_files(self) -> List[str]:
+        names = [n for n in self.store.list_objects(self.bucket, self.prefix) if is_cv_name(n.rsplit("/", 1)[-1])]
+        names.sort()
+        return names
+
+    def _get(self, object_name: str) -> InMemoryFile:
+        name = object_name.rsplit("/", 1)[-1]
+        try:
+            data = self.store.get_bytes(self.bucket, object_name)
+        except Exception as e:
+            logger.warning(f"Could not read '{object_name}' from bucket '{self.bucket}': {e}")
+            with self._lock:
+                self.fetch_errors += 1
+            return InMemoryFile(name, None)
+        with self._lock:
+            self.fetched += 1
+            self.fetched_bytes += len(data)
+        return InMemoryFile(name, data)
+
+    def fetch(self, refs: Iterable[str]) -> Iterator[FileSource]:
+        t0 = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix="ts-pool-fetch")
+        pending: Deque = deque()
+        try:
+            for ref in refs:
+                pending.append(pool.submit(self._get, ref))
+                if len(pending) >= self.prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Also reached when the consumer stops early (cancelled scan): drop what is queued
+            pool.shutdown(wait=False, cancel_futures=True)
+            logger.info(
+                f"Fetched {self.fetched} objects ({self.fetched_bytes / 1048576:.1f} MB, "
+                f"{self.fetch_errors} errors) from {self.describe()} in {time.perf_counter() - t0:.2f}s"
+            )
+
+    def describe(self) -> str:
+        return f"s3://{self.bucket}/{self.prefix}"
+
+
+def open_pool_source(location: str, store=None) -> PoolSource:
+    """
+    "s3://<bucket>[/<prefix>]" (or minio://) -> ObjectPoolSource on the configured object
+    store (OBJECT_STORE_BACKEND), anything else is a local pool folder.
+    """
+    for scheme in OBJECT_SCHEMES:
+        if location.startswith(scheme):
+            bucket, _, prefix = location[len(scheme):].partition("/")
+            if prefix and not prefix.endswith("/"):
+                prefix += "/"
+            if store is None:
+                from talentscope.io.minio_client import object_store as store
+            return ObjectPoolSource(
+                store,
+                bucket,
+                prefix,
+                fetch_workers=PoolSourceConfig.FETCH_WORKERS,
+                prefetch=PoolSourceConfig.PREFETCH,
+            )
+    return LocalPoolSource(location)
+
+
+def describe_pool(location: str) -> str:
+    return open_pool_source(location).describe()
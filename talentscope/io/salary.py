@@ -2,7 +2,7 @@
 import csv
 import re
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, TextIO, Tuple
 
 
 def _num(s: str) -> Optional[float]:
@@ -82,11 +82,47 @@ def load_salary_map_csv(path: Optional[str]) -> Dict[str, Dict[str, Optional[flo
 
 def append_salary_to_csv(csv_path: Path, filename: str, salary_input: str) -> None:
     """Appends filename and salary input (raw string) to the CSV."""
+    append_salaries_to_csv(csv_path, [(filename, salary_input)])
+
+
+def append_salaries_to_csv(csv_path: Path, rows: Iterable[Tuple[str, str]]) -> int:
+    """Appends (filename, salary input) rows in one open/write; returns the number of rows."""
+    rows = list(rows)
+    if not rows:
+        return 0
     file_exists = csv_path.exists()
-    
+
     with csv_path.open("a", encoding="utf-8", newline="") as f:
         writer = csv.writer(f)
         if not file_exists:
             writer.writerow(["filename", "salary_tl"])
-        
-        writer.writerow([filename, salary_input])
+
+        writer.writerows(rows)
+    return len(rows)
+
+
+def read_salary_inputs(f: TextIO) -> Dict[str, str]:
+    """
+    Reads an uploaded salary CSV into filename -> raw salary input.
+    Same columns as load_salary_map_csv: salary_tl, or salary_min_tl / salary_max_tl.
+    """
+    mp: Dict[str, str] = {}
+    reader = csv.DictReader(f)
+    cols = set((reader.fieldnames or []))
+
+    for row in reader:
+        fname = Path((row.get("filename") or "").strip()).name
+        if not fname:
+            continue
+
+        if "salary_min_tl" in cols or "salary_max_tl" in cols:
+            lo = (row.get("salary_min_tl") or "").strip()
+            hi = (row.get("salary_max_tl") or "").strip()
+            value = f"{lo}-{hi}" if lo and hi else (lo or hi)
+        else:
+            value = (row.get("salary_tl") or "").strip()
+
+        if value:
+            mp[fname] = value
+
+    return mp
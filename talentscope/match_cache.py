@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from talentscope.config import CacheConfig
+from talentscope.io.pool_source import is_cv_name
+
+
+@dataclass(frozen=True)
+class MatchCacheKey:
+    job_sha256: str
+    pool_version: str
+    taxonomy_key: str
+    filters: Tuple[Any, ...]
+    salaries_version: str
+
+
+def file_version(path: str) -> str:
+    """mtime + size of a file (e.g. the salaries CSV), "missing" when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "missing"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "meta")
+
+    def __init__(self, value: Dict[str, Any], expires_at: float, meta: Dict[str, Any]):
+        self.value = value
+        self.expires_at = expires_at
+        self.meta = meta
+
+
+class MatchResultCache:
+    """
+    LRU + TTL cache of /jobs/match responses.
+    Keys carry the pool version, so a changed pool never serves an old shortlist;
+    repool() moves the entries a pool change provably does not affect to the new version.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[MatchCacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.carried_over = 0
+
+    @classmethod
+    def from_config(cls) -> "MatchResultCache":
+        return cls(CacheConfig.MATCH_MAX_ENTRIES, CacheConfig.MATCH_TTL_SECONDS)
+
+    def get(self, key: MatchCacheKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                    self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: MatchCacheKey, value: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(value, time.monotonic() + self.ttl_seconds, meta or {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def repool(
+        self,
+        old_version: str,
+        new_version: str,
+        unaffected: Callable[[Dict[str, Any]], bool],
+    ) -> None:
+        """
+        Called after a pool change (old_version -> new_version).
+        Entries of old_version for which unaffected(meta) is True are re-keyed to new_version;
+        every other entry of an outdated pool version is dropped.
+        """
+        with self._lock:
+            snapshot = list(self._entries.items())
+
+        # unaffected() may score a CV, so it runs outside the lock.
+        keep = {}
+        for key, entry in snapshot:
+            if key.pool_version == old_version and old_version != new_version:
+                try:
+                    keep[key] = bool(unaffected(entry.meta))
+                except Exception:
+                    keep[key] = False
+
+        with self._lock:
+            for key, still_valid in keep.items():
+                entry = self._entries.pop(key, None)
+                if entry is None:
+                    continue
+                if still_valid:
+                    self._entries[replace(key, pool_version=new_version)] = entry
+                    self.carried_over += 1
+                else:
+                    self.invalidations += 1
+            for key in [k for k in self._entries if k.pool_version != new_version]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "carried_over": self.carried_over,
+            }
+
+
+class PoolVersion:
+    """
+    Version of a CV pool directory: an in-process counter bumped on every upload/delete,
+    combined with a fingerprint of the CV files (name, size, mtime) so files added,
+    removed or edited in place out of band also count. One scandir per call.
+    """
+
+    def __init__(self, cv_dir: str):
+        self.cv_dir = cv_dir
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def fingerprint(self) -> str:
+        entries = []
+        try:
+            with os.scandir(self.cv_dir) as it:
+                for entry in it:
+                    if is_cv_name(entry.name) and entry.is_file():
+                        st = entry.stat()
+                        entries.append(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            return "missing"
+        entries.sort()
+        return hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()[:16]
+
+    def current(self) -> str:
+        return f"{self.fingerprint()}:{self._counter}"
+
+    def bump(self) -> str:
+        with self._lock:
+            self._counter += 1
+        return self.current()
+
+
+# Global instance
+match_cache = MatchResultCache.from_config()
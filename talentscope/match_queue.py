@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from talentscope.config import MatchQueueConfig
+
+logger = logging.getLogger("talentscope.match_queue")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+_ACTIVE_STATES = (QUEUED, RUNNING)
+
+
+class MatchQueueFull(Exception):
+    pass
+
+
+class MatchCancelled(Exception):
+    pass
+
+
+class MatchRun:
+    """One queued match: state, progress and (once finished) result or error."""
+
+    def __init__(self, run_id: str, key: str, fn: Callable[["MatchRun"], Dict[str, Any]]):
+        self.run_id = run_id
+        self.key = key
+        self.fn = fn
+        self.state = QUEUED
+        self.scanned = 0
+        self.total = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def progress(self, scanned: int, total: int) -> None:
+        # Passed to scan_pool as progress callback; also the cancellation point.
+        self.scanned = scanned
+        self.total = total
+        if self._cancel.is_set():
+            raise MatchCancelled(self.run_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {
+            "run_id": self.run_id,
+            "state": self.state,
+            "progress": {
+                "scanned_cvs": self.scanned,
+                "total_cvs": self.total,
+                "percent": round(self.scanned / self.total * 100.0, 2) if self.total else 0.0,
+            },
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.state == DONE:
+            out["result"] = self.result
+        if self.error:
+            out["error"] = self.error
+        return out
+
+
+class MatchQueue:
+    """
+    In-process match queue: a bounded FIFO served by a few worker threads.
+    - submit() de-duplicates on key: a queued or running run with the same key is returned instead.
+    - At most max_depth runs wait in the queue; submit() raises MatchQueueFull beyond that.
+    - cancel() drops a queued run, or stops a running one at its next progress() call.
+    - Finished runs are kept (most recent keep_finished) so clients can poll the result.
+    """
+
+    def __init__(self, workers: int, max_depth: int, keep_finished: int):
+        self.workers = max(1, workers)
+        self.max_depth = max(1, max_depth)
+        self.keep_finished = max(1, keep_finished)
+        self._runs: "OrderedDict[str, MatchRun]" = OrderedDict()
+        self._active_by_key: Dict[str, str] = {}
+        self._pending: Deque[MatchRun] = deque()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._stopped = False
+
+    @classmethod
+    def from_config(cls) -> "MatchQueue":
+        return cls(
+            workers=MatchQueueConfig.WORKERS,
+            max_depth=MatchQueueConfig.MAX_DEPTH,
+            keep_finished=MatchQueueConfig.KEEP_FINISHED,
+        )
+
+    def _ensure_workers(self) -> None:
+        # Threads are started lazily, on the first submit.
+        if self._threads:
+            return
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"ts-match-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, key: str, fn: Callable[[MatchRun], Dict[str, Any]]) -> MatchRun:
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("Match queue is shut down.")
+
+            existing_id = self._active_by_key.get(key)
+            if existing_id is not None:
+                return self._runs[existing_id]
+
+            if len(self._pending) >= self.max_depth:
+                raise MatchQueueFull(f"Match queue is full ({self.max_depth} runs waiting).")
+
+            run = MatchRun(uuid.uuid4().hex, key, fn)
+            self._runs[run.run_id] = run
+            self._active_by_key[key] = run.run_id
+            self._pending.append(run)
+            self._ensure_workers()
+            self._cond.notify()
+            return run
+
+    def get(self, run_id: str) -> Optional[MatchRun]:
+        with self._cond:
+            return self._runs.get(run_id)
+
+    def cancel(self, run_id: str) -> Optional[MatchRun]:
+        with self._cond:
+            run = self._runs.get(run_id)
+            if run is None or run.state not in _ACTIVE_STATES:
+                return run
+            run._cancel.set()
+            if run.state == QUEUED:
+                self._pending.remove(run)
+                self._finish(run, CANCELLED)
+            return run
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            counts = {s: 0 for s in (QUEUED, RUNNING, DONE, FAILED, CANCELLED)}
+            for run in self._runs.values():
+                counts[run.state] += 1
+            return counts
+
+    def _finish(self, run: MatchRun, state: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        # Caller holds self._cond.
+        run.state = state
+        run.result = result
+        run.error = error
+        run.finished_at = time.time()
+        run.fn = None
+        if self._active_by_key.get(run.key) == run.run_id:
+            del self._active_by_key[run.key]
+
+        finished = [rid for rid, r in self._runs.items() if r.state not in _ACTIVE_STATES]
+        for rid in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._runs[rid]
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                run = self._pending.popleft()
+                run.state = RUNNING
+                run.started_at = time.time()
+                fn = run.fn
+
+            try:
+                result = fn(run)
+            except MatchCancelled:
+                with self._cond:
+                    self._finish(run, CANCELLED)
+                continue
+            except Exception as e:
+                logger.exception(f"Match run {run.run_id} failed")
+                with self._cond:
+                    self._finish(run, FAILED, error=str(e))
+                continue
+
+            with self._cond:
+                self._finish(run, CANCELLED if run.cancel_requested else DONE, result=result)
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._stopped = True
+            for run in list(self._pending):
+                self._finish(run, CANCELLED)
+            self._pending.clear()
+            for run in self._runs.values():
+                if run.state == RUNNING:
+                    run._cancel.set()
+            self._cond.notify_all()
+
+
+# Global instance
+match_queue = MatchQueue.from_config()
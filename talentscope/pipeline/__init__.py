@@ -1,5 +1,7 @@
 __version__ = "0.1.0"
 
-from talentscope.pipeline.pipeline import scan_pool
+from talentscope.pipeline.filters import CandidateFilter
+from talentscope.pipeline.merge import merge_scan_outputs
+from talentscope.pipeline.pipeline import iter_pool, ndjson_line, scan_pool, scan_pool_many, scan_pool_records
 
-__all__ = ["scan_pool"]
\ No newline at end of file
+__all__ = ["CandidateFilter", "iter_pool", "merge_scan_outputs", "ndjson_line", "scan_pool", "scan_pool_many", "scan_pool_records"]
\ No newline at end of file
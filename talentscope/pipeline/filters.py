@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class CandidateFilter:
+    """
+    Experience / salary predicates of a match request, checked in scan_pool before
+    the HR scoring stage.
+    Same rules as the /jobs/match filters: once a salary bound is set, candidates
+    with unknown salary are excluded.
+    """
+    min_experience: Optional[int] = None
+    max_experience: Optional[int] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return any(v is not None for v in asdict(self).values())
+
+    def accepts(self, experience_years: int, salary_mid: Optional[float]) -> bool:
+        if self.min_experience is not None and experience_years < self.min_experience:
+            return False
+        if self.max_experience is not None and experience_years > self.max_experience:
+            return False
+
+        if self.min_salary is not None or self.max_salary is not None:
+            if salary_mid is None:
+                return False
+            if self.min_salary is not None and salary_mid < self.min_salary:
+                return False
+            if self.max_salary is not None and salary_mid > self.max_salary:
+                return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Combines the partial outputs of a sharded scan (scan_pool(shard=(i, n)), `talentscope --shard i/N`)
+# into the output a single node would have produced for the whole pool.
+from datetime import datetime
+from typing import Any, Dict, List
+
+from talentscope.pipeline.pipeline import TopN, _known_sort_key, _unknown_sort_key
+
+_LISTS = (("salary_known_topN", _known_sort_key), ("salary_unknown_topN", _unknown_sort_key))
+
+
+def _check_partials(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not partials:
+        raise ValueError("No shard outputs to merge.")
+    shards = [p.get("shard") for p in partials]
+    if any(s is None for s in shards):
+        raise ValueError("Not a shard output (no 'shard' section); scan with --shard i/N.")
+
+    first = shards[0]
+    if any(s["count"] != first["count"] or s["top_n"] != first["top_n"] for s in shards):
+        raise ValueError("Shard outputs come from different runs (shard count or top N differ).")
+    got = sorted(s["index"] for s in shards)
+    if got != list(range(first["count"])):
+        raise ValueError(f"Every shard of {first['count']} is needed exactly once, got {got}.")
+
+    job, cv_dir = partials[0]["job"], partials[0]["pool"]["cv_dir"]
+    for p in partials[1:]:
+        if p["job"] != job or p["pool"]["cv_dir"] != cv_dir:
+            raise ValueError("Shard outputs are for different jobs, settings or pools.")
+    return first
+
+
+def merge_scan_outputs(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merges the n partial outputs of one sharded scan (any order) into scan_pool's output.
+    - Pool counters are summed.
+    - Each shard kept its own top N, which holds every one of its candidates that can be in
+      the global top N, so re-ranking their union gives the single-node lists. Ties keep pool
+      order in scan_pool, and pool order is file-name order.
+    - Filter fallback applies when no CV in the whole pool passed the filters. Shards that
+      fell back on their own count only then.
+    Raises ValueError when the partials do not form one complete run.
+    """
+    shard = _check_partials(partials)
+
+    pool: Dict[str, Any] = {}
+    for key, value in partials[0]["pool"].items():
+        if key == "retrieval":
+            # Same Postgres lookup on every shard; only the per-shard skips add up
+            pool[key] = {**value, "not_scored_cvs": sum(p["pool"][key]["not_scored_cvs"] for p in partials)}
+        elif isinstance(value, int):
+            pool[key] = sum(p["pool"][key] for p in partials)
+        else:
+            pool[key] = value
+
+    filtered = "fallback" in partials[0]["results"]
+    used_fallback = filtered and pool["qualified_cvs"] == 0 and any(p["results"]["fallback"] for p in partials)
+    use = [p for p in partials if p["results"].get("fallback", False) == used_fallback]
+
+    results: Dict[str, Any] = {}
+    for name, key in _LISTS:
+        top = TopN(shard["top_n"], key)
+        for rec in sorted((r for p in use for r in p["results"][name]), key=lambda r: r["candidate_file"]):
+            top.push(rec)
+        items = top.items()
+        for i, item in enumerate(items, start=1):
+            item["rank"] = i
+        results[name] = items
+    if filtered:
+        results["fallback"] = used_fallback
+
+    return {
+        "engine": partials[0].get("engine", "TalentScope"),
+        "timestamp": datetime.utcnow().isoformat(),
+        "job": partials[0]["job"],
+        "pool": pool,
+        "results": results,
+    }
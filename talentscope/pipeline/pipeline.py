@@ -1,19 +1,30 @@
 # -*- coding: utf-8 -*-
+import copy
+import hashlib
+import heapq
+import json
 import math
+import multiprocessing
 import re
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from glob import glob
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from talentscope.core.normalize import norm
-from talentscope.core.scoring import compute_job_match, detect_job_domains, score_domains
-from talentscope.core.experience import estimate_experience_years
+from talentscope.core.scoring import PreparedJob, prepare_job
+from talentscope.core.skill_index import SkillIndex, load_skill_index
 from talentscope.core.hr_scorer import HRScorer
-from talentscope.io.extractors import extract_file_content, extract_resume_text
+from talentscope.db.feature_store import CandidateFeatures, load_candidate_features
+from talentscope.db.retrieval import HOLD, SCORE, Retrieval
+from talentscope.io.extractors import FileSource, extract_file_content_cached, source_name
+from talentscope.io.pool_source import describe_pool, list_pool_files, open_pool_source
 from talentscope.io.salary import load_salary_map_csv
-from talentscope.skills.skills_loader import load_yaml
+from talentscope.pipeline.filters import CandidateFilter
+from talentscope.profiling import ScanProfile, stage
 
 
 def _salary_mid_sort_key(rec: Dict[str, Any]) -> Tuple[float, float, float]:
@@ -27,6 +38,41 @@ def _salary_mid_sort_key(rec: Dict[str, Any]) -> Tuple[float, float, float]:
     )
 
 
+def _known_sort_key(rec: Dict[str, Any]) -> Tuple[float, ...]:
+    return (-rec["hr_score"], -rec["job_fit_score"], *_salary_mid_sort_key(rec))
+
+
+def _unknown_sort_key(rec: Dict[str, Any]) -> Tuple[float, ...]:
+    return (-rec["hr_score"], -rec["job_fit_score"])
+
+
+class TopN:
+    """
+    Bounded top-N selection; same order as sorting the full list by key and slicing
+    (ties keep insertion order, like a stable sort). Memory is O(n).
+    """
+
+    def __init__(self, n: int, key: Callable[[Dict[str, Any]], Tuple[float, ...]]):
+        self.n = max(0, n)
+        self.key = key
+        self._heap: List[Tuple[Tuple[float, ...], int, Dict[str, Any]]] = []
+        self._seq = 0
+
+    def push(self, rec: Dict[str, Any]) -> None:
+        self._seq += 1
+        if self.n == 0:
+            return
+        # Min-heap on the inverted key: the root is always the worst kept record.
+        entry = (tuple(-k for k in self.key(rec)), -self._seq, rec)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Dict[str, Any]]:
+        return [rec for _, _, rec in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
 def _safe_stem(filename: str) -> str:
     stem = Path(filename).stem.lower().strip()
     stem = re.sub(r"\s+", "_", stem)
@@ -40,107 +86,38 @@ def _unique_candidate_id(filename: str, registry: Dict[str, int]) -> str:
     return base if registry[base] == 1 else f"{base}_{registry[base]}"
 
 
-def scan_pool(
-    cv_dir: str,
-    skills_yaml: str,
-    job_file: str,
-    salaries_csv: Optional[str],
-    min_fit_score: float,
-    top_n: int,
-) -> Dict[str, Any]:
-    cfg = load_yaml(skills_yaml)
-
-    job_text_raw = extract_file_content(job_file)
-    job_text_norm = norm(job_text_raw)
-
-    job_domains = detect_job_domains(job_text_norm, cfg)
-    if not job_domains:
-        raise ValueError("İş tanımında skills.yaml ile eşleşen bir domain bulunamadı.")
-
-    filtered_domains = {k: v for k, v in cfg["domains"].items() if k in set(job_domains)}
-    domain_cfg = {"domains": filtered_domains}
-
-    salary_map = load_salary_map_csv(salaries_csv)
-
-    files: List[str] = []
-    for ext in ("*.pdf", "*.docx"):
-        files.extend(glob(str(Path(cv_dir) / ext)))
-    files = sorted(files)
-
-    results: List[Dict[str, Any]] = []
-    rejected = 0
-    candidate_id_registry: Dict[str, int] = defaultdict(int)
-
-    for fpath in files:
-        fname = Path(fpath).name
-        candidate_id = _unique_candidate_id(fname, candidate_id_registry)
-
-        try:
-            raw = extract_resume_text(fpath)
-        except Exception:
-            rejected += 1
-            continue
-
-        resume_text_norm = norm(raw)
-
-        all_domain_scores = score_domains(resume_text_norm, cfg)
-        overall_cv_score = sum(s for _, _, s in all_domain_scores)
-
-        jm = compute_job_match(job_text_norm, resume_text_norm, domain_cfg)
-        if "note" in jm:
-            rejected += 1
-            continue
-
-        domain_cv_score_for_job = int(jm.get("resume_domain_score", 0))
-        job_match_percent = float(jm["match_percent"])
-        job_fit_score = round(domain_cv_score_for_job * (job_match_percent / 100.0), 2)
-
-        if job_fit_score < min_fit_score:
-            rejected += 1
-            continue
-
-        sal = salary_map.get(fname, {"min": None, "max": None})
-        salary_min = sal.get("min")
-        salary_max = sal.get("max")
-        salary_expectation_val = str(salary_min) if salary_min else None
-        
-        salary_known = isinstance(salary_min, (int, float)) and isinstance(salary_max, (int, float))
-        salary_mid = round((salary_min + salary_max) / 2.0, 2) if salary_known else None
-
-        exp_years = estimate_experience_years(raw)
-
-        # Prepare data for HR Scorer
-        # Need "parsed" data structure which comes from CVParser (but here we only have raw text)
-        # We need to run CVParser here to feed HRScorer properly
-        from talentscope.core.parser import CVParser
-        parser = CVParser(raw)
-        parsed_data = parser.parse()
-        
-        # Skill injection logic similar to API (simplified)
-        # Note: HRScorer needs skills to be in parsed_data["skills"] potentially, 
-        # or it uses matches from compute_job_match.
-        # HRScorer uses "top_matched_terms" from cv_data for evidence check.
-        
-        cv_data_for_hr = {
-            "raw_text": raw,
-            "parsed_data": parsed_data,
-            "estimated_experience": exp_years,
-            "top_matched_terms": [(t, w) for (t, w, _) in jm["matched_terms"]],
-            "salary": salary_expectation_val, # Passed from somewhere else or parsed?
-            # Actually we utilize "salary_min/max" from map
-        }
-        
-        # Update salary in parsed data if known
-        if salary_known:
-             if salary_min == salary_max:
-                 parsed_data["salary"] = salary_min
-             else:
-                 parsed_data["salary"] = f"{salary_min}-{salary_max}"
+def shard_of(filename: str, count: int) -> int:
+    """
+    Shard (0..count-1) of a CV file for sharded scans. Hashes the candidate_id stem, so files
+    sharing a stem (cv.pdf, cv.docx) land on the same shard and get the ids of a full scan.
+    """
+    digest = hashlib.sha1(_safe_stem(filename).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+class _ScanContext:
+    """Everything the per-CV stage needs; identical for every CV of one scan."""
+
+    def __init__(
+        self,
+        index: SkillIndex,
+        prepared_job: PreparedJob,
+        salary_map: Dict[str, Dict[str, Optional[float]]],
+        min_fit_score: float,
+        job_file: str,
+        filters: Optional[CandidateFilter] = None,
+    ):
+        self.index = index
+        self.prepared_job = prepared_job
+        self.salary_map = salary_map
+        self.min_fit_score = min_fit_score
+        self.filters = filters if filters is not None and filters.active else None
+        self.job_domains_out = [{"domain": d, "label": index.label(d)} for d in prepared_job.domains]
 
         # Job Data for Scorer
         # We need to pass job requirements (experience, salary limits if any)
         # Currently scan_pool params don't have exp limits, but we can pass generic defaults
-        job_data_for_hr = {
+        self.job_data_for_hr = {
             "title": Path(job_file).stem.replace("_", " "), # Guess title from filename
             "min_experience": 2, # Default
             "max_experience": 6, # Default 
@@ -148,40 +125,523 @@ def scan_pool(
             "max_salary": None
         }
 
-        scorer = HRScorer(job_data_for_hr)
+
+def _job_fit(jm: Dict[str, Any]) -> Tuple[int, float, float]:
+    domain_cv_score_for_job = int(jm.get("resume_domain_score", 0))
+    job_match_percent = float(jm["match_percent"])
+    job_fit_score = round(domain_cv_score_for_job * (job_match_percent / 100.0), 2)
+    return domain_cv_score_for_job, job_match_percent, job_fit_score
+
+
+def qualifies_for_job(fpath: str, index: SkillIndex, prepared_job: PreparedJob, min_fit_score: float) -> bool:
+    """
+    True when scan_pool would keep this CV for the job (passes the fit threshold).
+    index must be the full SkillIndex, features are shared with the feature store.
+    """
+    try:
+        features = load_candidate_features(fpath, index)
+    except Exception:
+        return False
+    jm = prepared_job.match(features.resume_hits)
+    if "note" in jm:
+        return False
+    return _job_fit(jm)[2] >= min_fit_score
+
+
+# Per-CV stage result for a CV that passes the fit threshold but not the request filters.
+FILTERED_OUT = "filtered_out"
+
+
+def _score_cv(
+    fpath: FileSource,
+    ctx: _ScanContext,
+    timings: Optional[Dict[str, float]] = None,
+) -> Union[Dict[str, Any], str, None]:
+    """
+    Full per-CV stage (extract, match, parse, HR score).
+    Returns the candidate record without candidate_id/rank, None if the CV is rejected
+    or FILTERED_OUT if it fails ctx.filters. fpath may be an InMemoryFile (object-store pool).
+    """
+    # Job-independent work (extraction, taxonomy scan, experience, CVParser) comes from the
+    # feature store when this exact file content was seen before.
+    try:
+        features = load_candidate_features(fpath, ctx.index, timings)
+    except Exception:
+        return None
+
+    return _score_features(source_name(fpath), features, ctx, timings)
+
+
+def _score_cv_timed(fpath: FileSource, ctx: _ScanContext) -> Tuple[Union[Dict[str, Any], str, None], Dict[str, float]]:
+    timings: Dict[str, float] = {}
+    return _score_cv(fpath, ctx, timings), timings
+
+
+def _score_features(
+    fname: str,
+    features: CandidateFeatures,
+    ctx: _ScanContext,
+    timings: Optional[Dict[str, float]] = None,
+) -> Union[Dict[str, Any], str, None]:
+    """Job-dependent part of the per-CV stage (match, fit threshold, salary, filters, HR score)."""
+    raw = features.raw_text
+    resume_hits = features.resume_hits
+    overall_cv_score = features.overall_score
+
+    with stage(timings, "compute_job_match"):
+        jm = ctx.prepared_job.match(resume_hits)
+    if "note" in jm:
+        return None
+
+    domain_cv_score_for_job, job_match_percent, job_fit_score = _job_fit(jm)
+
+    if job_fit_score < ctx.min_fit_score:
+        return None
+
+    sal = ctx.salary_map.get(fname, {"min": None, "max": None})
+    salary_min = sal.get("min")
+    salary_max = sal.get("max")
+    salary_expectation_val = str(salary_min) if salary_min else None
+    
+    salary_known = isinstance(salary_min, (int, float)) and isinstance(salary_max, (int, float))
+    salary_mid = round((salary_min + salary_max) / 2.0, 2) if salary_known else None
+
+    exp_years = features.experience_years
+
+    # Cheap request filters before the deepcopy + HRScorer stage
+    if ctx.filters is not None and not ctx.filters.accepts(exp_years, salary_mid):
+        return FILTERED_OUT
+
+    # Prepare data for HR Scorer
+    # "parsed" data structure comes from CVParser (cached with the other CV features)
+    parsed_data = copy.deepcopy(features.parsed_data)
+    
+    # Skill injection logic similar to API (simplified)
+    # Note: HRScorer needs skills to be in parsed_data["skills"] potentially, 
+    # or it uses matches from compute_job_match.
+    # HRScorer uses "top_matched_terms" from cv_data for evidence check.
+    
+    cv_data_for_hr = {
+        "raw_text": raw,
+        "parsed_data": parsed_data,
+        "estimated_experience": exp_years,
+        "top_matched_terms": [(t, w) for (t, w, _) in jm["matched_terms"]],
+        "salary": salary_expectation_val, # Passed from somewhere else or parsed?
+        # Actually we utilize "salary_min/max" from map
+    }
+    
+    # Update salary in parsed data if known
+    if salary_known:
+         if salary_min == salary_max:
+             parsed_data["salary"] = salary_min
+         else:
+             parsed_data["salary"] = f"{salary_min}-{salary_max}"
+
+    with stage(timings, "hr_score"):
+        scorer = HRScorer(ctx.job_data_for_hr)
         hr_score_res = scorer.score(cv_data_for_hr)
 
-        results.append(
-            {
-                "candidate_id": candidate_id,
-                "candidate_file": fname,
-                "estimated_experience": exp_years,
-                "hr_score": hr_score_res["total_score"],
-                "hr_score_details": hr_score_res["breakdown"],
-                "hr_analysis": hr_score_res["details"],
-                "job_domains": [{"domain": d, "label": cfg["domains"][d].get("label", d)} for d in job_domains],
-                "overall_cv_score": overall_cv_score,
-                "domain_cv_score_for_job": domain_cv_score_for_job,
-                "job_match_percent": job_match_percent,
-                "job_fit_score": job_fit_score,
-                "salary_known": salary_known,
-                "salary_min_tl": salary_min,
-                "salary_max_tl": salary_max,
-                "salary_mid_tl": salary_mid,
-                "top_matched_terms": [(t, w) for (t, w, _) in jm["matched_terms"][:12]],
-                "top_missing_terms": [(t, w) for (t, w, _) in jm["missing_terms"][:12]],
-            }
+    return {
+        "candidate_file": fname,
+        "estimated_experience": exp_years,
+        "hr_score": hr_score_res["total_score"],
+        "hr_score_details": hr_score_res["breakdown"],
+        "hr_analysis": hr_score_res["details"],
+        "job_domains": [dict(d) for d in ctx.job_domains_out],
+        "overall_cv_score": overall_cv_score,
+        "domain_cv_score_for_job": domain_cv_score_for_job,
+        "job_match_percent": job_match_percent,
+        "job_fit_score": job_fit_score,
+        "salary_known": salary_known,
+        "salary_min_tl": salary_min,
+        "salary_max_tl": salary_max,
+        "salary_mid_tl": salary_mid,
+        "top_matched_terms": [(t, w) for (t, w, _) in jm["matched_terms"][:12]],
+        "top_missing_terms": [(t, w) for (t, w, _) in jm["missing_terms"][:12]],
+    }
+
+
+# Per-process scan context, set once by _init_worker in every pool worker.
+_WORKER_CTX: Optional[_ScanContext] = None
+
+
+def _init_worker(
+    skills_yaml: str,
+    prepared_job_data: Dict[str, Any],
+    salary_map: Dict[str, Dict[str, Optional[float]]],
+    min_fit_score: float,
+    job_file: str,
+    filters: Optional[CandidateFilter] = None,
+) -> None:
+    global _WORKER_CTX
+    index = load_skill_index(skills_yaml)
+    try:
+        prepared_job = PreparedJob.from_dict(prepared_job_data, index)
+    except ValueError:
+        # skills.yaml changed since the scan started: prepare the job for the index this worker loaded
+        prepared_job = _resolve_job(index, job_file, None)
+    _WORKER_CTX = _ScanContext(index, prepared_job, salary_map, min_fit_score, job_file, filters)
+
+
+def _score_cv_in_worker(fpath: FileSource) -> Union[Dict[str, Any], str, None]:
+    return _score_cv(fpath, _WORKER_CTX)
+
+
+def _score_cv_timed_in_worker(fpath: FileSource) -> Tuple[Union[Dict[str, Any], str, None], Dict[str, float]]:
+    return _score_cv_timed(fpath, _WORKER_CTX)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+class ScanStats:
+    """Pool counters filled while iter_pool runs."""
+
+    def __init__(self):
+        self.total = 0
+        self.qualified = 0
+        self.rejected = 0
+        self.filtered_out = 0
+        self.salary_known = 0
+        self.salary_unknown = 0
+        self.not_retrieved = 0
+
+
+def _iter_windows(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(items)
+    while True:
+        part = list(islice(it, size))
+        if not part:
+            return
+        yield part
+
+
+def _resolve_job(
+    index: SkillIndex,
+    job_file: str,
+    prepared_job: Optional[PreparedJob],
+) -> PreparedJob:
+    if prepared_job is None or prepared_job.index_key != index.key:
+        prepared_job = prepare_job(norm(extract_file_content_cached(job_file)), index, job_file=Path(job_file).name)
+
+    if not prepared_job.domains:
+        raise ValueError("İş tanımında skills.yaml ile eşleşen bir domain bulunamadı.")
+    return prepared_job
+
+
+def iter_pool(
+    cv_dir: str,
+    skills_yaml: str,
+    job_file: str,
+    salaries_csv: Optional[str],
+    min_fit_score: float,
+    prepared_job: Optional[PreparedJob] = None,
+    workers: Optional[int] = 1,
+    stats: Optional[ScanStats] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    filters: Optional[CandidateFilter] = None,
+    filtered_out: Optional[List[Tuple[str, str]]] = None,
+    profile: Optional[ScanProfile] = None,
+    retrieval: Optional[Retrieval] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming core of scan_pool: yields every qualified candidate record (with
+    candidate_id, without rank) in pool order, as soon as it is scored.
+    Rejections and totals are counted on stats.
+    progress(scanned, total) is called after every CV; an exception raised from it
+    aborts the scan (used for cancellation).
+    filters are applied before HR scoring; CVs that pass the fit threshold but fail
+    them are not yielded, their (path, candidate_id) goes to filtered_out instead.
+    profile (optional) receives per-CV stage timings from the workers.
+    retrieval (db.retrieval) limits scoring to the CVs it selected; the others are counted
+    as not_retrieved (held-back ones still go to filtered_out for the fallback).
+    Candidate ids are assigned over the whole pool, so they match a full scan.
+    cv_dir may also be an object-store pool ("s3://<bucket>[/<prefix>]", see io.pool_source);
+    its CVs are fetched into memory ahead of scoring, filtered_out then holds object names.
+    shard=(i, n) scans only the CVs with shard_of(name, n) == i; stats cover that share.
+    """
+    stats = stats if stats is not None else ScanStats()
+    steps = profile.pool_steps if profile is not None else None
+    with stage(steps, "prepare_job"):
+        index = load_skill_index(skills_yaml)
+        prepared_job = _resolve_job(index, job_file, prepared_job)
+
+    with stage(steps, "load_salaries"):
+        salary_map = load_salary_map_csv(salaries_csv)
+
+    source = open_pool_source(cv_dir)
+    with stage(steps, "list_pool"):
+        files = source.list_files()
+        if shard is not None:
+            shard_index, shard_count = shard
+            files = [f for f in files if shard_of(Path(f).name, shard_count) == shard_index]
+    stats.total = len(files)
+
+    if retrieval is not None:
+        plan = [retrieval.plan(Path(f).name) for f in files]
+        to_score = [f for f, p in zip(files, plan) if p == SCORE]
+    else:
+        plan = [SCORE] * len(files)
+        to_score = files
+
+    candidate_id_registry: Dict[str, int] = defaultdict(int)
+
+    # Paths, or CV contents prefetched from the object store, in to_score order
+    fetched = source.fetch(to_score)
+
+    workers = min(_resolve_workers(workers), max(1, len(to_score)))
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            # spawn: scans also run inside the threaded API process, forking it is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(skills_yaml, prepared_job.to_dict(), salary_map, min_fit_score, job_file, filters),
         )
+        # A few chunks per worker keeps IPC overhead low while still balancing slow PDFs;
+        # submitting window by window bounds the number of finished-but-unconsumed records.
+        chunksize = max(1, min(64, len(to_score) // (workers * 4)))
+        window = chunksize * workers * 4
+        if source.buffered:
+            # Object bodies travel with the tasks: keep the window at the prefetch budget
+            window = max(workers, source.prefetch)
+            chunksize = max(1, window // (workers * 4))
+        score_fn = _score_cv_timed_in_worker if profile is not None else _score_cv_in_worker
+        scored = (
+            rec
+            for part in _iter_windows(fetched, window)
+            for rec in executor.map(score_fn, part, chunksize=chunksize)
+        )
+    else:
+        executor = None
+        ctx = _ScanContext(index, prepared_job, salary_map, min_fit_score, job_file, filters)
+        if profile is not None:
+            scored = (_score_cv_timed(fpath, ctx) for fpath in fetched)
+        else:
+            scored = (_score_cv(fpath, ctx) for fpath in fetched)
+
+    try:
+        if progress is not None:
+            progress(0, stats.total)
+        # Candidate ids are assigned here, in file order, so they never depend on worker scheduling.
+        for scanned, (fpath, step) in enumerate(zip(files, plan), start=1):
+            if progress is not None:
+                progress(scanned, stats.total)
+            candidate_id = _unique_candidate_id(Path(fpath).name, candidate_id_registry)
+            if step != SCORE:
+                stats.not_retrieved += 1
+                if step == HOLD and filtered_out is not None:
+                    filtered_out.append((fpath, candidate_id))
+                continue
+            rec = next(scored)
+            if profile is not None:
+                rec, timings = rec
+                profile.add_cv(Path(fpath).name, timings)
+            if rec is None:
+                stats.rejected += 1
+                continue
+            if rec == FILTERED_OUT:
+                stats.filtered_out += 1
+                if filtered_out is not None:
+                    filtered_out.append((fpath, candidate_id))
+                continue
+            stats.qualified += 1
+            if rec["salary_known"]:
+                stats.salary_known += 1
+            else:
+                stats.salary_unknown += 1
+            yield {"candidate_id": candidate_id, **rec}
+    finally:
+        # Stops object prefetching when the scan is aborted
+        fetched.close()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-    known = [r for r in results if r["salary_known"]]
-    unknown = [r for r in results if not r["salary_known"]]
 
+def scan_pool(
+    cv_dir: str,
+    skills_yaml: str,
+    job_file: str,
+    salaries_csv: Optional[str],
+    min_fit_score: float,
+    top_n: int,
+    prepared_job: Optional[PreparedJob] = None,
+    workers: Optional[int] = 1,
+    progress: Optional[Callable[[int, int], None]] = None,
+    filters: Optional[CandidateFilter] = None,
+    fallback: bool = True,
+    profile: bool = False,
+    profile_top: int = 10,
+    retrieval: Optional[Retrieval] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Dict[str, Any]:
+    """
+    Scores every CV in cv_dir against job_file and returns the top_n candidates
+    (salary known / unknown lists).
+    workers > 1 spreads the per-CV stage over a process pool (0 = one per CPU);
+    results, ranks and candidate ids are identical to the serial run.
+    Memory stays O(top_n): records stream from iter_pool into bounded heaps.
+    filters (experience / salary) drop candidates before HR scoring. When none pass and
+    fallback is True, the filtered-out candidates are scored and returned instead
+    (results["fallback"] = True).
+    profile=True adds a "profile" section (per-stage totals, p50/p95/max per CV, the
+    profile_top slowest files) and logs it on the talentscope.profile logger.
+    retrieval (db.retrieval.retrieve_candidates) restricts scoring to the candidates Postgres
+    returned for the job; the output is the same as a full scan, pool["retrieval"] tells
+    how many CVs were not scored.
+    shard=(i, n) scans the i-th of n disjoint parts of the pool (see shard_of) and returns a
+    partial output with a "shard" section; pipeline.merge.merge_scan_outputs combines the n
+    partials into the single-node output.
+    """
+    prof = ScanProfile(slowest_n=profile_top) if profile else None
+    steps = prof.pool_steps if prof is not None else None
+
+    with stage(steps, "prepare_job"):
+        index = load_skill_index(skills_yaml)
+        prepared_job = _resolve_job(index, job_file, prepared_job)
+    filters = filters if filters is not None and filters.active else None
+
+    stats = ScanStats()
+    filtered_out: List[Tuple[str, str]] = []
     # Sort primarily by HR Score
-    known.sort(key=lambda x: (-x["hr_score"], -x["job_fit_score"], *_salary_mid_sort_key(x)))
-    unknown.sort(key=lambda x: (-x["hr_score"], -x["job_fit_score"]))
+    known = TopN(top_n, _known_sort_key)
+    unknown = TopN(top_n, _unknown_sort_key)
+
+    for rec in iter_pool(
+        cv_dir=cv_dir,
+        skills_yaml=skills_yaml,
+        job_file=job_file,
+        salaries_csv=salaries_csv,
+        min_fit_score=min_fit_score,
+        prepared_job=prepared_job,
+        workers=workers,
+        stats=stats,
+        progress=progress,
+        filters=filters,
+        filtered_out=filtered_out,
+        profile=prof,
+        retrieval=retrieval,
+        shard=shard,
+    ):
+        (known if rec["salary_known"] else unknown).push(rec)
+
+    used_fallback = False
+    if filters is not None and fallback and stats.qualified == 0 and filtered_out:
+        # Nobody passed the filters: HR-score the candidates they dropped (features are
+        # already in the feature store, so this is the job-dependent stage only).
+        used_fallback = True
+        with stage(steps, "fallback"):
+            ctx = _ScanContext(index, prepared_job, load_salary_map_csv(salaries_csv), min_fit_score, job_file)
+            items = open_pool_source(cv_dir).fetch([fpath for fpath, _ in filtered_out])
+            for (_, candidate_id), item in zip(filtered_out, items):
+                rec = _score_cv(item, ctx)
+                if rec is not None:
+                    (known if rec["salary_known"] else unknown).push({"candidate_id": candidate_id, **rec})
+
+    with stage(steps, "rank_output"):
+        output = _scan_output(cv_dir, job_file, index, prepared_job, min_fit_score, stats, known, unknown)
+    if filters is not None:
+        output["job"]["filters"] = filters.to_dict()
+        output["pool"]["filtered_out_cvs"] = stats.filtered_out
+        output["results"]["fallback"] = used_fallback
+    if retrieval is not None:
+        output["pool"]["retrieval"] = {**retrieval.summary(), "not_scored_cvs": stats.not_retrieved}
+    if shard is not None:
+        output["shard"] = _shard_section(shard, top_n)
+    if prof is not None:
+        prof.finish()
+        output["profile"] = prof.summary()
+        prof.log(output["profile"], job_file=Path(job_file).name, cvs=stats.total, workers=_resolve_workers(workers))
+    return output
+
+
+def _shard_section(shard: Tuple[int, int], top_n: int) -> Dict[str, int]:
+    # Partial output of a sharded scan; ranks and fallback are only final after the merge
+    return {"index": shard[0], "count": shard[1], "top_n": top_n}
+
+
+def _job_header(job_file: str, index: SkillIndex, prepared_job: PreparedJob, min_fit_score: float) -> Dict[str, Any]:
+    return {
+        "job_file": Path(job_file).name,
+        "domains_detected": [{"domain": d, "label": index.label(d)} for d in prepared_job.domains],
+        "minimum_threshold_job_fit_score": min_fit_score,
+    }
+
+
+def ndjson_line(record: Dict[str, Any]) -> str:
+    # Compact, one record per line (no indent: a 1000-candidate stream stays line-oriented)
+    return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
 
-    known_top = known[:top_n]
-    unknown_top = unknown[:top_n]
+def scan_pool_records(
+    cv_dir: str,
+    skills_yaml: str,
+    job_file: str,
+    salaries_csv: Optional[str],
+    min_fit_score: float,
+    top_n: int,
+    prepared_job: Optional[PreparedJob] = None,
+    filters: Optional[CandidateFilter] = None,
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """
+    scan_pool as a stream of flat records (one NDJSON line each):
+    - {"type": "job", ...}: engine, timestamp and the "job" section, yielded before the pool is scanned,
+    - {"type": "candidate", "list": "salary_known" | "salary_unknown", ...}: one per ranked
+      candidate, salary-known list first, each in rank order,
+    - {"type": "summary", "pool": ..., "results": ...}: pool counters (and fallback flag, profile).
+    Same content as scan_pool's output; extra keyword arguments go to scan_pool.
+    """
+    index = load_skill_index(skills_yaml)
+    prepared_job = _resolve_job(index, job_file, prepared_job)
+    job = _job_header(job_file, index, prepared_job, min_fit_score)
+    if filters is not None and filters.active:
+        job["filters"] = filters.to_dict()
+    yield {"type": "job", "engine": "TalentScope", "timestamp": datetime.utcnow().isoformat(), "job": job}
+
+    output = scan_pool(
+        cv_dir=cv_dir,
+        skills_yaml=skills_yaml,
+        job_file=job_file,
+        salaries_csv=salaries_csv,
+        min_fit_score=min_fit_score,
+        top_n=top_n,
+        prepared_job=prepared_job,
+        filters=filters,
+        **kwargs,
+    )
+    results = output["results"]
+    for key, name in (("salary_known_topN", "salary_known"), ("salary_unknown_topN", "salary_unknown")):
+        # Hand records out one by one and drop them, so nothing is held twice
+        items = results.pop(key)
+        items.reverse()
+        while items:
+            yield {"type": "candidate", "list": name, **items.pop()}
+
+    summary = {"type": "summary", "pool": output["pool"], "results": results}
+    if "profile" in output:
+        summary["profile"] = output["profile"]
+    yield summary
+
+
+def _scan_output(
+    cv_dir: str,
+    job_file: str,
+    index: SkillIndex,
+    prepared_job: PreparedJob,
+    min_fit_score: float,
+    stats: ScanStats,
+    known: TopN,
+    unknown: TopN,
+) -> Dict[str, Any]:
+    known_top = known.items()
+    unknown_top = unknown.items()
 
     for i, item in enumerate(known_top, start=1):
         item["rank"] = i
@@ -191,21 +651,140 @@ def scan_pool(
     return {
         "engine": "TalentScope",
         "timestamp": datetime.utcnow().isoformat(),
-        "job": {
-            "job_file": Path(job_file).name,
-            "domains_detected": [{"domain": d, "label": cfg["domains"][d].get("label", d)} for d in job_domains],
-            "minimum_threshold_job_fit_score": min_fit_score,
-        },
+        "job": _job_header(job_file, index, prepared_job, min_fit_score),
         "pool": {
-            "cv_dir": str(Path(cv_dir).resolve()),
-            "total_cvs_scanned": len(files),
-            "qualified_cvs": len(results),
-            "qualified_salary_known": len(known),
-            "qualified_salary_unknown": len(unknown),
-            "rejected_cvs": rejected,
+            "cv_dir": describe_pool(cv_dir),
+            "total_cvs_scanned": stats.total,
+            "qualified_cvs": stats.qualified,
+            "qualified_salary_known": stats.salary_known,
+            "qualified_salary_unknown": stats.salary_unknown,
+            "rejected_cvs": stats.rejected,
         },
         "results": {
             "salary_known_topN": known_top,
             "salary_unknown_topN": unknown_top,
         },
     }
+
+
+# Per-process taxonomy for scan_pool_many's feature-loading workers.
+_WORKER_INDEX: Optional[SkillIndex] = None
+
+
+def _init_features_worker(skills_yaml: str) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = load_skill_index(skills_yaml)
+
+
+def _load_features_in_worker(fpath: FileSource) -> Optional[CandidateFeatures]:
+    try:
+        return load_candidate_features(fpath, _WORKER_INDEX)
+    except Exception:
+        return None
+
+
+def scan_pool_many(
+    cv_dir: str,
+    skills_yaml: str,
+    jobs: List[str],
+    salaries_csv: Optional[str],
+    min_fit_score: float,
+    top_n: int,
+    workers: Optional[int] = 1,
+    chunk_size: int = 2048,
+    shard: Optional[Tuple[int, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Matches one CV pool against many jobs in a single pass over the pool.
+    Each CV is loaded once; match weights and job_fit_score for every (job, CV) pair are
+    computed with matrix products over the SkillItem vocabulary, and only pairs that clear
+    min_fit_score go through the per-candidate HR stage.
+    Returns one scan_pool-shaped output per job, in the order of jobs.
+    shard=(i, n) works as in scan_pool (one partial output per job).
+    """
+    from talentscope.core.batch import JobBatch, SkillVocabulary
+
+    index = load_skill_index(skills_yaml)
+    prepared_jobs = [_resolve_job(index, jf, None) for jf in jobs]
+    salary_map = load_salary_map_csv(salaries_csv)
+
+    vocab = SkillVocabulary(index)
+    batch = JobBatch(vocab, prepared_jobs)
+    contexts = [_ScanContext(index, pj, salary_map, min_fit_score, jf) for pj, jf in zip(prepared_jobs, jobs)]
+
+    source = open_pool_source(cv_dir)
+    files = source.list_files()
+    if shard is not None:
+        files = [f for f in files if shard_of(Path(f).name, shard[1]) == shard[0]]
+    if source.buffered:
+        chunk_size = min(chunk_size, source.prefetch)
+    all_stats = [ScanStats() for _ in jobs]
+    for st in all_stats:
+        st.total = len(files)
+    known = [TopN(top_n, _known_sort_key) for _ in jobs]
+    unknown = [TopN(top_n, _unknown_sort_key) for _ in jobs]
+
+    candidate_id_registry: Dict[str, int] = defaultdict(int)
+
+    workers = min(_resolve_workers(workers), max(1, len(files)))
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_features_worker,
+            initargs=(skills_yaml,),
+        )
+
+    fetched = source.fetch(files)
+    try:
+        for part in _iter_windows(fetched, max(1, chunk_size)):
+            if executor is not None:
+                feats = list(executor.map(_load_features_in_worker, part, chunksize=max(1, len(part) // (workers * 4))))
+            else:
+                feats = []
+                for fpath in part:
+                    try:
+                        feats.append(load_candidate_features(fpath, index))
+                    except Exception:
+                        feats.append(None)
+
+            rows = [vocab.sparse_row(f.resume_hits) if f is not None else ([], []) for f in feats]
+            scores = batch.score(rows)
+            fit = scores["job_fit_score"]
+
+            for i, (fpath, f) in enumerate(zip(part, feats)):
+                fname = source_name(fpath)
+                candidate_id = _unique_candidate_id(fname, candidate_id_registry)
+                for j, ctx in enumerate(contexts):
+                    st = all_stats[j]
+                    # The matrix score is only a pre-filter (margin covers rounding differences);
+                    # the exact scalar computation in _score_features has the final word.
+                    if f is None or fit[i, j] < min_fit_score - 0.02:
+                        st.rejected += 1
+                        continue
+                    rec = _score_features(fname, f, ctx)
+                    if rec is None:
+                        st.rejected += 1
+                        continue
+                    st.qualified += 1
+                    rec = {"candidate_id": candidate_id, **rec}
+                    if rec["salary_known"]:
+                        st.salary_known += 1
+                        known[j].push(rec)
+                    else:
+                        st.salary_unknown += 1
+                        unknown[j].push(rec)
+    finally:
+        fetched.close()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    outputs = [
+        _scan_output(cv_dir, jf, index, pj, min_fit_score, st, kn, un)
+        for jf, pj, st, kn, un in zip(jobs, prepared_jobs, all_stats, known, unknown)
+    ]
+    if shard is not None:
+        for output in outputs:
+            output["shard"] = _shard_section(shard, top_n)
+    return outputs
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Top-level, picklable units of CPU-heavy work.
+# The API hands these to the process pool (talentscope.executors), so they only take
+# and return plain data (paths, dicts) and never touch API globals.
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from talentscope.core.scoring import PreparedJob
+from talentscope.core.skill_index import load_skill_index
+
+
+def parse_job_file(job_path: str, filename: str) -> Dict[str, Any]:
+    from talentscope.core.job_parser import JobParser
+    from talentscope.io.extractors import extract_file_content_cached
+
+    raw_text = extract_file_content_cached(job_path)
+    return JobParser(raw_text, filename=filename).parse()
+
+
+def parse_cv_file(cv_path: str, skills_yaml: str) -> Dict[str, Any]:
+    """
+    CVParser output enriched with the skills found by the taxonomy scan and the
+    estimated experience. Also fills the candidate feature store.
+    """
+    from talentscope.db.feature_store import load_candidate_features
+
+    index = load_skill_index(skills_yaml)
+    features = load_candidate_features(cv_path, index)
+
+    parsed_data = features.parsed_data
+    found_skills = set()
+    for hits in features.resume_hits.values():
+        for h in hits.hits:
+            found_skills.add(h.canonical)
+    parsed_data["skills"] = sorted(found_skills)
+    parsed_data["estimated_experience"] = features.experience_years
+    return parsed_data
+
+
+def run_scan(
+    cv_dir: str,
+    skills_yaml: str,
+    job_file: str,
+    salaries_csv: Optional[str],
+    min_fit_score: float,
+    top_n: int,
+    prepared_job_data: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = 1,
+    filters: Optional[Dict[str, Any]] = None,
+    profile: bool = False,
+    retrieval: Optional[Any] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    # retrieval: db.retrieval.Retrieval computed by the caller (picklable), None = full scan
+    # progress: picklable scan_pool progress callback, e.g. ScanProgress
+    from talentscope.pipeline.filters import CandidateFilter
+    from talentscope.pipeline.pipeline import scan_pool
+
+    prepared_job = None
+    if prepared_job_data is not None:
+        try:
+            prepared_job = PreparedJob.from_dict(prepared_job_data, load_skill_index(skills_yaml))
+        except ValueError:
+            prepared_job = None # skills.yaml changed in between, scan_pool rebuilds it
+
+    return scan_pool(
+        cv_dir=cv_dir,
+        skills_yaml=skills_yaml,
+        job_file=job_file,
+        salaries_csv=salaries_csv,
+        min_fit_score=min_fit_score,
+        top_n=top_n,
+        prepared_job=prepared_job,
+        workers=workers,
+        filters=CandidateFilter(**filters) if filters else None,
+        profile=profile,
+        retrieval=retrieval,
+        progress=progress,
+    )
+
+
+class ScanProgress:
+    """
+    scan_pool progress callback for scans run in a pool worker (queued matches).
+    (scanned, total) is written to an executors.shared_dict() the queue thread polls; a
+    "cancel" flag set there stops the scan at its next report. One round trip per interval
+    seconds at most.
+    """
+
+    def __init__(self, state, interval: float = 0.25):
+        self.state = state
+        self.interval = interval
+        self._last = 0.0
+
+    def __call__(self, scanned: int, total: int) -> None:
+        now = time.monotonic()
+        if 0 < scanned < total and now - self._last < self.interval:
+            return
+        self._last = now
+        self.state.update(scanned=scanned, total=total)
+        if self.state.get("cancel"):
+            from talentscope.match_queue import MatchCancelled
+            raise MatchCancelled()
+
+
+def parse_cv_file_safe(cv_path: str, skills_yaml: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    # Batch variant: one bad file must not fail the whole map()
+    try:
+        return parse_cv_file(cv_path, skills_yaml), None
+    except Exception as e:
+        return None, str(e)
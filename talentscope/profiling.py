@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import heapq
+import json
+import logging
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("talentscope.profile")
+
+# Per-CV stages in pipeline order (anything else recorded is appended after these).
+CV_STAGES = (
+    "hash",
+    "feature_store",
+    "extract",
+    "norm",
+    "score_domains",
+    "estimate_experience",
+    "cv_parser",
+    "compute_job_match",
+    "hr_score",
+)
+
+
+@contextmanager
+def stage(timings: Optional[Dict[str, float]], name: str) -> Iterator[None]:
+    """Adds the elapsed time of the block to timings[name]; no-op when timings is None."""
+    if timings is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + (time.perf_counter() - t0)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    # Nearest-rank percentile
+    if not sorted_values:
+        return 0.0
+    k = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
+
+
+class ScanProfile:
+    """
+    Timing profile of one scan_pool run.
+    Per-CV stage times come from the workers (so totals are summed over processes,
+    not wall time); pool-level steps (job preparation, listing, ...) are recorded once.
+    """
+
+    def __init__(self, slowest_n: int = 10):
+        self.slowest_n = slowest_n
+        self.started = time.perf_counter()
+        self.wall_seconds: Optional[float] = None
+        self.pool_steps: Dict[str, float] = {}
+        self.cv_stages: Dict[str, List[float]] = {}
+        self.cv_count = 0
+        self._slowest: List[Tuple[float, int, str, Dict[str, float]]] = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        with stage(self.pool_steps, name):
+            yield
+
+    def add_cv(self, file_name: str, timings: Dict[str, float]) -> None:
+        self.cv_count += 1
+        for name, seconds in timings.items():
+            self.cv_stages.setdefault(name, []).append(seconds)
+
+        total = sum(timings.values())
+        entry = (total, -self.cv_count, file_name, timings)
+        if len(self._slowest) < self.slowest_n:
+            heapq.heappush(self._slowest, entry)
+        elif self.slowest_n > 0 and entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def finish(self) -> None:
+        self.wall_seconds = time.perf_counter() - self.started
+
+    def summary(self) -> Dict[str, Any]:
+        if self.wall_seconds is None:
+            self.finish()
+
+        order = [s for s in CV_STAGES if s in self.cv_stages]
+        order += sorted(s for s in self.cv_stages if s not in CV_STAGES)
+
+        stages = {}
+        for name in order:
+            values = sorted(self.cv_stages[name])
+            stages[name] = {
+                "calls": len(values),
+                "total_ms": _ms(sum(values)),
+                "p50_ms": _ms(percentile(values, 50)),
+                "p95_ms": _ms(percentile(values, 95)),
+                "max_ms": _ms(values[-1]),
+            }
+
+        slowest = sorted(self._slowest, reverse=True)
+        return {
+            "wall_ms": _ms(self.wall_seconds),
+            "cvs_profiled": self.cv_count,
+            "pool_steps_ms": {k: _ms(v) for k, v in self.pool_steps.items()},
+            "stages": stages,
+            "slowest_files": [
+                {
+                    "file": fname,
+                    "total_ms": _ms(total),
+                    "stages_ms": {k: _ms(v) for k, v in timings.items()},
+                }
+                for (total, _, fname, timings) in slowest
+            ],
+        }
+
+    def log(self, summary: Optional[Dict[str, Any]] = None, **context: Any) -> None:
+        # One JSON line per scan, easy to grep / ship to a log pipeline.
+        data = {"event": "scan_profile", **context, **(summary or self.summary())}
+        logger.info(json.dumps(data, ensure_ascii=False, default=str))
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Caches and manifests go to a throwaway directory, never into talentscope/data.
+# Set before talentscope.config is imported (it reads the environment once).
+_CACHE_ROOT = tempfile.mkdtemp(prefix="talentscope-tests-")
+os.environ.setdefault("EXTRACT_CACHE_DIR", os.path.join(_CACHE_ROOT, "extract"))
+os.environ.setdefault("FEATURE_STORE_PATH", os.path.join(_CACHE_ROOT, "features.sqlite"))
+os.environ.setdefault("FILE_INDEX_PATH", os.path.join(_CACHE_ROOT, "file_index.sqlite"))
+os.environ.setdefault("MATCH_DB_RETRIEVAL", "False")
+
+SKILLS_YAML = str(Path(__file__).resolve().parents[1] / "talentscope" / "skills" / "skills.yaml")
+
+
+@pytest.fixture(scope="session")
+def skills_yaml() -> str:
+    return SKILLS_YAML
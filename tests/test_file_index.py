@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from talentscope.db.file_index import FileIndex, InvalidCursor
+
+
+def _walk(index, directory, limit, **kw):
+    names, cursor, pages = [], None, 0
+    while True:
+        items, cursor = index.page(directory, ".json", limit=limit, cursor=cursor, **kw)
+        names += [i["filename"] for i in items]
+        pages += 1
+        if cursor is None:
+            return names, pages
+
+
+@pytest.fixture
+def listing(tmp_path):
+    d = tmp_path / "results"
+    d.mkdir()
+    for i in range(11):
+        (d / f"r{i:02d}.json").write_text("{}")
+    (d / "skip.txt").write_text("")
+    (d / ".gitkeep").write_text("")
+    return FileIndex(str(tmp_path / "index.sqlite")), d
+
+
+@pytest.mark.parametrize("sort", ["created_at", "filename"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_cursor_pages_cover_listing_once(listing, sort, order):
+    index, d = listing
+    files = [p for p in d.iterdir() if p.suffix == ".json"]
+    if sort == "created_at":
+        key = lambda p: (p.stat().st_ctime, p.name)
+    else:
+        key = lambda p: p.name
+    expected = [p.name for p in sorted(files, key=key, reverse=order == "desc")]
+
+    names, pages = _walk(index, d, 4, sort=sort, order=order)
+    assert names == expected
+    assert pages == 3
+    assert _walk(index, d, None, sort=sort, order=order) == (expected, 1)
+
+
+def test_bad_cursor(listing):
+    index, d = listing
+    _, cursor = index.page(d, ".json", limit=2, sort="filename")
+    with pytest.raises(InvalidCursor):
+        index.page(d, ".json", limit=2, cursor=cursor, sort="created_at")
+    with pytest.raises(InvalidCursor):
+        index.page(d, ".json", limit=2, cursor="not base64 json", sort="filename")
+
+
+def test_out_of_band_changes_are_picked_up(listing):
+    index, d = listing
+    assert len(index.page(d, ".json")[0]) == 11
+
+    (d / "r00.json").unlink()
+    (d / "new.json").write_text("{}")
+    # Make sure the directory mtime moves even on coarse-grained filesystems
+    st = os.stat(d)
+    os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    names = [i["filename"] for i in index.page(d, ".json", sort="filename", order="asc")[0]]
+    assert "r00.json" not in names
+    assert names[0] == "new.json"
+    assert len(names) == 11
+
+    # A second FileIndex on the same manifest (another worker) sees the same rows
+    other = FileIndex(index.path)
+    assert [i["filename"] for i in other.page(d, ".json", sort="filename", order="asc")[0]] == names
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import io
+import zipfile
+
+import pytest
+
+from talentscope.config import IngestConfig
+from talentscope.ingest import IngestLimitError, stage_sources
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+def test_too_many_files_rejects_whole_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(IngestConfig, "MAX_FILES", 3)
+    (tmp_path / "a.docx").write_bytes(b"original")
+    sources = [
+        ("a.docx", io.BytesIO(b"replacement")),
+        ("more.zip", _zip({"b.docx": b"b", "c.pdf": b"c", "d.docx": b"d"})),
+    ]
+    with pytest.raises(IngestLimitError):
+        stage_sources(sources, tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.docx"]
+    assert (tmp_path / "a.docx").read_bytes() == b"original"
+
+
+def test_uncompressed_size_is_a_batch_total(tmp_path, monkeypatch):
+    monkeypatch.setattr(IngestConfig, "MAX_UNCOMPRESSED_MB", 1)
+    half = b"x" * (600 * 1024) # compresses to almost nothing
+    sources = [("one.zip", _zip({"a.docx": half})), ("two.zip", _zip({"b.docx": half}))]
+    with pytest.raises(IngestLimitError):
+        stage_sources(sources, tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+    # Each archive alone is within the limit
+    items = stage_sources([("one.zip", _zip({"a.docx": half}))], tmp_path)
+    assert [i.filename for i in items if i.stored] == ["a.docx"]
+
+
+def test_batch_within_limits_is_staged(tmp_path, monkeypatch):
+    monkeypatch.setattr(IngestConfig, "MAX_FILES", 3)
+    src = tmp_path / "in"
+    src.mkdir()
+    (src / "c.pdf").write_bytes(b"%PDF")
+    out = tmp_path / "cvs"
+    out.mkdir()
+    items = stage_sources([("a.docx", io.BytesIO(b"a")), ("z.zip", _zip({"b.docx": b"b"})), src / "c.pdf"], out)
+    assert sorted(i.filename for i in items if i.stored) == ["a.docx", "b.docx", "c.pdf"]
+    assert (out / "b.docx").read_bytes() == b"b"
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import os
+
+from talentscope.match_cache import MatchCacheKey, MatchResultCache, PoolVersion
+
+
+def _key(job, pool):
+    return MatchCacheKey(job_sha256=job, pool_version=pool, taxonomy_key="t", filters=(), salaries_version="s")
+
+
+def test_repool_carries_unaffected_entries_and_drops_the_rest():
+    cache = MatchResultCache(max_entries=10, ttl_seconds=60)
+    cache.put(_key("keep", "v1"), {"job": "keep"}, {"affected": False})
+    cache.put(_key("drop", "v1"), {"job": "drop"}, {"affected": True})
+    cache.put(_key("boom", "v1"), {"job": "boom"}, {})
+    cache.put(_key("older", "v0"), {"job": "older"}, {"affected": False})
+
+    cache.repool("v1", "v2", lambda meta: not meta["affected"]) # {} raises KeyError -> dropped
+
+    assert cache.get(_key("keep", "v2")) == {"job": "keep"}
+    assert cache.get(_key("keep", "v1")) is None
+    for job in ("drop", "boom", "older"):
+        assert cache.get(_key(job, "v1")) is None
+        assert cache.get(_key(job, "v2")) is None
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["carried_over"] == 1
+    assert stats["invalidations"] == 3
+
+
+def test_repool_to_same_version_keeps_entries():
+    cache = MatchResultCache(max_entries=10, ttl_seconds=60)
+    cache.put(_key("a", "v1"), {"job": "a"})
+    cache.repool("v1", "v1", lambda meta: False)
+    assert cache.get(_key("a", "v1")) == {"job": "a"}
+
+
+def test_pool_version_sees_out_of_band_changes(tmp_path):
+    cv = tmp_path / "a.docx"
+    cv.write_bytes(b"first")
+    pool = PoolVersion(str(tmp_path))
+    v1 = pool.current()
+    assert pool.current() == v1
+
+    cv.write_bytes(b"edited") # same name, in place
+    os.utime(cv, ns=(1, 1))
+    v2 = pool.current()
+    assert v2 != v1
+
+    (tmp_path / "notes.md").write_text("not a CV")
+    assert pool.current() == v2
+    (tmp_path / "b.pdf").write_bytes(b"%PDF")
+    v3 = pool.current()
+    assert v3 != v2
+    assert pool.bump() != v3
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from talentscope.match_queue import MatchQueue, MatchQueueFull
+
+
+def _wait_state(queue, run_id, states, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        run = queue.get(run_id)
+        if run.state in states:
+            return run
+        time.sleep(0.01)
+    raise AssertionError(f"run {run_id} stayed {queue.get(run_id).state}")
+
+
+@pytest.fixture
+def queue():
+    q = MatchQueue(workers=1, max_depth=1, keep_finished=10)
+    yield q
+    q.shutdown()
+
+
+def _blocking(gate, started=None):
+    def fn(run):
+        if started is not None:
+            started.set()
+        gate.wait(5)
+        return {"ok": run.run_id}
+    return fn
+
+
+def test_same_key_shares_one_run(queue):
+    gate, started = threading.Event(), threading.Event()
+    running = queue.submit("a", _blocking(gate, started))
+    assert started.wait(5)
+    queued = queue.submit("b", _blocking(gate))
+
+    assert queue.submit("a", _blocking(gate)) is running
+    assert queue.submit("b", _blocking(gate)) is queued
+    gate.set()
+    assert _wait_state(queue, running.run_id, {"done"}).result == {"ok": running.run_id}
+    assert _wait_state(queue, queued.run_id, {"done"}).result == {"ok": queued.run_id}
+
+    # Finished runs no longer absorb new submissions
+    assert queue.submit("a", _blocking(gate)).run_id != running.run_id
+
+
+def test_full_queue_raises(queue):
+    gate, started = threading.Event(), threading.Event()
+    queue.submit("a", _blocking(gate, started))
+    assert started.wait(5)
+    queue.submit("b", _blocking(gate))
+    with pytest.raises(MatchQueueFull):
+        queue.submit("c", _blocking(gate))
+    gate.set()
+
+
+def test_cancel_queued_and_running(queue):
+    started = threading.Event()
+    progressed = []
+
+    def scan(run):
+        started.set()
+        for i in range(500):
+            run.progress(i, 500) # raises MatchCancelled once cancel() was called
+            progressed.append(i)
+            time.sleep(0.01)
+        return {}
+
+    running = queue.submit("a", scan)
+    assert started.wait(5)
+    queued = queue.submit("b", _blocking(threading.Event()))
+
+    assert queue.cancel(queued.run_id).state == "cancelled"
+    queue.cancel(running.run_id)
+    run = _wait_state(queue, running.run_id, {"cancelled", "done", "failed"})
+    assert run.state == "cancelled"
+    assert len(progressed) < 500
+    assert queue.cancel("no-such-run") is None
+
+
+def test_api_answers_429_when_the_queue_is_full(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    import talentscope.api as api
+
+    (tmp_path / "job.txt").write_text("Python developer", encoding="utf-8")
+    monkeypatch.setattr(api, "JOBS_DIR", tmp_path)
+
+    class FullQueue:
+        def submit(self, key, fn):
+            raise MatchQueueFull("Match queue is full (1 runs waiting).")
+
+    monkeypatch.setattr(api, "match_queue", FullQueue())
+    r = TestClient(api.app).post("/jobs/match", json={"job_filename": "job.txt", "run_async": True})
+    assert r.status_code == 429
+    assert "full" in r.json()["detail"]
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from talentscope.bench.synth import sample_texts
+from talentscope.core.matcher import SkillMatcher, compile_patterns, score_text
+from talentscope.core.normalize import norm
+from talentscope.core.skill_index import load_skill_index
+from talentscope.skills.skills_loader import SkillItem
+
+
+def _item(canonical, variants, kind, domain="dev", weight=3):
+    return SkillItem(
+        canonical=canonical,
+        variants_norm=variants,
+        weight=weight,
+        kind=kind,
+        domain_key=domain,
+        domain_label=domain.upper(),
+    )
+
+
+def _regex_scan(text_norm, items):
+    # The per-item regex implementation SkillMatcher replaced
+    return score_text(text_norm, items, compile_patterns(items))
+
+
+@pytest.fixture(scope="module")
+def index(skills_yaml):
+    return load_skill_index(skills_yaml)
+
+
+@pytest.fixture(scope="module")
+def texts(skills_yaml):
+    sample = sample_texts(skills_yaml, n_cvs=60, n_jobs=15, seed=7, tr_ratio=0.5)
+    extra = [
+        "Machine learning engineer; learning Python and machine-learning pipelines.",
+        "C++ / C# / .NET developer, Node.js, CI/CD, REST APIs",
+        "İstanbul'da Java geliştirici, SQL ve ŞİRKET içi eğitimler",
+        "",
+    ]
+    return [norm(t) for t in sample["cvs"] + sample["jobs"] + extra]
+
+
+def test_skill_matcher_matches_regex_score_text(index, texts):
+    for text in texts:
+        found = index.matcher.scan(text)
+        for dk, dom in index.domains.items():
+            score, matched = _regex_scan(text, list(dom.items))
+            assert (found[dk].score, found[dk].matched_list()) == (score, matched), (dk, text[:80])
+
+
+def test_token_inside_phrase_span_does_not_count():
+    items = [
+        _item("machine learning", ["machine learning"], "phrase", weight=5),
+        _item("learning", ["learning"], "token", weight=1),
+    ]
+    matcher = SkillMatcher(items)
+
+    only_phrase = norm("Machine learning projects")
+    hits = matcher.scan(only_phrase)["dev"]
+    assert hits.matched_list() == [("machine learning", 5, "DEV")]
+    assert hits.matched_list() == _regex_scan(only_phrase, items)[1]
+
+    both = norm("Machine learning projects, continuous learning")
+    hits = matcher.scan(both)["dev"]
+    assert [h.canonical for h in hits.hits] == ["machine learning", "learning"]
+    assert hits.score == _regex_scan(both, items)[0] == 6
+
+
+def test_word_boundaries_and_positions():
+    items = [_item("java", ["java"], "token")]
+    matcher = SkillMatcher(items)
+
+    assert matcher.scan(norm("javascript only"))["dev"].hits == ()
+    text = norm("java and java")
+    hit = matcher.scan(text)["dev"].hits[0]
+    assert [text[s:e] for s, e in hit.positions] == ["java", "java"]
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from talentscope.bench.synth import generate_pool
+from talentscope.pipeline import merge_scan_outputs
+from talentscope.pipeline.filters import CandidateFilter
+from talentscope.pipeline.pipeline import scan_pool
+
+SHARDS = 6
+
+
+@pytest.fixture(scope="module")
+def pool(tmp_path_factory, skills_yaml):
+    out = tmp_path_factory.mktemp("pool")
+    return generate_pool(str(out), size=40, skills_yaml=skills_yaml, n_jobs=2, seed=3, pdf_ratio=0.0)
+
+
+def _scan(pool, skills_yaml, filters=None, shard=None):
+    return scan_pool(
+        cv_dir=pool.cv_dir,
+        skills_yaml=skills_yaml,
+        job_file=pool.jobs[0],
+        salaries_csv=pool.salaries_csv,
+        min_fit_score=0.0,
+        top_n=5,
+        filters=filters,
+        shard=shard,
+    )
+
+
+def _comparable(output):
+    return {k: v for k, v in output.items() if k not in ("timestamp", "shard")}
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        None,
+        CandidateFilter(min_experience=15), # 4 CVs qualify: some shards fall back on their own
+        CandidateFilter(min_experience=99), # no CV qualifies anywhere: fallback
+    ],
+    ids=["unfiltered", "selective", "fallback"],
+)
+def test_merged_shards_equal_single_node_scan(pool, skills_yaml, filters):
+    single = _scan(pool, skills_yaml, filters)
+    partials = [_scan(pool, skills_yaml, filters, shard=(i, SHARDS)) for i in range(SHARDS)]
+    random.Random(1).shuffle(partials)
+
+    merged = merge_scan_outputs(partials)
+    assert _comparable(merged) == _comparable(single)
+    if filters is None:
+        return
+    fell_back = [p["results"]["fallback"] for p in partials]
+    if filters.min_experience == 15:
+        assert any(fell_back) and not all(fell_back)
+        assert merged["results"]["fallback"] is False
+    else:
+        assert all(fell_back)
+        assert merged["results"]["fallback"] is True
+        assert merged["results"]["salary_known_topN"] or merged["results"]["salary_unknown_topN"]
+
+
+def test_incomplete_run_is_rejected(pool, skills_yaml):
+    partials = [_scan(pool, skills_yaml, shard=(i, SHARDS)) for i in range(SHARDS - 1)]
+    with pytest.raises(ValueError):
+        merge_scan_outputs(partials)
+    with pytest.raises(ValueError):
+        merge_scan_outputs([_scan(pool, skills_yaml)])
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import random
+
+from talentscope.pipeline.pipeline import TopN, _known_sort_key, _unknown_sort_key
+
+
+def _records(n, seed):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        mid = rng.choice([None, 50000.0, 75000.0, 90000.0])
+        out.append({
+            "id": i,
+            # Few distinct values, so most records tie with others
+            "hr_score": rng.choice([40, 55, 70]),
+            "job_fit_score": rng.choice([10.0, 25.0, 40.0]),
+            "salary_known": mid is not None,
+            "salary_mid_tl": mid,
+        })
+    return out
+
+
+def _top(records, n, key):
+    top = TopN(n, key)
+    for rec in records:
+        top.push(rec)
+    return [r["id"] for r in top.items()]
+
+
+def test_same_order_as_stable_sort_and_slice():
+    for seed in range(20):
+        records = _records(200, seed)
+        for key in (_unknown_sort_key, _known_sort_key):
+            for n in (1, 7, 50, 200, 500):
+                expected = [r["id"] for r in sorted(records, key=key)[:n]]
+                assert _top(records, n, key) == expected, (seed, key.__name__, n)
+
+
+def test_ties_keep_insertion_order():
+    records = [{"id": i, "hr_score": 50, "job_fit_score": 20.0} for i in range(10)]
+    assert _top(records, 4, _unknown_sort_key) == [0, 1, 2, 3]
+
+
+def test_zero_keeps_nothing():
+    assert _top(_records(10, 0), 0, _unknown_sort_key) == []